@@ -41,6 +41,7 @@ a = Analysis(
         'objc',
         'Foundation',
         'AppKit',
+        'ApplicationServices',
         'Cocoa',
         'Quartz',
         'CoreFoundation',
@@ -1,14 +1,90 @@
 #!/usr/bin/env python3
 """
 Fix Unicode in existing activity data files by re-saving them with proper encoding.
-This script loads JSON files (which automatically converts escape sequences to Unicode)
-and saves them back with ensure_ascii=False.
+This script replaces \\uXXXX escape sequences in the raw JSON bytes with the
+UTF-8 encoded characters they represent, leaving the rest of the file untouched.
 """
 
-import json
+import mmap
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# Buffer size for reading and rewriting activity files
+BUFFER_SIZE = 64 * 1024
+
+# A backslash run followed by uXXXX, optionally followed by a low surrogate
+# escape so UTF-16 surrogate pairs can be combined into one character
+_ESCAPE_RE = re.compile(rb"(\\+)u([0-9a-fA-F]{4})(?:\\u([dD][c-fC-F][0-9a-fA-F]{2}))?")
+
+# Code points that must remain escaped inside JSON strings
+_KEEP_ESCAPED = frozenset(range(0x20)) | {0x22, 0x5C}
+
+# Below this many files the process pool startup cost outweighs the gain
+PARALLEL_THRESHOLD = 64
+
+
+def has_escape_sequences(f) -> bool:
+    """Check the raw bytes of an open binary file for a JSON \\u escape."""
+    if f.seek(0, os.SEEK_END) == 0:
+        # mmap cannot map an empty file
+        return False
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return mm.find(b"\\u") != -1
+
+
+def _decode_escape(match: "re.Match[bytes]") -> bytes:
+    """Replace one \\uXXXX escape (or surrogate pair) with its UTF-8 bytes."""
+    backslashes, code, low = match.groups()
+    if len(backslashes) % 2 == 0:
+        # An escaped backslash followed by a literal "u", not an escape
+        return match.group(0)
+
+    prefix = backslashes[:-1]
+    escaped = b"\\u" + code
+    codepoint = int(code, 16)
+    tail = b""
+    if low is not None:
+        if 0xD800 <= codepoint <= 0xDBFF:
+            codepoint = 0x10000 + ((codepoint - 0xD800) << 10) + int(low, 16) - 0xDC00
+            escaped += b"\\u" + low
+        else:
+            # Stray low surrogate after an unrelated escape stays as-is
+            tail = b"\\u" + low
+
+    if codepoint in _KEEP_ESCAPED or 0xD800 <= codepoint <= 0xDFFF:
+        return prefix + escaped + tail
+    return prefix + chr(codepoint).encode("utf-8") + tail
+
+
+def _fix_one(file_path: str) -> str:
+    """Fix a single activity file and return "fixed", "skipped" or "errors"."""
+    try:
+        # Read, check and rewrite through a single file handle
+        with open(file_path, "r+b", buffering=BUFFER_SIZE) as f:
+            # Files without escape sequences are already valid UTF-8 output
+            if not has_escape_sequences(f):
+                return "skipped"
+
+            f.seek(0)
+            raw = f.read()
+            fixed = _ESCAPE_RE.sub(_decode_escape, raw)
+            if fixed == raw:
+                return "skipped"
+
+            f.seek(0)
+            f.truncate()
+            f.write(fixed)
+
+        print(f"[OK] Fixed Unicode in: {os.path.basename(file_path)}")
+        return "fixed"
+
+    except Exception as e:
+        print(f"[FAIL] Error processing {file_path}: {e}")
+        return "errors"
+
 
 def fix_data_files(data_dir: Path) -> dict:
     """Fix Unicode encoding in all activity data files."""
@@ -16,7 +92,14 @@ def fix_data_files(data_dir: Path) -> dict:
         print(f"Directory does not exist: {data_dir}")
         return {"fixed": 0, "skipped": 0, "errors": 0}
 
-    activity_files = list(data_dir.glob("activity_*.json"))
+    with os.scandir(data_dir) as it:
+        activity_files = sorted(
+            entry.path
+            for entry in it
+            if entry.is_file()
+            and entry.name.startswith("activity_")
+            and entry.name.endswith(".json")
+        )
     if not activity_files:
         print(f"No activity files found in {data_dir}")
         return {"fixed": 0, "skipped": 0, "errors": 0}
@@ -25,28 +108,13 @@ def fix_data_files(data_dir: Path) -> dict:
 
     results = {"fixed": 0, "skipped": 0, "errors": 0}
 
-    for file_path in sorted(activity_files):
-        try:
-            # Read the file (JSON automatically converts escape sequences)
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Write it back with proper Unicode encoding
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-
-            results["fixed"] += 1
-
-            # Check if there were Unicode characters
-            has_unicode = any(
-                "·" in key or "—" in key or "*" in key for key in data.keys()
-            )
-            if has_unicode:
-                print(f"[OK] Fixed Unicode in: {file_path.name}")
-
-        except Exception as e:
-            print(f"[FAIL] Error processing {file_path}: {e}")
-            results["errors"] += 1
+    if len(activity_files) < PARALLEL_THRESHOLD:
+        for outcome in map(_fix_one, activity_files):
+            results[outcome] += 1
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for outcome in executor.map(_fix_one, activity_files, chunksize=16):
+                results[outcome] += 1
 
     return results
 
@@ -65,6 +133,7 @@ def main():
 
     print("\nResults:")
     print(f"  Fixed: {results['fixed']} files")
+    print(f"  Skipped: {results['skipped']} files")
     print(f"  Errors: {results['errors']} files")
 
     if results["fixed"] > 0:
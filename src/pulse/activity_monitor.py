@@ -5,8 +5,8 @@ Orchestrates detection, idle checking, and data recording.
 """
 
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Optional, Tuple
 
 from .detection import (
@@ -26,11 +26,32 @@ class MonitorConfig:
     idle_threshold: int = 300
     debounce_delay: float = 1.0
     max_duration_cap: float = 120.0  # Cap for single activity segments
+    title_cache_size: int = 512  # Max cached (app, window title) activity names
+    title_refresh_interval: float = 10.0  # Title re-check while app unchanged
+    title_backoff_max: float = 60.0  # Longest pause after title lookup failures
 
 
 class ActivityMonitor:
     """Core activity monitoring logic with single responsibility."""
 
+    __slots__ = (
+        "config",
+        "app_detector",
+        "idle_detector",
+        "window_detector",
+        "title_cleaner",
+        "session_tracker",
+        "_title_cache",
+        "last_stable_app",
+        "pending_app",
+        "app_change_time",
+        "_polled_app",
+        "_polled_activity",
+        "_polled_expires",
+        "_title_fail_until",
+        "_title_backoff",
+    )
+
     def __init__(
         self,
         include_window_titles: bool = True,
@@ -57,10 +78,24 @@ class ActivityMonitor:
         self.title_cleaner = TitleCleaner()
         self.session_tracker = SessionTracker()
 
+        # Cleaned activity names keyed by raw (app, window title), LRU-bounded
+        self._title_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
         # State for debouncing
         self.last_stable_app: Optional[str] = None
+        # Candidate app and when it was first seen; must hold for debounce_delay
+        self.pending_app: Optional[str] = None
         self.app_change_time: Optional[float] = None
 
+        # Last result of poll(), reused while the same app stays frontmost
+        self._polled_app: Optional[str] = None
+        self._polled_activity: Optional[str] = None
+        self._polled_expires = 0.0
+
+        # Title lookups are skipped until _title_fail_until after a failure
+        self._title_fail_until = 0.0
+        self._title_backoff = 0.0
+
     @property
     def include_window_titles(self) -> bool:
         return self.config.include_window_titles
@@ -78,40 +113,166 @@ class ActivityMonitor:
         if not self.window_detector:
             return app_name
 
-        window_title = self.window_detector.get_window_title(app_name)
+        window_title = self._lookup_window_title(
+            self.window_detector, app_name, time.monotonic()
+        )
         if window_title:
-            clean_title = self.title_cleaner.clean_title(window_title)
-            full_name = f"{app_name} - {clean_title}"
-            return self.title_cleaner.normalize_app_name(full_name)
+            return self._get_cleaned_activity(app_name, window_title)
 
         return app_name
 
+    def _lookup_window_title(
+        self, window_detector: WindowTitleDetector, app_name: str, now: float
+    ) -> Optional[str]:
+        """
+        Get the window title, backing off exponentially after failures.
+
+        While backing off the title is skipped and None is returned, so a
+        failing title subsystem degrades to app-only tracking instead of
+        stalling the tracking loop.
+        """
+        if now < self._title_fail_until:
+            return None
+
+        try:
+            window_title = window_detector.get_window_title(
+                app_name, self.app_detector.active_pid
+            )
+        except Exception as e:
+            backoff = min(self._title_backoff * 2 or 1.0, self.config.title_backoff_max)
+            self._title_backoff = backoff
+            self._title_fail_until = now + backoff
+            print(
+                f"Warning: Window title lookup failed ({e}); retrying in {backoff:.0f}s"
+            )
+            return None
+
+        self._title_backoff = 0.0
+        return window_title
+
+    def poll(self) -> Optional[str]:
+        """
+        Get the current activity, or None while the system is idle.
+
+        Combines should_record_activity() and get_current_activity() into a
+        single call for the tracking loop, with attribute lookups hoisted.
+        The window title is only looked up again when the frontmost app
+        changes, after title_refresh_interval, or after expire_activity().
+        """
+        if self.idle_detector.is_idle:
+            return None
+
+        app_name = self.app_detector.get_active_application()
+        if not app_name:
+            return None
+
+        window_detector = self.window_detector
+        if window_detector is None:
+            return app_name
+
+        now = time.monotonic()
+        if app_name == self._polled_app and now < self._polled_expires:
+            return self._polled_activity
+
+        activity = app_name
+        window_title = self._lookup_window_title(window_detector, app_name, now)
+        if window_title:
+            activity = self._get_cleaned_activity(app_name, window_title)
+
+        self._polled_app = app_name
+        self._polled_activity = activity
+        self._polled_expires = now + self.config.title_refresh_interval
+        return activity
+
+    def expire_activity(self) -> None:
+        """Make the next poll() look up the window title again."""
+        self._polled_expires = 0.0
+
+    def set_activated_app(self, app) -> None:
+        """
+        Track the NSRunningApplication that just became frontmost.
+
+        Called from activation notifications on the main thread; the app
+        then answers get_active_application() and has its window title kept
+        current from Accessibility notifications. None stops both.
+        """
+        self.app_detector.set_activated_app(app)
+        if self.window_detector is not None:
+            self.window_detector.watch_app(app, self.expire_activity)
+
+    def poll_app(self) -> Optional[str]:
+        """
+        Get the frontmost app name, or None while the system is idle.
+
+        Specialization of poll() for fast mode, where window titles are
+        never looked up.
+        """
+        if self.idle_detector.is_idle:
+            return None
+        return self.app_detector.get_active_application() or None
+
+    def _get_cleaned_activity(self, app_name: str, window_title: str) -> str:
+        """Build the cleaned activity name, reusing cached results."""
+        key = (app_name, window_title)
+        cache = self._title_cache
+        activity = cache.get(key)
+        if activity is not None:
+            cache.move_to_end(key)
+            return activity
+
+        clean_title = self.title_cleaner.clean_title(window_title)
+        activity = self.title_cleaner.normalize_app_name(f"{app_name} - {clean_title}")
+
+        cache[key] = activity
+        if len(cache) > self.config.title_cache_size:
+            cache.popitem(last=False)
+        return activity
+
     def should_record_activity(self) -> bool:
         """Check if system is active and should record activity."""
         return not self.idle_detector.is_idle
 
     def handle_idle_transition(
-        self, current_app: Optional[str], start_time: float
+        self,
+        current_app: Optional[str],
+        start_time: float,
+        now: Optional[float] = None,
     ) -> float:
         """
         Handle idle state transitions and return new start time.
 
         If we transitioned to IDLE, we attempt to record the activity
         that happened *before* the idle threshold was reached.
+        Callers polling in a loop can pass the tick's ``now`` timestamp
+        to avoid an extra clock read.
         """
         # Check if idle state changed
-        idle_state_changed = self.idle_detector.check_idle_state()
+        idle_state_changed, idle_time = self.idle_detector.check_idle_state()
 
         if not idle_state_changed:
             return start_time
 
-        current_time = time.time()
+        return self.apply_idle_transition(current_app, start_time, idle_time, now)
+
+    def apply_idle_transition(
+        self,
+        current_app: Optional[str],
+        start_time: float,
+        idle_time: float,
+        now: Optional[float] = None,
+    ) -> float:
+        """
+        Apply an idle state change reported by check_idle_state().
+
+        For callers that already polled the idle state; idle_time is the
+        value check_idle_state() returned. Returns the new start time.
+        """
+        current_time = time.time() if now is None else now
 
         if self.idle_detector.is_idle:
             # Just became idle.
             # We need to calculate how much valid activity occurred before idleness.
             if current_app:
-                idle_time = self.idle_detector.get_system_idle_time()
                 # Timestamp when idleness actually began
                 idle_start_timestamp = current_time - idle_time
 
@@ -130,16 +291,25 @@ class ActivityMonitor:
             return current_time
 
     def check_app_change(
-        self, current_app: Optional[str], active_app: Optional[str], start_time: float
+        self,
+        current_app: Optional[str],
+        active_app: Optional[str],
+        start_time: float,
+        now: Optional[float] = None,
     ) -> Tuple[Optional[str], float]:
         """
         Handle application change detection with debouncing.
+
+        A switch is only confirmed once the same new app has been seen
+        continuously for debounce_delay; a different candidate restarts the
+        window, so rapid focus jitter between several apps never commits.
         Returns tuple of (current_stable_app, start_time_of_that_app).
         """
-        current_time = time.time()
+        current_time = time.time() if now is None else now
 
         if self.last_stable_app != active_app:
-            if self.app_change_time is None:
+            if self.app_change_time is None or self.pending_app != active_app:
+                self.pending_app = active_app
                 self.app_change_time = current_time
             elif current_time - self.app_change_time >= self.config.debounce_delay:
                 # App switch confirmed (stabilized for debounce_delay)
@@ -151,9 +321,13 @@ class ActivityMonitor:
                         self.session_tracker.add_activity(current_app, duration)
 
                 self.last_stable_app = active_app
+                self.pending_app = None
                 self.app_change_time = None
+                if self.window_detector is not None:
+                    self.window_detector.invalidate()
                 return active_app, current_time
         else:
+            self.pending_app = None
             self.app_change_time = None
 
         return current_app, start_time
@@ -167,17 +341,35 @@ class ActivityMonitor:
         return self.session_tracker.clear_session()
 
 
+def _noop(*args, **kwargs) -> None:
+    """Discard a log call."""
+
+
 class ActivityLogger:
-    """Handles logging and output for activity tracking."""
+    """Handles logging and output for activity tracking.
+
+    Constructing a logger with ``verbose=False`` returns a
+    ``QuietActivityLogger`` whose log methods are no-ops, so quiet mode
+    pays no per-call branch.
+    """
+
+    __slots__ = ("verbose",)
+
+    def __new__(cls, verbose: bool = True):
+        if cls is ActivityLogger and not verbose:
+            cls = QuietActivityLogger
+        return super().__new__(cls)
 
     def __init__(self, verbose: bool = True):
         self.verbose = verbose
 
+    def _now_str(self) -> str:
+        """Format the current local time as HH:MM:SS."""
+        t = time.localtime()
+        return f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+
     def log_tracking_start(self, include_window_titles: bool) -> None:
         """Log tracking start information."""
-        if not self.verbose:
-            return
-
         print("Tracking started - watching for app switches...")
         mode = (
             "detailed mode (app + window titles)"
@@ -192,10 +384,7 @@ class ActivityLogger:
         self, old_app: str, duration: float, new_app: str, detection_time: float
     ) -> None:
         """Log application switch."""
-        if not self.verbose:
-            return
-
-        now_str = datetime.now().strftime("%H:%M:%S")
+        now_str = self._now_str()
         print(f"[{now_str}] Switch: {old_app} ({duration:.1f}s) -> {new_app}")
 
         if detection_time > 100:
@@ -203,18 +392,12 @@ class ActivityLogger:
 
     def log_initial_app(self, app_name: str) -> None:
         """Log initial application detection."""
-        if not self.verbose:
-            return
-
-        now_str = datetime.now().strftime("%H:%M:%S")
+        now_str = self._now_str()
         print(f"[{now_str}] Initial app: {app_name}")
 
     def log_idle_detected(self, idle_time: float) -> None:
         """Log idle state detection."""
-        if not self.verbose:
-            return
-
-        now_str = datetime.now().strftime("%H:%M:%S")
+        now_str = self._now_str()
         print(
             f"[{now_str}] [IDLE] User idle detected "
             f"(no input for {idle_time:.0f}s) - pausing tracking"
@@ -222,10 +405,7 @@ class ActivityLogger:
 
     def log_activity_resumed(self, idle_duration: float) -> None:
         """Log activity resumption."""
-        if not self.verbose:
-            return
-
-        now_str = datetime.now().strftime("%H:%M:%S")
+        now_str = self._now_str()
         print(
             f"[{now_str}] [ACTIVE] User activity resumed "
             f"(was idle for {idle_duration:.0f}s) - resuming tracking"
@@ -233,13 +413,23 @@ class ActivityLogger:
 
     def log_data_save(self, total_time: float) -> None:
         """Log data save operation."""
-        if not self.verbose:
-            return
-
-        now_str = datetime.now().strftime("%H:%M:%S")
+        now_str = self._now_str()
         print(f"[{now_str}] Minute boundary - saving {total_time:.1f}s of data")
 
     def log_tracking_stop(self) -> None:
         """Log tracking stop."""
-        if self.verbose:
-            print("\nTracking stopped")
+        print("\nTracking stopped")
+
+
+class QuietActivityLogger(ActivityLogger):
+    """ActivityLogger specialization for quiet mode."""
+
+    __slots__ = ()
+
+    log_tracking_start = staticmethod(_noop)
+    log_app_switch = staticmethod(_noop)
+    log_initial_app = staticmethod(_noop)
+    log_idle_detected = staticmethod(_noop)
+    log_activity_resumed = staticmethod(_noop)
+    log_data_save = staticmethod(_noop)
+    log_tracking_stop = staticmethod(_noop)
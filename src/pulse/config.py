@@ -1,11 +1,19 @@
 """Configuration management for Pulse."""
 
+import functools
 import json
 import os
+from collections import ChainMap
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, MutableMapping, Optional, cast
 
-DEFAULT_CONFIG = {
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+_DEFAULT_CONFIG: Dict[str, Any] = {
     "idle_threshold": 300,  # 5 minutes
     "fast_mode": False,
     "verbose_logging": True,
@@ -21,10 +29,36 @@ DEFAULT_CONFIG = {
     "privacy_mode": False,
 }
 
+# Read-only view of the defaults; user values are layered on top via ChainMap
+DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType(_DEFAULT_CONFIG)
+
+
+def _with_defaults(overrides: Dict[str, Any]) -> "ChainMap[str, Any]":
+    """Layer configuration values over the shared read-only defaults."""
+    # ChainMap only ever writes to its first map, so the proxy is never mutated
+    defaults = cast(MutableMapping[str, Any], DEFAULT_CONFIG)
+    return ChainMap(overrides, defaults)
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize configuration to indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Deserialize JSON bytes, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class Config:
     """Configuration manager for Pulse."""
 
+    __slots__ = ("config_dir", "config_file", "_config", "_mtime")
+
     def __init__(self, config_dir: Optional[str] = None):
         """Initialize configuration manager.
 
@@ -42,29 +76,54 @@ class Config:
         self.config_file = self.config_dir / "settings.json"
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
+        self._mtime = self._get_file_mtime()
         self._config = self._load_config()
 
-    def _load_config(self) -> Dict[str, Any]:
+    def _get_file_mtime(self) -> int:
+        """Get the config file modification time in ns, or 0 if missing."""
+        try:
+            return self.config_file.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    def maybe_reload(self) -> bool:
+        """Reload configuration if the file changed since it was last read.
+
+        Returns:
+            True if the configuration was reloaded from disk
+        """
+        mtime = self._get_file_mtime()
+        if mtime == self._mtime:
+            return False
+
+        self._mtime = mtime
+        self._config = self._load_config()
+        return True
+
+    def _load_config(self) -> "ChainMap[str, Any]":
         """Load configuration from file or create default."""
         if self.config_file.exists():
             try:
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-                # Merge with defaults to ensure all keys exist
-                merged_config = DEFAULT_CONFIG.copy()
-                merged_config.update(config)
-                return merged_config
+                config = _loads(self.config_file.read_bytes())
+                # Layer over defaults to ensure all keys exist
+                return _with_defaults(config)
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Warning: Could not load config file: {e}")
                 print("Using default configuration.")
 
-        return DEFAULT_CONFIG.copy()
+        return _with_defaults({})
 
     def save(self) -> None:
-        """Save current configuration to file."""
+        """Save current configuration to file.
+
+        The payload is written in one call to a temporary file which then
+        atomically replaces settings.json, so readers never see a partial file.
+        """
+        tmp_file = self.config_file.with_suffix(".json.tmp")
         try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(self._config, f, indent=2, ensure_ascii=False)
+            tmp_file.write_bytes(_dumps(dict(self._config)))
+            os.replace(tmp_file, self.config_file)
+            self._mtime = self._get_file_mtime()
         except IOError as e:
             print(f"Warning: Could not save config file: {e}")
 
@@ -99,7 +158,7 @@ class Config:
 
     def reset_to_defaults(self) -> None:
         """Reset configuration to default values."""
-        self._config = DEFAULT_CONFIG.copy()
+        self._config = _with_defaults({})
 
     def get_all(self) -> Dict[str, Any]:
         """Get all configuration values.
@@ -107,56 +166,77 @@ class Config:
         Returns:
             Complete configuration dictionary
         """
-        return self._config.copy()
+        return dict(self._config)
 
-    # Convenience properties for common settings
+    # Convenience properties for common settings. These keys always resolve
+    # through the defaults layer, so they index the mapping directly.
     @property
     def idle_threshold(self) -> int:
         """Get idle threshold in seconds."""
-        return self.get("idle_threshold", 300)
+        return self._config["idle_threshold"]
 
     @idle_threshold.setter
     def idle_threshold(self, value: int) -> None:
         """Set idle threshold in seconds."""
-        self.set("idle_threshold", value)
+        self._config["idle_threshold"] = value
 
     @property
     def fast_mode(self) -> bool:
         """Get fast mode setting."""
-        return self.get("fast_mode", False)
+        return self._config["fast_mode"]
 
     @fast_mode.setter
     def fast_mode(self, value: bool) -> None:
         """Set fast mode setting."""
-        self.set("fast_mode", value)
+        self._config["fast_mode"] = value
 
     @property
     def verbose_logging(self) -> bool:
         """Get verbose logging setting."""
-        return self.get("verbose_logging", True)
+        return self._config["verbose_logging"]
 
     @verbose_logging.setter
     def verbose_logging(self, value: bool) -> None:
         """Set verbose logging setting."""
-        self.set("verbose_logging", value)
+        self._config["verbose_logging"] = value
 
     @property
     def sync_endpoint(self) -> str:
         """Get sync endpoint URL."""
-        return self.get("sync_endpoint", "")
+        return self._config["sync_endpoint"]
 
     @sync_endpoint.setter
     def sync_endpoint(self, value: str) -> None:
         """Set sync endpoint URL."""
-        self.set("sync_endpoint", value)
+        self._config["sync_endpoint"] = value
 
     @property
     def data_dir(self) -> Path:
         """Get data directory path."""
-        data_dir = self.get("data_dir")
+        data_dir = self._config.get("data_dir")
         if data_dir:
             return Path(data_dir)
-        return Path.home() / "Library" / "Application Support" / "Pulse" / "data"
+        return get_default_data_dir()
+
+
+# Map environment variables to config keys
+_ENV_MAPPINGS = {
+    "PULSE_DATA_DIR": "data_dir",
+    "PULSE_ENDPOINT": "sync_endpoint",
+    "PULSE_AUTH_TOKEN": "sync_auth_token",  # nosec B105
+    "PULSE_IDLE_THRESHOLD": "idle_threshold",
+    "PULSE_FAST_MODE": "fast_mode",
+    "PULSE_VERBOSE": "verbose_logging",
+    "PULSE_INTERVAL": "save_interval",
+    "PULSE_SYNC_INTERVAL": "sync_interval",
+}
+
+# Config keys converted from environment strings
+_INT_KEYS = frozenset(
+    {"idle_threshold", "save_interval", "sync_interval", "data_retention_days"}
+)
+_BOOL_KEYS = frozenset({"fast_mode", "verbose_logging", "auto_sync", "privacy_mode"})
+_BOOL_TRUE = frozenset({"true", "1", "yes", "on"})
 
 
 def load_config_from_env() -> Dict[str, Any]:
@@ -166,49 +246,33 @@ def load_config_from_env() -> Dict[str, Any]:
         Configuration dictionary from environment
     """
     env_config: Dict[str, Any] = {}
+    environ = os.environ
+
+    for env_var, config_key in _ENV_MAPPINGS.items():
+        value = environ.get(env_var)
+        if value is None:
+            continue
 
-    # Map environment variables to config keys
-    env_mappings = {
-        "PULSE_DATA_DIR": "data_dir",
-        "PULSE_ENDPOINT": "sync_endpoint",
-        "PULSE_AUTH_TOKEN": "sync_auth_token",  # nosec B105
-        "PULSE_IDLE_THRESHOLD": "idle_threshold",
-        "PULSE_FAST_MODE": "fast_mode",
-        "PULSE_VERBOSE": "verbose_logging",
-        "PULSE_INTERVAL": "save_interval",
-        "PULSE_SYNC_INTERVAL": "sync_interval",
-    }
-
-    for env_var, config_key in env_mappings.items():
-        value = os.getenv(env_var)
-        if value is not None:
-            # Type conversion based on default values
-            if config_key in [
-                "idle_threshold",
-                "save_interval",
-                "sync_interval",
-                "data_retention_days",
-            ]:
-                try:
-                    env_config[config_key] = int(value)
-                except ValueError:
-                    print(f"Warning: Invalid integer value for {env_var}: {value}")
-            elif config_key in [
-                "fast_mode",
-                "verbose_logging",
-                "auto_sync",
-                "privacy_mode",
-            ]:
-                env_config[config_key] = value.lower() in ("true", "1", "yes", "on")
-            else:
-                env_config[config_key] = value
+        # Type conversion based on default values
+        if config_key in _INT_KEYS:
+            try:
+                env_config[config_key] = int(value)
+            except ValueError:
+                print(f"Warning: Invalid integer value for {env_var}: {value}")
+        elif config_key in _BOOL_KEYS:
+            env_config[config_key] = value.lower() in _BOOL_TRUE
+        else:
+            env_config[config_key] = value
 
     return env_config
 
 
+@functools.lru_cache(maxsize=None)
 def get_default_data_dir() -> Path:
     """Get the default data directory for the current user.
 
+    The path is computed once per process and cached.
+
     Returns:
         Path to default data directory
     """
@@ -228,25 +292,37 @@ def ensure_data_dir(data_dir: Path) -> None:
 _global_config: Optional[Config] = None
 
 
+def _apply_env_overrides(config: Config) -> None:
+    """Apply environment variable overrides to a Config instance."""
+    env_config = load_config_from_env()
+    if env_config:
+        config.update(env_config)
+
+
 def get_config() -> Config:
     """Get global configuration instance.
 
+    The settings file is only re-parsed when its modification time has
+    changed since it was last read.
+
     Returns:
         Global Config instance
     """
     global _global_config
     if _global_config is None:
         _global_config = Config()
-        # Apply environment variable overrides
-        env_config = load_config_from_env()
-        if env_config:
-            _global_config.update(env_config)
+        _apply_env_overrides(_global_config)
+    elif _global_config.maybe_reload():
+        _apply_env_overrides(_global_config)
     return _global_config
 
 
 def reload_config() -> Config:
     """Reload configuration from file.
 
+    Unlike get_config(), this always builds a fresh instance, discarding
+    unsaved changes and re-reading environment variable overrides.
+
     Returns:
         Reloaded Config instance
     """
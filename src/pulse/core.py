@@ -4,18 +4,57 @@ Pulse Daemon
 Tracks time spent on applications and websites in the background.
 """
 
+import argparse
+import functools
+import logging
+import queue
+import threading
 import time
-from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from .activity_monitor import ActivityLogger, ActivityMonitor
+from .detection import AppActivationObserver, autorelease_pool
 from .storage import ActivityDataStore
 from .utils import get_data_directory
 
+__all__ = [
+    "Pulse",
+    "main",
+]
+
+log = logging.getLogger(__name__)
+
 # Target duration for each minute file (in seconds).
 # All minute files are normalized to sum to exactly this value.
 TARGET_MINUTE_SECONDS = 60.0
 
+# Adaptive polling: poll quickly around app switches and back off while the
+# foreground app is stable to reduce wakeups.
+MIN_POLL_INTERVAL = 0.5
+MAX_POLL_INTERVAL = 2.0
+POLL_BACKOFF_FACTOR = 1.5
+# While idle, the idle check backs off exponentially between these bounds.
+MIN_IDLE_WAIT = 1.0
+MAX_IDLE_WAIT = 30.0
+# Backoff ceiling once app activation notifications can wake the loop; the
+# periodic poll then only serves window title changes and minute saves.
+EVENT_POLL_INTERVAL = 5.0
+# Shortest wait, for deadlines that are already due when the tick ends.
+MIN_WAIT = 0.01
+
+# Pending minute saves held for the writer; the loop only blocks on a full
+# queue, i.e. once the disk has fallen this many minutes behind.
+WRITE_QUEUE_SIZE = 32
+
+# Repeats of the same tracking loop error are logged at most this often.
+ERROR_LOG_INTERVAL = 60.0
+
+
+@functools.lru_cache(maxsize=None)
+def _default_data_dir() -> str:
+    """Resolve the default data directory once per process."""
+    return str(get_data_directory())
+
 
 class Pulse:
     """
@@ -25,6 +64,20 @@ class Pulse:
     following the Single Responsibility Principle.
     """
 
+    __slots__ = (
+        "interval",
+        "_stop_evt",
+        "_wake_evt",
+        "_next_save",
+        "monitor",
+        "logger",
+        "data_store",
+        "_write_q",
+        "_writer",
+        "_last_error_type",
+        "_last_error_ts",
+    )
+
     def __init__(
         self,
         data_dir: Optional[str] = None,
@@ -47,12 +100,20 @@ class Pulse:
             idle_threshold (int): Idle detection threshold in seconds.
         """
         self.interval = interval
-        self.running = False
-        self.last_check_time = datetime.now()
+        # Set while the tracker is stopped; the loop waits on it between ticks
+        # so stop() takes effect immediately instead of after the next sleep.
+        self._stop_evt = threading.Event()
+        self._stop_evt.set()
+        # Set by stop() and by app activation notifications to cut a wait short
+        self._wake_evt = threading.Event()
+        # Epoch timestamp of the next minute boundary, so the per-tick check
+        # is a float comparison. Wall clock rather than monotonic, because
+        # saves must line up with the minute files they are written to.
+        self._next_save = (int(time.time()) // 60 + 1) * 60.0
 
         # Use appropriate data directory
         if data_dir is None:
-            data_dir = str(get_data_directory())
+            data_dir = _default_data_dir()
 
         # Use composition - inject specialized components
         window_titles = include_window_titles and not fast_mode
@@ -66,104 +127,219 @@ class Pulse:
         self.logger = ActivityLogger(verbose=verbose)
         self.data_store = ActivityDataStore(data_dir)
 
-    def track_activity(self):
-        """Main tracking loop - orchestrates all components."""
-        current_app = None
-        start_time = time.time()
-
-        self.logger.log_tracking_start(self.monitor.include_window_titles)
-
-        while self.running:
-            try:
-                # Check for idle state changes
-
-                # Handle idle state transitions
-                if self.monitor.idle_detector.check_idle_state():
-                    if self.monitor.idle_detector.is_idle:
-                        time.sleep(1.0)  # Check idle state less frequently
-                        continue
+        # Minute saves are handed to a background writer so file I/O never
+        # stalls the polling loop. None is the shutdown sentinel.
+        self._write_q: "queue.Queue[Optional[Tuple[str, Dict[str, float]]]]" = (
+            queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        )
+        self._writer: Optional[threading.Thread] = None
 
-                # Handle idle transition timing
-                start_time = self.monitor.handle_idle_transition(
-                    current_app, start_time
-                )
+        self._last_error_type: Optional[type] = None
+        self._last_error_ts = 0.0
 
-                # Get current activity with timing
-                active_app = self.monitor.get_current_activity()
+    @property
+    def running(self) -> bool:
+        """Whether the tracking loop is running or about to run."""
+        return not self._stop_evt.is_set()
 
-                # Handle app changes with debouncing
-                current_app, start_time = self.monitor.check_app_change(
-                    current_app, active_app, start_time
-                )
+    def track_activity(self):
+        """Main tracking loop - orchestrates all components."""
+        # Bind per-tick lookups to locals once, outside the hot loop
+        monitor = self.monitor
+        idle_detector = monitor.idle_detector
+        check_idle_state = idle_detector.check_idle_state
+        apply_idle_transition = monitor.apply_idle_transition
+        # Window titles are fixed at construction, so pick the poller once
+        poll = monitor.poll if monitor.include_window_titles else monitor.poll_app
+        check_app_change = monitor.check_app_change
+        log_initial_app = self.logger.log_initial_app
+        check_save_interval = self._check_save_interval
+        clock = time.time
+        stop_evt = self._stop_evt
+        wake_evt = self._wake_evt
+        clear_wake = wake_evt.clear
+        wait = wake_evt.wait
+        is_stopped = stop_evt.is_set
+        pool = autorelease_pool
+        # Module constants read every tick
+        min_poll_interval = MIN_POLL_INTERVAL
+        backoff_factor = POLL_BACKOFF_FACTOR
+        min_idle_wait = MIN_IDLE_WAIT
+        max_idle_wait = MAX_IDLE_WAIT
+        min_wait = MIN_WAIT
+        debounce_delay = monitor.debounce_delay
 
-                # Initialize current app if needed
-                if not current_app and active_app:
-                    current_app = active_app
-                    start_time = time.time()
-                    self.logger.log_initial_app(active_app)
+        current_app = None
+        start_time = clock()
+        poll_interval = min_poll_interval
+        idle_wait = min_idle_wait
+
+        set_activated_app = monitor.set_activated_app
+
+        def on_activate(app) -> None:
+            # Serve the frontmost app from the notification, then wake up
+            set_activated_app(app)
+            wake_evt.set()
+
+        # Notifications are delivered on the main thread's run loop, which
+        # only runs when the tracker itself lives on another thread (the menu
+        # bar app). Only then can the poll back off further between switches.
+        observer = AppActivationObserver(on_activate)
+        max_poll_interval = MAX_POLL_INTERVAL
+        if (
+            observer.start()
+            and threading.current_thread() is not threading.main_thread()
+        ):
+            max_poll_interval = EVENT_POLL_INTERVAL
 
-                # Check for data save interval and update start_time
-                start_time = self._check_save_interval(current_app, start_time)
+        self.logger.log_tracking_start(monitor.include_window_titles)
+        self._start_writer()
 
-                time.sleep(0.5)  # Reduced to 500ms for better responsiveness
+        while not is_stopped():
+            clear_wake()
+            try:
+                # Release this tick's Objective-C temporaries before waiting;
+                # the menu bar runs the loop on a thread without its own pool
+                with pool():
+                    # One idle query serves both the check and the timing; while
+                    # active it is only made once the threshold could be reached
+                    idle_changed, idle_time = check_idle_state(lazy=True)
+
+                    # Single clock read shared by this tick's timing decisions
+                    now = clock()
+
+                    if idle_changed:
+                        start_time = apply_idle_transition(
+                            current_app, start_time, idle_time, now
+                        )
+                        idle_wait = min_idle_wait
+
+                    if idle_detector.is_idle:
+                        # Nothing to detect, but minute saves keep running so
+                        # activity from before going idle is written on time.
+                        # No app is charged for the idle time itself.
+                        start_time = check_save_interval(None, start_time, now)
+
+                        # Check back less and less often, but never past the
+                        # next minute save
+                        delay = max(min(idle_wait, self._next_save - now), min_wait)
+                        idle_wait = min(idle_wait * 2, max_idle_wait)
+                    else:
+                        # Get current activity
+                        active_app = poll()
+
+                        # Handle app changes with debouncing
+                        previous_app = current_app
+                        current_app, start_time = check_app_change(
+                            current_app, active_app, start_time, now
+                        )
+
+                        # Initialize current app if needed
+                        if not current_app and active_app:
+                            current_app = active_app
+                            start_time = now
+                            log_initial_app(active_app)
+
+                        # Check for data save interval and update start_time
+                        start_time = check_save_interval(current_app, start_time, now)
+
+                        # Sleep until the earliest of: the pending switch's
+                        # debounce, the next poll, or the minute save
+                        app_change_time = monitor.app_change_time
+                        if app_change_time is not None:
+                            poll_interval = min_poll_interval
+                            deadline = app_change_time + debounce_delay
+                        else:
+                            # Poll fast right after a switch, then back off
+                            if current_app != previous_app:
+                                poll_interval = min_poll_interval
+                            else:
+                                poll_interval = min(
+                                    poll_interval * backoff_factor, max_poll_interval
+                                )
+                            deadline = now + poll_interval
+                        delay = max(min(deadline, self._next_save) - now, min_wait)
+                wait(delay)
 
             except KeyboardInterrupt:
-                self.running = False
+                stop_evt.set()
                 break
             except Exception as e:
-                print(f"Error in tracking loop: {e}")
-                time.sleep(5)
+                self._log_loop_error(e)
+                wait(5)
+
+        observer.stop()
+        set_activated_app(None)
 
-        # Save any remaining data
+        # Flush queued minute saves, then save any remaining data
+        self._stop_writer()
         self._save_final_data(current_app, start_time)
         self.logger.log_tracking_stop()
 
+    def _log_loop_error(self, error: Exception) -> None:
+        """Log a tracking loop error, suppressing rapid repeats of the same type."""
+        now = time.monotonic()
+        if (
+            type(error) is self._last_error_type
+            and now - self._last_error_ts < ERROR_LOG_INTERVAL
+        ):
+            return
+        self._last_error_type = type(error)
+        self._last_error_ts = now
+        log.exception("Error in tracking loop: %s", error)
+
     def _check_save_interval(
-        self, current_app: Optional[str], start_time: float
+        self, current_app: Optional[str], start_time: float, now: float
     ) -> float:
         """Check if we need to save data (every minute). Returns updated start_time."""
-        if not self._is_minute_boundary():
+        if not self._is_minute_boundary(now):
             return start_time
 
-        session_data = self._get_bounded_session_data(current_app, start_time)
-        self._save_and_log(session_data)
-        return time.time()
+        session_data, total_time = self._get_bounded_session_data(
+            current_app, start_time, now
+        )
+        self._save_and_log(session_data, total_time)
+        # Start each minute from a freshly looked-up window title
+        self.monitor.expire_activity()
+        return now
 
-    def _is_minute_boundary(self) -> bool:
+    def _is_minute_boundary(self, now: float) -> bool:
         """Check if current time has crossed a minute boundary."""
-        now = datetime.now()
-        if now.minute != self.last_check_time.minute:
-            self.last_check_time = now
-            return True
-        return False
+        next_save = self._next_save
+        # The lower bound also catches the wall clock being set back
+        if next_save - 60.0 <= now < next_save:
+            return False
+        self._next_save = (int(now) // 60 + 1) * 60.0
+        return True
 
     def _get_bounded_session_data(
-        self, current_app: Optional[str], start_time: float
-    ) -> dict:
-        """Get session data with proper time bounds for the minute interval."""
+        self, current_app: Optional[str], start_time: float, now: float
+    ) -> Tuple[dict, float]:
+        """Get session data with proper time bounds for the minute interval.
+
+        Returns tuple of (bounded_data, total_seconds).
+        """
         existing_session_data = self.monitor.clear_session_data()
 
         # Calculate time attribution for current app
-        time_since_boundary = self._get_current_app_time(current_app, start_time)
+        time_since_boundary = self._get_current_app_time(current_app, start_time, now)
 
         # Build bounded data
         minute_bounded_data = self._build_bounded_data(
-            existing_session_data, current_app, time_since_boundary
+            existing_session_data, current_app, time_since_boundary, now
         )
 
         # Normalize to exactly 60 seconds
         return self._normalize_to_minute(minute_bounded_data)
 
     def _get_current_app_time(
-        self, current_app: Optional[str], start_time: float
+        self, current_app: Optional[str], start_time: float, now: float
     ) -> float:
         """Calculate bounded time for current app in this minute."""
         if not current_app:
             return 0.0
 
-        time_since_boundary = self._calculate_time_in_current_minute(
-            start_time, self.last_check_time
-        )
+        time_since_boundary = self._calculate_time_in_current_minute(start_time, now)
         return max(0.0, min(time_since_boundary, 60.0))
 
     def _build_bounded_data(
@@ -171,79 +347,128 @@ class Pulse:
         session_data: dict,
         current_app: Optional[str],
         time_since_boundary: float,
+        now: float,
     ) -> dict:
         """Build minute-bounded data from session data."""
-        last_boundary_timestamp = self.last_check_time.timestamp()
-        current_timestamp = time.time()
-        max_possible_time = current_timestamp - last_boundary_timestamp
+        last_boundary_timestamp = self._next_save - 60.0
+        max_possible_time = now - last_boundary_timestamp
         max_reasonable_time = min(60.0, max_possible_time)
 
         minute_bounded_data = {}
+        current_app_seen = False
 
         for app_name, duration in session_data.items():
-            if app_name != current_app:
-                bounded_duration = min(duration, max_reasonable_time)
+            if app_name == current_app:
+                current_app_seen = True
+                if time_since_boundary > 0:
+                    minute_bounded_data[app_name] = time_since_boundary
+            else:
+                bounded_duration = (
+                    duration if duration < max_reasonable_time else max_reasonable_time
+                )
                 if bounded_duration > 0:
                     minute_bounded_data[app_name] = bounded_duration
-            elif time_since_boundary > 0:
-                minute_bounded_data[app_name] = time_since_boundary
 
-        # Add current app if not already processed
-        if (
-            current_app
-            and current_app not in minute_bounded_data
-            and time_since_boundary > 0
-        ):
+        # Add current app if it had no session entry yet
+        if current_app and not current_app_seen and time_since_boundary > 0:
             minute_bounded_data[current_app] = time_since_boundary
 
         return minute_bounded_data
 
-    def _normalize_to_minute(self, data: dict) -> dict:
-        """Normalize durations to sum to exactly 60 seconds with 2 decimal precision."""
+    def _normalize_to_minute(self, data: dict) -> Tuple[dict, float]:
+        """Normalize durations to sum to exactly 60 seconds with 2 decimal precision.
+
+        Scales ``data`` in place and returns tuple of (data, total_seconds).
+        """
         if not data:
-            return data
+            return data, 0.0
 
         total_time = sum(data.values())
         if total_time <= 0:
-            return data
+            return data, total_time
 
-        # Scale all durations proportionally to sum to exactly 60 seconds
+        # Scale, round, total and find the largest entry in a single pass
         scale_factor = TARGET_MINUTE_SECONDS / total_time
-        normalized = {
-            app: round(duration * scale_factor, 2) for app, duration in data.items()
-        }
+        current_total = 0.0
+        largest_app = None
+        largest = -1.0
+        for app, duration in data.items():
+            value = round(duration * scale_factor, 2)
+            data[app] = value
+            current_total += value
+            if value > largest:
+                largest_app, largest = app, value
 
         # Adjust for rounding errors to ensure exact 60.00 total
-        current_total = sum(normalized.values())
         diff = round(TARGET_MINUTE_SECONDS - current_total, 2)
 
-        if diff != 0 and normalized:
+        if diff != 0 and largest_app is not None:
             # Add/subtract difference from the largest entry
-            largest_app = max(normalized, key=lambda k: normalized[k])
-            normalized[largest_app] = round(normalized[largest_app] + diff, 2)
+            data[largest_app] = round(largest + diff, 2)
 
-        return normalized
+        return data, TARGET_MINUTE_SECONDS
 
-    def _save_and_log(self, session_data: dict) -> None:
+    def _save_and_log(self, session_data: dict, total_time: float) -> None:
         """Save session data and log the operation."""
-        self.data_store.merge_and_save_session_data(session_data)
-        total_time = sum(session_data.values())
+        if self._writer is not None:
+            # Bind the target file now so a delayed write lands in the right minute
+            filename = self.data_store.get_current_minute_filename()
+            self._write_q.put((filename, session_data))
+        else:
+            self.data_store.merge_and_save_session_data(session_data)
         self.logger.log_data_save(total_time)
 
-    def _calculate_time_in_current_minute(
-        self, start_time: float, last_boundary: datetime
-    ) -> float:
-        """Calculate how much time should be attributed to the current minute only."""
-        current_time = time.time()
-        last_boundary_timestamp = last_boundary.timestamp()
+    def _start_writer(self) -> None:
+        """Start the background thread that persists minute data."""
+        if self._writer is not None:
+            return
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="pulse-writer", daemon=True
+        )
+        self._writer.start()
+
+    def _stop_writer(self) -> None:
+        """Flush pending writes and wait for the writer thread to exit."""
+        if self._writer is None:
+            return
+        self._write_q.put(None)
+        self._writer.join()
+        self._writer = None
+
+    def _writer_loop(self) -> None:
+        """Drain queued minute data and save it, one write per minute file."""
+        while True:
+            item = self._write_q.get()
+            pending: Dict[str, Dict[str, float]] = {}
+            stopping = False
+
+            # Coalesce everything that queued up behind the previous write
+            while True:
+                if item is None:
+                    stopping = True
+                else:
+                    filename, session_data = item
+                    merged = pending.setdefault(filename, {})
+                    for app, duration in session_data.items():
+                        merged[app] = merged.get(app, 0.0) + duration
+                try:
+                    item = self._write_q.get_nowait()
+                except queue.Empty:
+                    break
+
+            for filename, merged in pending.items():
+                try:
+                    self.data_store.merge_and_save_session_data(merged, filename)
+                except Exception as e:
+                    print(f"Error saving activity data: {e}")
+
+            if stopping:
+                return
 
-        # If start_time is before the last minute boundary,
-        # only count time since boundary
-        if start_time < last_boundary_timestamp:
-            return current_time - last_boundary_timestamp
-        else:
-            # If start_time is after boundary, count full duration
-            return current_time - start_time
+    def _calculate_time_in_current_minute(self, start_time: float, now: float) -> float:
+        """Calculate how much time should be attributed to the current minute only."""
+        # Only count time since the later of the app start and the last boundary
+        return now - max(start_time, (self._next_save - 60.0))
 
     def _save_final_data(self, current_app: Optional[str], start_time: float):
         """Save any remaining session data before exit."""
@@ -262,60 +487,50 @@ class Pulse:
             f"AFK detection: Will pause tracking after "
             f"{idle_minutes} minutes of inactivity"
         )
-        self.running = True
+        self._stop_evt.clear()
         self.track_activity()
 
     def stop(self):
         """Stop the Pulse."""
         print("Stopping Pulse...")
-        self.running = False
+        self._stop_evt.set()
+        self._wake_evt.set()
 
 
-def main():
-    """Main entry point."""
-    import sys
-
-    # Parse command line arguments
-    verbose = True
-    fast_mode = False
-    include_window_titles = True
-    idle_threshold = 300  # 5 minutes default
-
-    if "--quiet" in sys.argv or "-q" in sys.argv:
-        verbose = False
-    if "--fast" in sys.argv or "-f" in sys.argv:
-        fast_mode = True
-        include_window_titles = False
-    if "--no-windows" in sys.argv:
-        include_window_titles = False
-
-    # Parse idle threshold
-    for i, arg in enumerate(sys.argv):
-        if arg == "--idle-threshold" and i + 1 < len(sys.argv):
-            try:
-                idle_threshold = int(sys.argv[i + 1])
-            except ValueError:
-                print(f"Invalid idle threshold: {sys.argv[i + 1]}")
-                return
+def _build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command line parser for the tracker."""
+    parser = argparse.ArgumentParser(description="Pulse")
+    parser.add_argument(
+        "--quiet", "-q", action="store_true", help="Run in quiet mode (no logging)"
+    )
+    parser.add_argument(
+        "--fast",
+        "-f",
+        action="store_true",
+        help="Fast mode (app names only, no window titles)",
+    )
+    parser.add_argument(
+        "--no-windows", action="store_true", help="Disable window title detection"
+    )
+    parser.add_argument(
+        "--idle-threshold",
+        type=int,
+        default=300,
+        metavar="SEC",
+        help="AFK detection threshold in seconds (default: 300)",
+    )
+    return parser
 
-    if "--help" in sys.argv or "-h" in sys.argv:
-        print("Pulse")
-        print("Usage: python pulse.py [options]")
-        print("Options:")
-        print("  --quiet, -q            Run in quiet mode (no logging)")
-        print("  --fast, -f             Fast mode (app names only, no window titles)")
-        print("  --no-windows           Disable window title detection")
-        print(
-            "  --idle-threshold SEC   AFK detection threshold in seconds (default: 300)"
-        )
-        print("  --help, -h             Show this help message")
-        return
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point."""
+    args = _build_arg_parser().parse_args(argv)
 
     tracker = Pulse(
-        verbose=verbose,
-        fast_mode=fast_mode,
-        include_window_titles=include_window_titles,
-        idle_threshold=idle_threshold,
+        verbose=not args.quiet,
+        fast_mode=args.fast,
+        include_window_titles=not (args.fast or args.no_windows),
+        idle_threshold=args.idle_threshold,
     )
 
     try:
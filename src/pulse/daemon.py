@@ -13,7 +13,7 @@ import sys
 import tempfile
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from .core import Pulse
 
@@ -27,6 +27,8 @@ class ActivityDaemon:
         else:
             self.pidfile = pidfile
         self.tracker: Optional[Pulse] = None
+        # Locked pidfile descriptor, held open for the daemon's lifetime
+        self._pidfd: Optional[int] = None
 
     def daemonize(self):
         """Daemonize the process."""
@@ -57,42 +59,74 @@ class ActivityDaemon:
         sys.stdout.flush()
         sys.stderr.flush()
 
-        # Write pidfile with exclusive lock to prevent race conditions
+        # Close descriptors inherited from the parent, then detach stdio
         try:
-            with open(self.pidfile, "w") as f:
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-                f.write(str(os.getpid()))
-                f.flush()
+            max_fd = os.sysconf("SC_OPEN_MAX")
+        except (AttributeError, ValueError):
+            max_fd = 1024
+        os.closerange(3, max_fd)
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for std_fd in (0, 1, 2):
+            os.dup2(devnull, std_fd)
+        if devnull > 2:
+            os.close(devnull)
+
+        # Write pidfile under an exclusive lock that is held until exit, so
+        # other invocations can tell a live daemon from a stale pidfile
+        fd = os.open(self.pidfile, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
         except BlockingIOError:
+            os.close(fd)
             sys.stderr.write("Another daemon instance is already starting\n")
             sys.exit(1)
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._pidfd = fd
+
+    def _read_pidfile(self) -> Tuple[Optional[int], bool]:
+        """
+        Return (pid, running) for the pidfile.
+
+        The daemon holds an exclusive lock on its pidfile while alive, so a
+        failed lock attempt means it is running. Unlike os.kill(pid, 0),
+        this cannot be fooled by the pid having been reused.
+        """
+        try:
+            fd = os.open(self.pidfile, os.O_RDWR)
+        except FileNotFoundError:
+            return None, False
+
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                running = False
+            except BlockingIOError:
+                running = True
+            content = os.read(fd, 32)
+        finally:
+            # Closing also drops the probe lock if it was taken
+            os.close(fd)
+
+        try:
+            return int(content), running
+        except ValueError:
+            return None, running
+
+    def _remove_pidfile(self) -> None:
+        """Remove the pidfile if it still exists."""
+        try:
+            os.remove(self.pidfile)
+        except FileNotFoundError:
+            pass
 
     def start(self):
         """Start the daemon."""
-        # Check if already running
-        if os.path.exists(self.pidfile):
-            try:
-                with open(self.pidfile, "r") as f:
-                    content = f.read().strip()
-                    if not content:
-                        # Empty PID file - remove it
-                        os.remove(self.pidfile)
-                    else:
-                        pid = int(content)
-                        try:
-                            os.kill(pid, 0)  # Check if process exists
-                            print(f"Daemon already running with PID {pid}")
-                            return
-                        except OSError:
-                            # Process doesn't exist, remove stale pidfile
-                            os.remove(self.pidfile)
-            except (ValueError, IOError) as e:
-                # Corrupt PID file (invalid content or read error) - remove it
-                print(f"Removing corrupt PID file: {e}")
-                try:
-                    os.remove(self.pidfile)
-                except OSError:
-                    pass
+        # Check if already running; a stale pidfile is simply reused
+        pid, running = self._read_pidfile()
+        if running:
+            print(f"Daemon already running with PID {pid}")
+            return
 
         print("Starting Pulse daemon...")
         self.daemonize()
@@ -101,23 +135,25 @@ class ActivityDaemon:
         signal.signal(signal.SIGTERM, self._signal_handler)
         signal.signal(signal.SIGINT, self._signal_handler)
 
-        # Start the tracker
+        # Start the tracker; it returns once stopped and its data is saved
         self.tracker = Pulse()
-        self.tracker.start()
+        try:
+            self.tracker.start()
+        finally:
+            self._remove_pidfile()
 
     def stop(self):
         """Stop the daemon."""
-        if not os.path.exists(self.pidfile):
+        pid, running = self._read_pidfile()
+        if not running or pid is None:
             print("Daemon not running")
+            self._remove_pidfile()
             return
 
-        with open(self.pidfile, "r") as f:
-            pid = int(f.read().strip())
-
         try:
             os.kill(pid, signal.SIGTERM)
             print(f"Stopped daemon with PID {pid}")
-            os.remove(self.pidfile)
+            self._remove_pidfile()
         except OSError as e:
             print(f"Error stopping daemon: {e}")
 
@@ -127,22 +163,24 @@ class ActivityDaemon:
             print("Daemon not running")
             return
 
-        with open(self.pidfile, "r") as f:
-            pid = int(f.read().strip())
-
-        try:
-            os.kill(pid, 0)
+        pid, running = self._read_pidfile()
+        if running:
             print(f"Daemon running with PID {pid}")
-        except OSError:
+        else:
             print("Daemon not running (stale pidfile)")
-            os.remove(self.pidfile)
+            self._remove_pidfile()
 
     def _signal_handler(self, signum, frame):
-        """Handle termination signals."""
+        """
+        Handle termination signals.
+
+        A running tracker is only asked to stop: start() then returns after
+        the queued minute saves and the final partial minute are written.
+        """
         if self.tracker:
             self.tracker.stop()
-        if os.path.exists(self.pidfile):
-            os.remove(self.pidfile)
+            return
+        self._remove_pidfile()
         sys.exit(0)
 
 
@@ -5,10 +5,31 @@ Handles grouping and processing of activity data files.
 """
 
 import json
-import re
+import os
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Deserialize JSON bytes, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 class ActivityFileParser:
@@ -16,15 +37,36 @@ class ActivityFileParser:
 
     @staticmethod
     def parse_filename(filename: str) -> Optional[datetime]:
-        """Parse activity filename to get datetime."""
-        match = re.match(r"activity_(\d{8})_(\d{4})\.json", filename)
-        if match:
-            date_str, time_str = match.groups()
-            try:
-                return datetime.strptime(f"{date_str}_{time_str}", "%Y%m%d_%H%M")
-            except ValueError:
-                return None
-        return None
+        """
+        Parse activity filename to get datetime.
+
+        Names have the fixed form activity_YYYYMMDD_HHMM.json, so the fields
+        are sliced at known offsets instead of going through a regex and
+        strptime.
+        """
+        if (
+            len(filename) != 27
+            or not filename.startswith("activity_")
+            or not filename.endswith(".json")
+            or filename[17] != "_"
+        ):
+            return None
+        date_str = filename[9:17]
+        time_str = filename[18:22]
+        # int() would also take signs, spaces, underscores and non-ASCII digits
+        digits = date_str + time_str
+        if not (digits.isascii() and digits.isdigit()):
+            return None
+        try:
+            return datetime(
+                int(date_str[0:4]),
+                int(date_str[4:6]),
+                int(date_str[6:8]),
+                int(time_str[0:2]),
+                int(time_str[2:4]),
+            )
+        except ValueError:
+            return None
 
     @staticmethod
     def get_hour_key(dt: datetime) -> str:
@@ -35,14 +77,35 @@ class ActivityFileParser:
 class DataAggregator:
     """Aggregates activity data from multiple files."""
 
+    # Most minute files read at once while aggregating an hour; reads are
+    # I/O-bound and release the GIL
+    LOAD_WORKERS = 8
+
+    # A directory modified this recently may change again within the same
+    # mtime tick, so its listing is not cached yet
+    MTIME_GRACE_NS = 1_000_000_000
+
     def __init__(self, data_dir: str = "activity_data"):
         self.data_dir = Path(data_dir)
         self.file_parser = ActivityFileParser()
+        # Last grouping, valid while the directory mtime is unchanged
+        self._group_cache: Dict[str, List[Path]] = {}
+        self._group_mtime = -1
 
     def group_files_by_hour(self) -> Dict[str, List[Path]]:
-        """Group activity files by hour."""
-        if not self.data_dir.exists():
+        """
+        Group activity files by hour.
+
+        Adding, removing or renaming a file updates the directory mtime, so
+        the grouping is reused until it changes. Callers must not mutate the
+        returned dict.
+        """
+        try:
+            mtime = self.data_dir.stat().st_mtime_ns
+        except FileNotFoundError:
             return {}
+        if mtime == self._group_mtime:
+            return self._group_cache
 
         files_by_hour: Dict[str, List[Path]] = {}
 
@@ -54,37 +117,73 @@ class DataAggregator:
                     files_by_hour[hour_key] = []
                 files_by_hour[hour_key].append(file_path)
 
+        self._group_cache = files_by_hour
+        if time.time_ns() - mtime > self.MTIME_GRACE_NS:
+            self._group_mtime = mtime
+        else:
+            self._group_mtime = -1
         return files_by_hour
 
-    def aggregate_hour_data(self, file_paths: List[Path]) -> Dict:
-        """Aggregate data from multiple files into single hour summary."""
+    def aggregate_hour_data(
+        self, file_paths: List[Path], executor: Optional[Executor] = None
+    ) -> Dict:
+        """
+        Aggregate data from multiple files into single hour summary.
+
+        Callers aggregating many hours should pass one executor for all of
+        them; without it, a pool is started for this hour alone.
+        """
         aggregated: Dict[str, float] = {}
+        get = aggregated.get
+        total_time = 0.0
         total_files = 0
 
-        for file_path in file_paths:
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    total_files += 1
-
-                    for app, duration in data.items():
-                        aggregated[app] = aggregated.get(app, 0) + duration
-            except (json.JSONDecodeError, IOError, PermissionError) as e:
-                print(f"Warning: Could not read {file_path}: {e}")
+        if len(file_paths) <= 1:
+            loaded = [self._load_file(file_path) for file_path in file_paths]
+        elif executor is not None:
+            # map() keeps file order, so merging stays deterministic
+            loaded = list(executor.map(self._load_file, file_paths))
+        else:
+            workers = min(self.LOAD_WORKERS, len(file_paths))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                loaded = list(pool.map(self._load_file, file_paths))
+
+        for data in loaded:
+            if data is None:
+                continue
+            total_files += 1
+            for app, duration in data.items():
+                aggregated[app] = get(app, 0) + duration
+            # Totalled per file, so no final pass over all apps
+            total_time += sum(data.values())
 
         return {
             "applications": aggregated,
-            "total_time": sum(aggregated.values()),
+            "total_time": total_time,
             "files_processed": total_files,
         }
 
+    @staticmethod
+    def _load_file(file_path: Path) -> Optional[Dict]:
+        """Load one minute file, or return None if it cannot be read."""
+        try:
+            with open(file_path, "rb") as f:
+                return _loads(f.read())
+        except (json.JSONDecodeError, IOError, PermissionError) as e:
+            print(f"Warning: Could not read {file_path}: {e}")
+            return None
+
     def get_all_aggregated_data(self) -> Dict[str, Dict]:
         """Get all data aggregated by hour."""
         files_by_hour = self.group_files_by_hour()
         aggregated_data = {}
 
-        for hour_key, file_paths in files_by_hour.items():
-            aggregated_data[hour_key] = self.aggregate_hour_data(file_paths)
+        # One pool serves every hour instead of one started per hour
+        with ThreadPoolExecutor(max_workers=self.LOAD_WORKERS) as executor:
+            for hour_key, file_paths in files_by_hour.items():
+                aggregated_data[hour_key] = self.aggregate_hour_data(
+                    file_paths, executor
+                )
 
         return aggregated_data
 
@@ -96,34 +195,44 @@ class SyncStateManager:
         self.data_dir = Path(data_dir)
         self.synced_hours_file = self.data_dir / "synced_hours.json"
         self.synced_hours = self._load_synced_hours()
+        # Hours marked since the last write; flush() persists them
+        self._dirty = False
 
     def _load_synced_hours(self) -> set:
         """Load list of already synced hours."""
         try:
             if self.synced_hours_file.exists():
-                with open(self.synced_hours_file, "r", encoding="utf-8") as f:
-                    return set(json.load(f))
+                with open(self.synced_hours_file, "rb") as f:
+                    return set(_loads(f.read()))
             else:
                 return set()
         except (json.JSONDecodeError, IOError, PermissionError):
             return set()
 
     def save_synced_hours(self):
-        """Save list of synced hours."""
+        """Save list of synced hours, atomically replacing the old file."""
+        tmp_file = self.synced_hours_file.with_suffix(".json.tmp")
         try:
-            with open(self.synced_hours_file, "w", encoding="utf-8") as f:
-                json.dump(list(self.synced_hours), f, ensure_ascii=False)
+            with open(tmp_file, "wb") as f:
+                f.write(_dumps(list(self.synced_hours)))
+            os.replace(tmp_file, self.synced_hours_file)
+            self._dirty = False
         except (IOError, PermissionError) as e:
             print(f"Warning: Could not save synced hours: {e}")
 
+    def flush(self):
+        """Save synced hours if any were marked since the last save."""
+        if self._dirty:
+            self.save_synced_hours()
+
     def is_hour_synced(self, hour_key: str) -> bool:
         """Check if hour has been synced."""
         return hour_key in self.synced_hours
 
     def mark_hour_synced(self, hour_key: str):
-        """Mark hour as synced."""
+        """Mark hour as synced; call flush() to persist the marks."""
         self.synced_hours.add(hour_key)
-        self.save_synced_hours()
+        self._dirty = True
 
     def get_pending_hours(self, available_hours: List[str]) -> List[str]:
         """Get list of hours that haven't been synced yet."""
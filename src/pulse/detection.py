@@ -4,40 +4,386 @@ Application and window detection for Pulse.
 Handles all macOS-specific detection logic.
 """
 
+import logging
+import math
+import os
+import select
 import subprocess  # nosec B404 - Required for macOS AppleScript integration
+import threading
 import time
-from typing import Optional
+import unicodedata
+from collections import OrderedDict
+from typing import IO, Callable, Optional, Tuple, cast
 
 try:
     from AppKit import NSWorkspace
+    from objc import autorelease_pool
     from Quartz import (
         CGEventSourceSecondsSinceLastEventType,
         CGWindowListCopyWindowInfo,
         kCGAnyInputEventType,
         kCGEventSourceStateHIDSystemState,
         kCGNullWindowID,
+        kCGWindowListExcludeDesktopElements,
         kCGWindowListOptionOnScreenOnly,
     )
 except ImportError:
     print("Error: pyobjc-framework-Cocoa not installed.")
     exit(1)
 
+try:
+    from ApplicationServices import (
+        AXObserverAddNotification,
+        AXObserverCreate,
+        AXObserverGetRunLoopSource,
+        AXUIElementCopyAttributeValue,
+        AXUIElementCreateApplication,
+        kAXErrorAPIDisabled,
+        kAXErrorSuccess,
+        kAXFocusedWindowAttribute,
+        kAXFocusedWindowChangedNotification,
+        kAXTitleAttribute,
+        kAXTitleChangedNotification,
+    )
+    from CoreFoundation import (
+        CFRunLoopAddSource,
+        CFRunLoopGetCurrent,
+        CFRunLoopRemoveSource,
+        kCFRunLoopDefaultMode,
+    )
+except ImportError:  # pragma: no cover - falls back to AppleScript/Quartz
+    AXUIElementCreateApplication = None
+
+
+__all__ = [
+    "AppActivationObserver",
+    "AppleScriptHelper",
+    "ApplicationDetector",
+    "DetectionMetrics",
+    "IdleDetector",
+    "TitleCleaner",
+    "WindowTitleDetector",
+    "autorelease_pool",
+]
+
+log = logging.getLogger(__name__)
+
+_normalize = unicodedata.normalize
+
+# Absolute path, so spawning osascript does not search PATH
+OSASCRIPT = "/usr/bin/osascript"
+
 
 class ApplicationDetector:
     """Detects currently active applications on macOS."""
 
+    def __init__(self):
+        # Process id of the app last returned by get_active_application
+        self.active_pid: Optional[int] = None
+        # Shared workspace singleton, fetched on first use
+        self._workspace = None
+        # (name, pid) from the last activation notification; None while
+        # notifications are not delivered, so the workspace is polled instead
+        self._activated: Optional[Tuple[str, Optional[int]]] = None
+
+    def set_activated_app(self, app) -> None:
+        """
+        Record the NSRunningApplication that just became frontmost.
+
+        Until reset with None, get_active_application() answers from this
+        record instead of querying the workspace.
+        """
+        name = app.localizedName() if app is not None else None
+        if name:
+            self._activated = (str(name), app.processIdentifier())
+        else:
+            self._activated = None
+
     def get_active_application(self) -> Optional[str]:
         """Get the currently active application name."""
+        activated = self._activated
+        if activated is not None:
+            self.active_pid = activated[1]
+            return activated[0]
+
+        self.active_pid = None
         try:
-            workspace = NSWorkspace.sharedWorkspace()
+            workspace = self._workspace
+            if workspace is None:
+                workspace = self._workspace = NSWorkspace.sharedWorkspace()
             active_app = workspace.activeApplication()
             if active_app:
+                self.active_pid = active_app.get("NSApplicationProcessIdentifier")
                 return active_app["NSApplicationName"]
         except (KeyError, AttributeError, RuntimeError) as e:
-            print(f"Error getting active application: {e}")
+            log.error("Error getting active application: %s", e)
         return None
 
 
+class AppActivationObserver:
+    """
+    Invokes a callback whenever another application becomes frontmost.
+
+    The callback receives the activated NSRunningApplication. NSWorkspace
+    posts its notifications on the main thread, so callbacks only arrive
+    while that thread runs a run loop (as the menu bar app does).
+    """
+
+    NOTIFICATION = "NSWorkspaceDidActivateApplicationNotification"
+    APPLICATION_KEY = "NSWorkspaceApplicationKey"
+
+    def __init__(self, callback: Callable[[object], None]):
+        self._callback = callback
+        self._token = None
+
+    def start(self) -> bool:
+        """Register for activation notifications; return True on success."""
+        if self._token is not None:
+            return True
+        try:
+            center = NSWorkspace.sharedWorkspace().notificationCenter()
+            self._token = center.addObserverForName_object_queue_usingBlock_(
+                self.NOTIFICATION, None, None, self._on_activate
+            )
+        except (AttributeError, RuntimeError) as e:
+            log.warning("App activation notifications unavailable: %s", e)
+            return False
+        return True
+
+    def stop(self) -> None:
+        """Unregister from activation notifications."""
+        if self._token is None:
+            return
+        try:
+            NSWorkspace.sharedWorkspace().notificationCenter().removeObserver_(
+                self._token
+            )
+        except (AttributeError, RuntimeError):
+            pass
+        self._token = None
+
+    def _on_activate(self, notification) -> None:
+        user_info = notification.userInfo()
+        self._callback(user_info.get(self.APPLICATION_KEY) if user_info else None)
+
+
+class AppleScriptHelper:
+    """
+    Long-lived osascript process that answers window title queries.
+
+    Spawning osascript for every poll pays fork/exec and script compilation
+    each time. This helper starts one JavaScript for Automation process that
+    reads an application name per line on stdin and writes the title of that
+    app's front window (or an empty line) back on stdout.
+    """
+
+    # Scripting bridge loop run inside the helper. The Visual Studio Code
+    # branch goes through System Events, matching the one-shot AppleScript.
+    SCRIPT = r"""
+ObjC.import("Foundation");
+
+function frontTitle(name) {
+    try {
+        if (name === "Visual Studio Code") {
+            const proc = Application("System Events").processes.byName("Code");
+            if (!proc.exists()) return "";
+            return proc.windows[0].title() || "";
+        }
+        const app = Application(name);
+        if (app.windows.length === 0) return "";
+        return app.windows[0].name() || "";
+    } catch (e) {
+        return "";
+    }
+}
+
+const input = $.NSFileHandle.fileHandleWithStandardInput;
+const output = $.NSFileHandle.fileHandleWithStandardOutput;
+let buffer = "";
+while (true) {
+    const data = input.availableData;
+    if (data.length === 0) break;
+    buffer += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+    let end;
+    while ((end = buffer.indexOf("\n")) >= 0) {
+        const name = buffer.slice(0, end);
+        buffer = buffer.slice(end + 1);
+        const title = String(frontTitle(name)).replace(/[\r\n]+/g, " ");
+        output.writeData($(title + "\n").dataUsingEncoding($.NSUTF8StringEncoding));
+    }
+}
+"""
+
+    COMMAND = [OSASCRIPT, "-l", "JavaScript", "-e", SCRIPT]
+
+    # Timeouts tolerated from a helper that has not answered yet before it
+    # is considered stalled rather than still starting up
+    MAX_STARTUP_TIMEOUTS = 8
+
+    def __init__(self):
+        self._proc: Optional[subprocess.Popen] = None
+        # Bytes read from the helper's stdout that do not form a line yet.
+        # stdout is unbuffered and read here, so select() on its descriptor
+        # never misses answers already pulled into a Python-side buffer.
+        self._buffer = b""
+        # Whether the running helper has answered yet, how often it timed out
+        # before that, and how many answers to those queries are still due
+        self._started = False
+        self._startup_timeouts = 0
+        self._late_answers = 0
+
+    def query(self, app_name: str, timeout: float) -> Optional[str]:
+        """
+        Return the front window title of app_name, or None if there is none.
+
+        Raises subprocess.TimeoutExpired if no answer arrives within timeout.
+        Until the helper has answered once, it is assumed to still be
+        starting up: it is kept and its late answers are skipped on later
+        queries, so startup is not charged to a single query's timeout.
+        After that, a timeout restarts the helper on the next query so a
+        late answer can never be mistaken for a reply to a different app.
+        Raises OSError if osascript cannot be started.
+        """
+        proc = self._proc
+        if proc is None or proc.poll() is not None:
+            self.close()
+            proc = subprocess.Popen(  # nosec B603
+                self.COMMAND,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+            )
+            self._proc = proc
+
+        stdin = cast(IO[bytes], proc.stdin)
+        fd = cast(IO[bytes], proc.stdout).fileno()
+        line: Optional[bytes] = None
+        sent = False
+        try:
+            # Skip answers to queries that timed out during startup
+            while self._late_answers:
+                line = self._read_line(fd, timeout)
+                if not line:
+                    break
+                self._late_answers -= 1
+                line = None
+            else:
+                stdin.write(app_name.encode("utf-8") + b"\n")
+                sent = True
+                line = self._read_line(fd, timeout)
+        except (BrokenPipeError, ValueError):
+            line = b""
+
+        if line is None:
+            self._startup_timeouts += 1
+            if self._started or self._startup_timeouts > self.MAX_STARTUP_TIMEOUTS:
+                self.close()
+            elif sent:
+                self._late_answers += 1
+            raise subprocess.TimeoutExpired(self.COMMAND[0], timeout)
+        if not line:
+            # Helper exited; it is respawned on the next query
+            self.close()
+            return None
+
+        self._started = True
+        title = line.decode("utf-8", errors="replace").strip()
+        return title or None
+
+    def _read_line(self, fd: int, timeout: float) -> Optional[bytes]:
+        """
+        Return the next answer line, including its newline.
+
+        Returns None if no full line arrives within timeout, and b"" once
+        the helper has closed stdout.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            if b"\n" in self._buffer:
+                line, _, self._buffer = self._buffer.partition(b"\n")
+                return line + b"\n"
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                return None
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                return b""
+            self._buffer += chunk
+
+    def close(self) -> None:
+        """Terminate the helper process if it is running."""
+        proc = self._proc
+        self._proc = None
+        self._buffer = b""
+        self._started = False
+        self._startup_timeouts = 0
+        self._late_answers = 0
+        if proc is None:
+            return
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        for stream in (proc.stdin, proc.stdout):
+            if stream is not None:
+                stream.close()
+
+
+def _front_window_script(mapped_name: str) -> str:
+    """Build the one-shot AppleScript that returns an app's front window title."""
+    if mapped_name == "Visual Studio Code":
+        # VS Code has no scripting dictionary; ask System Events instead
+        return (
+            'tell application "System Events"\n'
+            "try\n"
+            'if exists process "Code" then\n'
+            'set frontWindow to front window of process "Code"\n'
+            "return title of frontWindow\n"
+            "end if\n"
+            "end try\n"
+            "end tell\n"
+            'return ""'
+        )
+    return (
+        f'tell application "{mapped_name}"\n'
+        "try\n"
+        "if (count of windows) > 0 then\n"
+        "return name of front window\n"
+        "end if\n"
+        "end try\n"
+        "end tell\n"
+        'return ""'
+    )
+
+
+class DetectionMetrics:
+    """Counters for window title lookups, updated on every call."""
+
+    __slots__ = (
+        "total_calls",
+        "cache_hits",
+        "applescript_calls",
+        "applescript_timeouts",
+        "applescript_total_time",
+        "quartz_fallbacks",
+    )
+
+    def __init__(self):
+        self.total_calls = 0
+        self.cache_hits = 0
+        self.applescript_calls = 0
+        self.applescript_timeouts = 0
+        self.applescript_total_time = 0.0
+        self.quartz_fallbacks = 0
+
+    def as_dict(self) -> dict:
+        """Return the counters as a dict keyed by name."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 class WindowTitleDetector:
     """Detects window titles for specific applications."""
 
@@ -52,40 +398,90 @@ class WindowTitleDetector:
         "Xcode": "Xcode",
     }
 
-    def __init__(self, cache_ttl: float = 2.0, applescript_timeout: float = 0.5):
+    # One-shot scripts keyed by mapped application name, built once
+    SCRIPTS = {mapped: _front_window_script(mapped) for mapped in APP_MAPPING.values()}
+    COMMANDS = {mapped: [OSASCRIPT, "-e", script] for mapped, script in SCRIPTS.items()}
+
+    VSCODE_NAMES = ("Code", "Visual Studio Code")
+
+    # Most apps with a cached title; entries for apps no longer looked up
+    # would otherwise stay until their own key is queried again
+    TITLE_CACHE_SIZE = 64
+
+    # Window list snapshots are shared by lookups within one tracking tick
+    WINDOW_LIST_TTL = 0.4
+
+    def __init__(
+        self,
+        cache_ttl: float = 2.0,
+        applescript_timeout: float = 0.5,
+        use_helper: bool = True,
+    ):
         """
         Initialize the WindowTitleDetector with caching and configurable timeout.
 
         Args:
             cache_ttl: Time-to-live for cached window titles in seconds.
             applescript_timeout: Timeout for AppleScript calls in seconds.
+            use_helper: Query titles through a persistent osascript process
+                instead of spawning one per call. Falls back to one-shot
+                calls if the helper cannot be started.
         """
         self.cache_ttl = cache_ttl
         self.applescript_timeout = applescript_timeout
-        self._title_cache: dict[str, tuple[str, float]] = {}
-        self._metrics = {
-            "total_calls": 0,
-            "cache_hits": 0,
-            "applescript_calls": 0,
-            "applescript_timeouts": 0,
-            "applescript_total_time": 0.0,
-            "quartz_fallbacks": 0,
-        }
+        self._helper: Optional[AppleScriptHelper] = (
+            AppleScriptHelper() if use_helper else None
+        )
+        # (title, monotonic expiry) per app name, least recently used first
+        self._title_cache: "OrderedDict[str, tuple[str, float]]" = OrderedDict()
+        # AX notifications update the cache and elements on the main thread
+        # while the tracker thread looks titles up; this guards both
+        self._lock = threading.Lock()
+        # Accessibility handles per pid; None once AX turns out to be disabled
+        self._ax_elements: Optional[dict] = (
+            {} if AXUIElementCreateApplication is not None else None
+        )
+        # (app name, observer, run loop source, run loop) of the watched app
+        self._watched: Optional[tuple] = None
+        # On-screen windows grouped by owner name, rebuilt per snapshot
+        self._window_index: Optional[dict[str, list[dict]]] = None
+        self._window_list_time = 0.0
+        self._metrics = DetectionMetrics()
+
+    def get_window_title(
+        self, app_name: str, pid: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Get the title of the frontmost window for the given application.
 
-    def get_window_title(self, app_name: str) -> Optional[str]:
-        """Get the title of the frontmost window for the given application."""
-        self._metrics["total_calls"] += 1
+        When Accessibility access is granted, the focused window is read
+        in-process, looking the pid up by name if it was not passed;
+        otherwise AppleScript and Quartz are used.
+        """
+        self._metrics.total_calls += 1
 
         try:
             # Check cache first
             cached_title = self._get_from_cache(app_name)
             if cached_title is not None:
-                self._metrics["cache_hits"] += 1
+                self._metrics.cache_hits += 1
                 return cached_title
 
-            # Try AppleScript for supported apps
-            if app_name in self.APP_MAPPING:
-                title = self._get_title_via_applescript(app_name)
+            if self._ax_elements is not None:
+                if pid is None:
+                    pid = self._find_pid(app_name)
+                if pid is not None:
+                    title, available = self._get_title_via_ax(pid)
+                    if available:
+                        if title:
+                            self._update_cache(app_name, title)
+                        return title
+
+            # Try AppleScript for supported apps; one lookup serves both the
+            # membership test and the scripted application name
+            mapped_name = self.APP_MAPPING.get(app_name)
+            if mapped_name is not None:
+                title = self._get_title_via_applescript(app_name, mapped_name)
                 if title:
                     self._update_cache(app_name, title)
                     return title
@@ -102,26 +498,44 @@ class WindowTitleDetector:
             return title
 
         except (subprocess.SubprocessError, KeyError, TypeError, RuntimeError) as e:
-            print(f"Warning: Failed to get window title for {app_name}: {e}")
+            log.warning("Failed to get window title for %s: %s", app_name, e)
         return None
 
     def _get_from_cache(self, app_name: str) -> Optional[str]:
         """Get window title from cache if not expired."""
-        if app_name in self._title_cache:
-            title, timestamp = self._title_cache[app_name]
-            if time.time() - timestamp < self.cache_ttl:
-                return title
-            # Remove expired entry
-            del self._title_cache[app_name]
+        cache = self._title_cache
+        with self._lock:
+            entry = cache.get(app_name)
+            if entry is not None:
+                title, expires = entry
+                if time.monotonic() < expires:
+                    cache.move_to_end(app_name)
+                    return title
+                # Remove expired entry
+                del cache[app_name]
         return None
 
-    def _update_cache(self, app_name: str, title: str) -> None:
-        """Update cache with new window title."""
-        self._title_cache[app_name] = (title, time.time())
+    def _update_cache(
+        self, app_name: str, title: str, expires: Optional[float] = None
+    ) -> None:
+        """Update cache with new window title, evicting the least recent app."""
+        if expires is None:
+            expires = time.monotonic() + self.cache_ttl
+        cache = self._title_cache
+        with self._lock:
+            cache[app_name] = (title, expires)
+            cache.move_to_end(app_name)
+            if len(cache) > self.TITLE_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def _drop_from_cache(self, app_name: str) -> None:
+        """Forget the cached window title of an app."""
+        with self._lock:
+            self._title_cache.pop(app_name, None)
 
     def get_metrics(self) -> dict:
         """Get performance metrics for AppleScript calls."""
-        metrics = self._metrics.copy()
+        metrics = self._metrics.as_dict()
         if metrics["applescript_calls"] > 0:
             metrics["avg_applescript_time"] = (
                 metrics["applescript_total_time"] / metrics["applescript_calls"]
@@ -132,106 +546,252 @@ class WindowTitleDetector:
 
     def reset_metrics(self) -> None:
         """Reset performance metrics."""
-        self._metrics = {
-            "total_calls": 0,
-            "cache_hits": 0,
-            "applescript_calls": 0,
-            "applescript_timeouts": 0,
-            "applescript_total_time": 0.0,
-            "quartz_fallbacks": 0,
-        }
+        self._metrics = DetectionMetrics()
+
+    def close(self) -> None:
+        """Stop the persistent AppleScript helper, if any."""
+        if self._helper is not None:
+            self._helper.close()
+
+    def _find_pid(self, app_name: str) -> Optional[int]:
+        """Find the pid of a running application by its name."""
+        names = self.VSCODE_NAMES if app_name in self.VSCODE_NAMES else (app_name,)
+        for app in NSWorkspace.sharedWorkspace().runningApplications():
+            if app.localizedName() in names:
+                return app.processIdentifier()
+        return None
+
+    def _get_title_via_ax(self, pid: int) -> Tuple[Optional[str], bool]:
+        """
+        Read the focused window title through the Accessibility API.
+
+        Returns (title, available); available is False once AX access turns
+        out to be disabled, so the caller falls back to the other methods.
+        """
+        element = self._get_ax_element(pid)
+        if element is None:
+            return None, False
+
+        err, window = AXUIElementCopyAttributeValue(
+            element, kAXFocusedWindowAttribute, None
+        )
+        if err == kAXErrorSuccess:
+            err, title = AXUIElementCopyAttributeValue(window, kAXTitleAttribute, None)
+            if err == kAXErrorSuccess:
+                return (str(title) if title else None), True
+
+        if err == kAXErrorAPIDisabled:
+            log.warning("Accessibility access disabled, using AppleScript")
+            with self._lock:
+                self._ax_elements = None
+            return None, False
+        # Stale handle (app quit, pid reused) or no focused window
+        with self._lock:
+            if self._ax_elements is not None:
+                self._ax_elements.pop(pid, None)
+        return None, True
+
+    def _get_ax_element(self, pid: int):
+        """
+        Get the cached Accessibility element for an application.
 
-    def _get_title_via_applescript(self, app_name: str) -> Optional[str]:
+        Returns None if Accessibility access has turned out to be disabled.
+        """
+        with self._lock:
+            elements = self._ax_elements
+            if elements is None:
+                return None
+            element = elements.get(pid)
+            if element is None:
+                element = AXUIElementCreateApplication(pid)
+                elements[pid] = element
+            return element
+
+    def watch_app(self, app, on_change: Optional[Callable[[], None]] = None) -> None:
+        """
+        Keep the focused window title of app cached from AX notifications.
+
+        The title is re-read only when the app reports a focus or title
+        change, and is served from the cache without expiry in between.
+        Notifications are delivered on the calling thread's run loop, so
+        this must be called from a thread that runs one. The previously
+        watched app is released first; passing None only releases it.
+        Without Accessibility access, only the app's cached title is dropped,
+        since it may have changed while the app was in the background.
+        """
+        self._unwatch()
+        if app is None:
+            return
+        app_name = app.localizedName()
+        if not app_name:
+            return
+        app_name = str(app_name)
+        self._drop_from_cache(app_name)
+        if self._ax_elements is None:
+            return
+        pid = app.processIdentifier()
+
+        def on_notification(observer, element, notification, refcon) -> None:
+            title, available = self._get_title_via_ax(pid)
+            if not available:
+                self._unwatch()
+                return
+            if title:
+                self._update_cache(app_name, title, math.inf)
+            else:
+                self._drop_from_cache(app_name)
+            if on_change is not None:
+                on_change()
+
+        err, observer = AXObserverCreate(pid, on_notification, None)
+        if err != kAXErrorSuccess:
+            return
+        element = self._get_ax_element(pid)
+        if element is None:
+            return
+        for notification in (
+            kAXFocusedWindowChangedNotification,
+            kAXTitleChangedNotification,
+        ):
+            AXObserverAddNotification(observer, element, notification, None)
+        source = AXObserverGetRunLoopSource(observer)
+        run_loop = CFRunLoopGetCurrent()
+        CFRunLoopAddSource(run_loop, source, kCFRunLoopDefaultMode)
+        self._watched = (app_name, observer, source, run_loop)
+
+        # Seed the cache with the current title
+        on_notification(observer, element, None, None)
+
+    def _unwatch(self) -> None:
+        """Stop observing the watched app and drop its non-expiring title."""
+        watched = self._watched
+        if watched is None:
+            return
+        self._watched = None
+        app_name, _observer, source, run_loop = watched
+        CFRunLoopRemoveSource(run_loop, source, kCFRunLoopDefaultMode)
+        self._drop_from_cache(app_name)
+
+    def _get_title_via_applescript(
+        self, app_name: str, mapped_name: Optional[str] = None
+    ) -> Optional[str]:
         """Get window title using AppleScript with timeout and metrics."""
-        if app_name in ["Visual Studio Code", "Code"]:
-            script = (
-                'tell application "System Events"\n'
-                "try\n"
-                'if exists process "Code" then\n'
-                'set frontWindow to front window of process "Code"\n'
-                "return title of frontWindow\n"
-                "end if\n"
-                "end try\n"
-                "end tell\n"
-                'return ""'
-            )
-        else:
+        if mapped_name is None:
             mapped_name = self.APP_MAPPING[app_name]
-            script = (
-                f'tell application "{mapped_name}"\n'
-                "try\n"
-                "if (count of windows) > 0 then\n"
-                "return name of front window\n"
-                "end if\n"
-                "end try\n"
-                "end tell\n"
-                'return ""'
-            )
+
+        if self._helper is not None:
+            try:
+                return self._get_title_via_helper(mapped_name)
+            except OSError as e:
+                log.warning("AppleScript helper unavailable: %s", e)
+                self._helper = None
+
+        command = self.COMMANDS[mapped_name]
 
         try:
-            self._metrics["applescript_calls"] += 1
+            self._metrics.applescript_calls += 1
             start_time = time.time()
 
             result = subprocess.run(
-                ["/usr/bin/osascript", "-e", script],  # nosec B603
+                command,  # nosec B603
                 capture_output=True,
-                text=True,
                 timeout=self.applescript_timeout,
             )
 
             elapsed = time.time() - start_time
-            self._metrics["applescript_total_time"] += elapsed
+            self._metrics.applescript_total_time += elapsed
 
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip()
+            # Decode once as UTF-8, independent of the locale
+            output = result.stdout.strip()
+            if result.returncode == 0 and output:
+                return output.decode("utf-8", errors="replace")
         except subprocess.TimeoutExpired:
-            self._metrics["applescript_timeouts"] += 1
+            self._metrics.applescript_timeouts += 1
             # Fallback to Quartz will be handled by the caller
             pass
 
         return None
 
+    def _get_title_via_helper(self, mapped_name: str) -> Optional[str]:
+        """Get window title through the persistent AppleScript helper."""
+        helper = cast(AppleScriptHelper, self._helper)
+        self._metrics.applescript_calls += 1
+        start_time = time.time()
+        try:
+            return helper.query(mapped_name, self.applescript_timeout)
+        except subprocess.TimeoutExpired:
+            self._metrics.applescript_timeouts += 1
+            return None
+        finally:
+            self._metrics.applescript_total_time += time.time() - start_time
+
     def _get_title_via_quartz(
         self, app_name: str, count_as_fallback: bool = True
     ) -> Optional[str]:
         """Get window title using Quartz framework."""
         if count_as_fallback:
-            self._metrics["quartz_fallbacks"] += 1
+            self._metrics.quartz_fallbacks += 1
         try:
-            window_list = CGWindowListCopyWindowInfo(
-                kCGWindowListOptionOnScreenOnly, kCGNullWindowID
-            )
+            window_index = self._get_window_index()
 
-            for window in window_list:
-                owner_name = window.get("kCGWindowOwnerName", "")
-                if owner_name == app_name:
-                    window_title = window.get("kCGWindowName", "")
-                    if window_title and window_title.strip():
-                        return window_title
+            for window in window_index.get(app_name, ()):
+                window_title = window.get("kCGWindowName", "")
+                if window_title and window_title.strip():
+                    return window_title
 
-            # Special handling for VS Code
-            if app_name in ["Code", "Visual Studio Code"]:
-                return self._get_vscode_fallback_title(window_list)
+            if app_name in self.VSCODE_NAMES:
+                for owner_name in self.VSCODE_NAMES:
+                    for window in window_index.get(owner_name, ()):
+                        if self._is_editor_window(window):
+                            return "Editor Window"
 
         except (KeyError, TypeError, RuntimeError) as e:
-            print(f"Warning: Failed to get window title: {e}")
+            log.warning("Failed to get window title: %s", e)
 
         return None
 
-    def _get_vscode_fallback_title(self, window_list) -> Optional[str]:
-        """Fallback method for VS Code window detection."""
-        for window in window_list:
+    def _get_window_index(self) -> dict[str, list[dict]]:
+        """
+        Get on-screen windows grouped by owner name.
+
+        The index is built from one Quartz snapshot and reused by lookups
+        within the same tick, so each lookup is a single dict access.
+        """
+        now = time.monotonic()
+        if (
+            self._window_index is not None
+            and now - self._window_list_time < self.WINDOW_LIST_TTL
+        ):
+            return self._window_index
+
+        # Desktop icons and wallpaper never carry a title, so keep them out of
+        # the snapshot rather than bridging them into Python
+        window_list = CGWindowListCopyWindowInfo(
+            kCGWindowListOptionOnScreenOnly | kCGWindowListExcludeDesktopElements,
+            kCGNullWindowID,
+        )
+        window_index: dict[str, list[dict]] = {}
+        for window in window_list or ():
             owner_name = window.get("kCGWindowOwnerName", "")
-            if owner_name in ["Code", "Visual Studio Code"]:
-                window_layer = window.get("kCGWindowLayer", 0)
-                window_bounds = window.get("kCGWindowBounds", {})
-                if (
-                    window_layer == 0
-                    and window_bounds.get("Width", 0) > 200
-                    and window_bounds.get("Height", 0) > 200
-                ):
-                    return "Editor Window"
-        return None
+            window_index.setdefault(owner_name, []).append(window)
+
+        self._window_index = window_index
+        self._window_list_time = now
+        return window_index
+
+    def invalidate(self) -> None:
+        """Drop the window list snapshot, e.g. after the frontmost app changed."""
+        self._window_index = None
+
+    @staticmethod
+    def _is_editor_window(window) -> bool:
+        """Check if a window looks like a main VS Code editor window."""
+        window_bounds = window.get("kCGWindowBounds", {})
+        return (
+            window.get("kCGWindowLayer", 0) == 0
+            and window_bounds.get("Width", 0) > 200
+            and window_bounds.get("Height", 0) > 200
+        )
 
 
 class IdleDetector:
@@ -241,6 +801,8 @@ class IdleDetector:
         self.idle_threshold = idle_threshold
         self.is_idle = False
         self.idle_start_time: Optional[float] = None
+        # Earliest wall time the threshold can be reached, for lazy checks
+        self._next_check = 0.0
 
     def get_system_idle_time(self) -> float:
         """Get system idle time in seconds."""
@@ -249,30 +811,49 @@ class IdleDetector:
                 kCGEventSourceStateHIDSystemState, kCGAnyInputEventType
             )
         except (RuntimeError, OSError) as e:
-            print(f"Error getting system idle time: {e}")
+            log.error("Error getting system idle time: %s", e)
             return 0.0
 
-    def check_idle_state(self) -> bool:
-        """Check if system is currently idle."""
+    def check_idle_state(self, lazy: bool = False) -> Tuple[bool, float]:
+        """
+        Check if system is currently idle.
+
+        Returns (changed, idle_time): whether the idle state just flipped,
+        and the idle time it was decided on, so callers need not query again.
+
+        Idle time grows no faster than the clock, so once a query finds the
+        user active the threshold cannot be reached for another
+        idle_threshold - idle_time seconds. With lazy=True the query is
+        skipped until then and (False, 0.0) is returned.
+        """
+        if lazy and not self.is_idle and time.time() < self._next_check:
+            return False, 0.0
+
         idle_time = self.get_system_idle_time()
-        current_time = time.time()
+        self._next_check = time.time() + self.idle_threshold - idle_time
 
         if idle_time >= self.idle_threshold:
             if not self.is_idle:
                 self.is_idle = True
-                self.idle_start_time = current_time
-                return True  # Just became idle
-            return False  # Already idle
+                self.idle_start_time = time.time()
+                return True, idle_time  # Just became idle
+            return False, idle_time  # Already idle
         else:
             if self.is_idle:
                 self.is_idle = False
                 self.idle_start_time = None
-                return True  # Just became active
-            return False  # Already active
+                return True, idle_time  # Just became active
+            return False, idle_time  # Already active
 
-    def get_idle_transition_info(self) -> tuple[bool, Optional[float]]:
-        """Get idle state and time information for activity recording."""
-        idle_time = self.get_system_idle_time()
+    def get_idle_transition_info(
+        self, idle_time: Optional[float] = None
+    ) -> tuple[bool, Optional[float]]:
+        """Get idle state and time information for activity recording.
+
+        Pass the idle_time from check_idle_state() to skip a second query.
+        """
+        if idle_time is None:
+            idle_time = self.get_system_idle_time()
         current_time = time.time()
 
         if idle_time >= self.idle_threshold and not self.is_idle:
@@ -303,6 +884,14 @@ class TitleCleaner:
         "\u2717": "x",  # Ballot X
     }
 
+    # All replacements are single characters, so one translate() pass does
+    # them; entries mapping a character to itself are left out of the table
+    UNICODE_TRANSLATION = str.maketrans(
+        {char: repl for char, repl in UNICODE_REPLACEMENTS.items() if char != repl}
+    )
+
+    VSCODE_SUFFIXES = (" — Visual Studio Code", " - Visual Studio Code")
+
     # Spinner characters used in terminal progress indicators
     SPINNER_CHARS = set(
         # Braille patterns (common spinners)
@@ -329,27 +918,26 @@ class TitleCleaner:
         if not title:
             return title
 
-        # Normalize Unicode
-        try:
-            import unicodedata
-
-            title = unicodedata.normalize("NFC", title)
-        except (TypeError, ValueError) as e:
-            print(f"Warning: Failed to normalize Unicode in title: {e}")
+        # ASCII titles are already NFC and contain no replaceable characters
+        if not title.isascii():
+            try:
+                title = _normalize("NFC", title)
+            except (TypeError, ValueError) as e:
+                log.warning("Failed to normalize Unicode in title: %s", e)
 
-        # Apply replacements
-        for unicode_char, replacement in self.UNICODE_REPLACEMENTS.items():
-            title = title.replace(unicode_char, replacement)
+            title = title.translate(self.UNICODE_TRANSLATION)
 
         # Strip spinner prefixes only for terminal apps
         if not app_name or app_name in self.TERMINAL_APPS:
             title = self._strip_spinner_prefix(title)
 
-        # VS Code specific cleaning
-        if title.endswith(" — Visual Studio Code"):
-            title = title[:-21]
-        elif title.endswith(" - Visual Studio Code"):
-            title = title[:-21]
+        # VS Code specific cleaning; one C-level check rejects other titles
+        if title.endswith(self.VSCODE_SUFFIXES):
+            for suffix in self.VSCODE_SUFFIXES:
+                trimmed = title.removesuffix(suffix)
+                if len(trimmed) != len(title):
+                    title = trimmed
+                    break
 
         return title
 
@@ -4,12 +4,43 @@ HTTP synchronization client for Pulse.
 Handles all HTTP communication with remote endpoints.
 """
 
+import functools
+import gzip
+import json
 import platform
 import socket
 from datetime import datetime
-from typing import Dict
+from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a request body to UTF-8 JSON bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=512)
+def _hour_timestamp(hour_key: str) -> str:
+    """
+    ISO timestamp for a "YYYY-MM-DD_HH" hour key.
+
+    The key has a fixed width, so it is sliced instead of going through
+    strptime. Raises ValueError for a malformed key.
+    """
+    if len(hour_key) != 13 or hour_key[10] != "_":
+        raise ValueError(f"invalid hour key: {hour_key!r}")
+    year, month, day = hour_key[0:4], hour_key[5:7], hour_key[8:10]
+    hour = hour_key[11:13]
+    return datetime(int(year), int(month), int(day), int(hour)).isoformat()
 
 
 class DeviceIdentifier:
@@ -39,30 +70,66 @@ class DeviceIdentifier:
 class SyncPayloadBuilder:
     """Builds payloads for sync endpoints."""
 
+    # Fields that are the same in every payload
+    PAYLOAD_TEMPLATE = {"source": "macos-pulse", "version": "1.0"}
+
     def __init__(self):
         self.device_identifier = DeviceIdentifier()
+        # Resolved on the first payload; the hostname is fixed for a sync run
+        self._device_name: Optional[str] = None
 
     def create_sync_payload(self, hour_key: str, hour_data: Dict) -> Dict:
         """Create payload for sync endpoint."""
-        dt = datetime.strptime(hour_key, "%Y-%m-%d_%H")
+        timestamp = _hour_timestamp(hour_key)
+
+        device_name = self._device_name
+        if device_name is None:
+            device_name = self._device_name = self.device_identifier.get_device_name()
 
-        return {
-            "timestamp": dt.isoformat(),
-            "hour": hour_key,
-            "data": hour_data,
-            "source": "macos-pulse",
-            "device": self.device_identifier.get_device_name(),
-            "version": "1.0",
-        }
+        payload = {"timestamp": timestamp, "hour": hour_key, "data": hour_data}
+        payload.update(self.PAYLOAD_TEMPLATE)
+        payload["device"] = device_name
+        return payload
 
 
 class HttpSyncClient:
     """HTTP client for syncing data to remote endpoints."""
 
-    def __init__(self, endpoint: str, auth_token: str = ""):  # nosec B107
+    # Transient failures retried by the connection pool, with 0.2s, 0.4s, ...
+    # between attempts. POST is only retried when the request was never sent.
+    RETRY = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 502, 503, 504),
+        raise_on_status=False,
+    )
+
+    # Most hourly payloads sent in one batch request, bounding the body size
+    BATCH_SIZE = 100
+
+    # gzip level for request bodies; repetitive JSON compresses well at level 3
+    GZIP_LEVEL = 3
+
+    def __init__(
+        self,
+        endpoint: str,
+        auth_token: str = "",  # nosec B107
+        compress: bool = False,
+    ):
         self.endpoint = endpoint
         self.auth_token = auth_token
+        # gzip request bodies; switched off if the endpoint answers 415
+        self.compress = compress
         self.payload_builder = SyncPayloadBuilder()
+        self._headers = self._get_headers()
+        self._gzip_headers = {**self._headers, "Content-Encoding": "gzip"}
+        # One keep-alive session, so consecutive syncs share a connection
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=4, max_retries=self.RETRY
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         self._warn_if_insecure()
 
     def _warn_if_insecure(self) -> None:
@@ -81,17 +148,34 @@ class HttpSyncClient:
             headers["Authorization"] = f"Bearer {self.auth_token}"
         return headers
 
+    def _post(self, data: Any) -> requests.Response:
+        """POST data as JSON, gzip-compressed when compression is enabled."""
+        body = _dumps(data)
+        if self.compress:
+            response = self._session.post(
+                self.endpoint,
+                data=gzip.compress(body, compresslevel=self.GZIP_LEVEL),
+                headers=self._gzip_headers,
+                timeout=(5, 15),  # 5s connect, 15s read
+            )
+            if response.status_code != 415:
+                return response
+            # Unsupported Media Type: the endpoint cannot decode gzip bodies
+            print("[WARN] Sync endpoint rejected gzip; sending uncompressed")
+            self.compress = False
+        return self._session.post(
+            self.endpoint,
+            data=body,
+            headers=self._headers,
+            timeout=(5, 15),  # 5s connect, 15s read
+        )
+
     def sync_hour_data(self, hour_key: str, hour_data: Dict) -> bool:
         """Sync single hour of data to endpoint."""
         payload = self.payload_builder.create_sync_payload(hour_key, hour_data)
 
         try:
-            response = requests.post(
-                self.endpoint,
-                json=payload,
-                headers=self._get_headers(),
-                timeout=(5, 15),  # 5s connect, 15s read
-            )
+            response = self._post(payload)
 
             if response.status_code in [200, 201]:
                 print(
@@ -113,11 +197,62 @@ class HttpSyncClient:
             print(f"[FAIL] Error syncing {hour_key}: {e}")
             return False
 
+    def sync_hours(self, items: Dict[str, Dict]) -> Dict[str, bool]:
+        """
+        Sync several hours with one POST per BATCH_SIZE hours.
+
+        Each request body is a JSON array of hourly payloads. The endpoint
+        may answer with a JSON array holding one boolean per payload;
+        otherwise a 200/201 status marks the whole batch as synced.
+        Returns whether each hour_key was synced.
+        """
+        results: Dict[str, bool] = {}
+        hour_keys = list(items)
+        for start in range(0, len(hour_keys), self.BATCH_SIZE):
+            end = start + self.BATCH_SIZE
+            batch = hour_keys[start:end]
+            results.update(zip(batch, self._post_batch(batch, items)))
+        return results
+
+    def _post_batch(self, hour_keys: List[str], items: Dict[str, Dict]) -> List[bool]:
+        """POST one batch of hours and return the per-hour outcome."""
+        span = f"{hour_keys[0]}..{hour_keys[-1]}"
+        try:
+            payloads = [
+                self.payload_builder.create_sync_payload(key, items[key])
+                for key in hour_keys
+            ]
+            response = self._post(payloads)
+        except requests.exceptions.RequestException as e:
+            print(f"[FAIL] Network error syncing {span}: {e}")
+            return [False] * len(hour_keys)
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"[FAIL] Error syncing {span}: {e}")
+            return [False] * len(hour_keys)
+
+        if response.status_code not in [200, 201]:
+            print(
+                f"[FAIL] Sync failed for {span}: "
+                f"HTTP {response.status_code} - {response.text}"
+            )
+            return [False] * len(hour_keys)
+
+        try:
+            statuses = response.json()
+        except ValueError:
+            statuses = None
+        if isinstance(statuses, list) and len(statuses) == len(hour_keys):
+            outcome = [bool(status) for status in statuses]
+        else:
+            outcome = [True] * len(hour_keys)
+        print(f"[OK] Synced {sum(outcome)} of {len(hour_keys)} hours ({span})")
+        return outcome
+
     def test_connection(self) -> bool:
         """Test connection to the sync endpoint."""
         try:
             # Simple GET request to test connectivity
-            response = requests.get(
+            response = self._session.get(
                 self.endpoint, timeout=(3, 10)
             )  # 3s connect, 10s read
             return response.status_code < 500
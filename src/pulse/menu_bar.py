@@ -4,10 +4,8 @@ Menu Bar Application for Pulse
 Shows a menu bar icon when the tracker is running.
 """
 
-import subprocess  # nosec B404 - Required for macOS Finder integration
 import sys
 import threading
-import time
 from pathlib import Path
 
 try:
@@ -20,8 +18,9 @@ try:
         NSMenuItem,
         NSStatusBar,
         NSVariableStatusItemLength,
+        NSWorkspace,
     )
-    from Foundation import NSObject, NSTimer
+    from Foundation import NSURL, NSObject
 except ImportError:
     print(
         "Error: pyobjc-framework-Cocoa not installed. "
@@ -55,10 +54,17 @@ class PulseMenuBarDelegate(NSObject):
         self.tracker = None
         self.tracker_thread = None
         self.is_running = False
+        # Set while a restart waits for the old tracker to exit, and whether
+        # the new tracker should still start then; the menu shows the latter
+        self._restart_pending = False
+        self._restart_wanted = False
         self.verbose_mode: bool = True
         self.fast_mode: bool = False
         self.idle_threshold: int = 300
+        # Glyph last drawn in the menu bar, so unchanged icons are not redrawn
+        self._last_icon = None
         self.sync_manager = SyncManager(data_dir=str(get_data_directory()))
+        self.sync_thread = None
 
         # Create status bar item
         self.status_bar = NSStatusBar.systemStatusBar()
@@ -69,15 +75,8 @@ class PulseMenuBarDelegate(NSObject):
         # Set up the menu
         self.setup_menu()
 
-        # Set initial icon
-        self.update_icon()
-
-        # Start timer to update status
-        self.timer = (
-            NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-                2.0, self, "updateStatus:", None, True
-            )
-        )
+        # Show the initial state; actions that change it refresh the menu
+        self.updateStatus_(None)
 
         return self
 
@@ -155,18 +154,34 @@ class PulseMenuBarDelegate(NSObject):
         # Set the menu
         self.status_item.setMenu_(self.menu)
 
+    def _shows_running(self) -> bool:
+        """Whether the menu presents tracking as running."""
+        if self._restart_pending:
+            return self._restart_wanted
+        return self.is_running
+
     def update_icon(self):
         """Update the menu bar icon based on tracking status."""
+        # Filled circle for running, empty circle for stopped
+        glyph = "●" if self._shows_running() else "○"
+        if glyph == self._last_icon:
+            return
         button = self.status_item.button()
-        if self.is_running:
-            button.setTitle_("●")  # Filled circle for running
-        else:
-            button.setTitle_("○")  # Empty circle for stopped
+        button.setTitle_(glyph)
+        # Accessory apps do not always repaint the status item on their own
+        button.setNeedsDisplay_(True)
+        button.display()
+        self._last_icon = glyph
 
     @objc.IBAction
-    def updateStatus_(self, timer):
-        """Update the status display."""
-        if self.is_running:
+    def updateStatus_(self, sender):
+        """
+        Update the status display.
+
+        Called after every change to the tracking state or modes, rather
+        than on a timer, so an unchanged menu costs no wakeups.
+        """
+        if self._shows_running():
             self.status_menu_item.setTitle_("Status: Running")
             self.toggle_item.setTitle_("Stop Tracking")
         else:
@@ -191,6 +206,11 @@ class PulseMenuBarDelegate(NSObject):
     def toggleTracking_(self, sender):
         """Toggle tracking on/off."""
         print(f"Toggle tracking called, is_running: {self.is_running}")
+        if self._restart_pending:
+            # The old tracker is still saving; decide once it has exited
+            self._restart_wanted = not self._restart_wanted
+            self.updateStatus_(None)
+            return
         if self.is_running:
             self.stop_tracking()
         else:
@@ -218,6 +238,7 @@ class PulseMenuBarDelegate(NSObject):
                 mode_desc = " (verbose logging with window titles)"
 
             print(f"Tracking started{mode_desc}")
+            self.updateStatus_(None)
 
     def stop_tracking(self):
         """Stop the Pulse."""
@@ -225,6 +246,43 @@ class PulseMenuBarDelegate(NSObject):
             self.tracker.stop()
             self.is_running = False
             print("Tracking stopped")
+            self.updateStatus_(None)
+
+    def restart_tracking(self):
+        """
+        Restart the tracker with the current modes.
+
+        The new tracker starts only once the old thread has saved its final
+        data and exited. The wait happens off the main thread, which hears
+        back through restartTracking:. Until then, Start/Stop only records
+        whether the new tracker should still be started.
+        """
+        old_thread = self.tracker_thread
+        if old_thread is None:
+            self.stop_tracking()
+            self.start_tracking()
+            return
+
+        self._restart_pending = self._restart_wanted = True
+        self.stop_tracking()
+
+        def wait_then_restart():
+            old_thread.join()
+            self.performSelectorOnMainThread_withObject_waitUntilDone_(
+                "restartTracking:", None, False
+            )
+
+        threading.Thread(target=wait_then_restart, daemon=True).start()
+
+    @objc.IBAction
+    def restartTracking_(self, sender):
+        """Start the replacement tracker once the old one has stopped."""
+        wanted = self._restart_wanted
+        self._restart_pending = self._restart_wanted = False
+        if wanted:
+            self.start_tracking()
+        else:
+            self.updateStatus_(None)
 
     @objc.IBAction
     def toggleVerbose_(self, sender):
@@ -235,10 +293,9 @@ class PulseMenuBarDelegate(NSObject):
         # Restart tracking with new verbose setting if currently running
         if self.is_running:
             print("Restarting tracker with new verbose setting...")
-            self.stop_tracking()
-            # Small delay to ensure clean shutdown
-            time.sleep(0.5)
-            self.start_tracking()
+            self.restart_tracking()
+        else:
+            self.updateStatus_(None)
 
     @objc.IBAction
     def toggleFastMode_(self, sender):
@@ -258,67 +315,90 @@ class PulseMenuBarDelegate(NSObject):
         # Restart tracking with new mode if currently running
         if self.is_running:
             print("Restarting tracker with new mode...")
-            self.stop_tracking()
-            time.sleep(0.5)
-            self.start_tracking()
+            self.restart_tracking()
+        else:
+            self.updateStatus_(None)
 
     @objc.IBAction
     def syncData_(self, sender):
         """Sync activity data to remote endpoint."""
+        if self.sync_thread is not None and self.sync_thread.is_alive():
+            print("Sync already in progress")
+            return
+
         # Show starting alert
         start_alert = NSAlert.alloc().init()
         start_alert.setAlertStyle_(NSAlertStyleInformational)
         start_alert.setMessageText_("Starting Sync")
         start_alert.setInformativeText_(
             "Syncing activity data to remote endpoint...\n\n"
-            "This may take a few moments."
+            "You will be notified when it finishes."
         )
         start_alert.addButtonWithTitle_("OK")
         start_alert.runModal()
 
-        try:
-            # Run sync synchronously for simplicity
-            results = self.sync_manager.sync_all()
-
-            # Show completion alert
-            alert = NSAlert.alloc().init()
-            alert.setAlertStyle_(NSAlertStyleInformational)
-            alert.setMessageText_("Sync Completed")
-
-            if results["failed"] > 0:
-                alert_text = (
-                    f"[WARN] {results['failed']} hours failed to sync.\n"
-                    f"Check network connection.\n\n"
-                    f"Synced: {results['synced']}\nSkipped: {results['skipped']}"
-                )
-            elif results["synced"] > 0:
-                alert_text = (
-                    f"[OK] Successfully synced {results['synced']} hours of data\n\n"
-                    f"Skipped: {results['skipped']} (already synced)"
-                )
-            else:
-                alert_text = "[INFO] All data already synced\n\nNo new data to upload"
-
-            alert.setInformativeText_(alert_text)
-            alert.addButtonWithTitle_("OK")
-            alert.runModal()
-
-            # Also print to terminal for debugging
-            print(
-                f"Sync completed: {results['synced']} synced, "
-                f"{results['failed']} failed, {results['skipped']} skipped"
-            )
+        # Upload off the main thread so the menu bar stays responsive
+        self.sync_thread = threading.Thread(target=self.run_sync, daemon=True)
+        self.sync_thread.start()
 
+    @objc.python_method
+    def run_sync(self):
+        """Run the sync on a worker thread and report back on the main thread."""
+        try:
+            outcome: dict = {"results": self.sync_manager.sync_all()}
         except Exception as e:
+            outcome = {"error": str(e)}
+        self.performSelectorOnMainThread_withObject_waitUntilDone_(
+            "syncFinished:", outcome, False
+        )
+
+    @objc.IBAction
+    def syncFinished_(self, outcome):
+        """Show the result of a background sync."""
+        if "error" in outcome:
             # Show error alert
             error_alert = NSAlert.alloc().init()
             error_alert.setAlertStyle_(NSAlertStyleInformational)
             error_alert.setMessageText_("Sync Error")
-            error_alert.setInformativeText_(f"Error during sync: \n\n{str(e)}")
+            error_alert.setInformativeText_(
+                f"Error during sync: \n\n{outcome['error']}"
+            )
             error_alert.addButtonWithTitle_("OK")
             error_alert.runModal()
 
-            print(f"[FAIL] Sync error: {e}")
+            print(f"[FAIL] Sync error: {outcome['error']}")
+            return
+
+        results = outcome["results"]
+
+        # Show completion alert
+        alert = NSAlert.alloc().init()
+        alert.setAlertStyle_(NSAlertStyleInformational)
+        alert.setMessageText_("Sync Completed")
+
+        if results["failed"] > 0:
+            alert_text = (
+                f"[WARN] {results['failed']} hours failed to sync.\n"
+                f"Check network connection.\n\n"
+                f"Synced: {results['synced']}\nSkipped: {results['skipped']}"
+            )
+        elif results["synced"] > 0:
+            alert_text = (
+                f"[OK] Successfully synced {results['synced']} hours of data\n\n"
+                f"Skipped: {results['skipped']} (already synced)"
+            )
+        else:
+            alert_text = "[INFO] All data already synced\n\nNo new data to upload"
+
+        alert.setInformativeText_(alert_text)
+        alert.addButtonWithTitle_("OK")
+        alert.runModal()
+
+        # Also print to terminal for debugging
+        print(
+            f"Sync completed: {results['synced']} synced, "
+            f"{results['failed']} failed, {results['skipped']} skipped"
+        )
 
     @objc.IBAction
     def showSyncStatus_(self, sender):
@@ -359,15 +439,17 @@ Last sync: {status['last_sync'] if status['last_sync'] else 'Never'}"""
     def openDataFolder_(self, sender):
         """Open the data folder in Finder."""
         data_path = get_data_directory()
-        subprocess.run(
-            ["/usr/bin/open", str(data_path)], check=False
-        )  # nosec B603 - Safe macOS open command
+        # Ask Finder directly rather than spawning /usr/bin/open
+        NSWorkspace.sharedWorkspace().openURL_(NSURL.fileURLWithPath_(str(data_path)))
 
     @objc.IBAction
     def quitApp_(self, sender):
         """Quit the application."""
         if self.is_running:
             self.stop_tracking()
+        # Let the tracker flush its queued minute saves before exiting
+        if self.tracker_thread is not None:
+            self.tracker_thread.join()
         NSApplication.sharedApplication().terminate_(None)
 
 
@@ -394,8 +476,6 @@ class MenuBarApp:
 
 def main():
     """Main entry point."""
-    import sys
-
     # Prevent running multiple instances
     try:
         app = MenuBarApp()
@@ -5,9 +5,30 @@ Handles all file I/O operations and data management.
 """
 
 import json
+import os
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(data: Dict[str, float]) -> bytes:
+    """Serialize minute data to indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Deserialize JSON bytes, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 class ActivityDataStore:
@@ -26,45 +47,61 @@ class ActivityDataStore:
     def load_existing_data(self, filename: str) -> Dict[str, float]:
         """Load existing data from file."""
         filepath = self.data_dir / filename
-        if not filepath.exists():
-            return {}
-
+        # Usually the minute's first save, so try the open rather than stat first
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
+            with open(filepath, "rb") as f:
+                return _loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError:  # orjson's decode error subclasses it
             return {}
 
     def save_data(self, data: Dict[str, float], filename: str) -> None:
-        """Save data to file with 2 decimal precision."""
+        """Save data to file with 2 decimal precision.
+
+        The data is written and fsynced to a temporary file which then
+        atomically replaces the target, so a crash never leaves a torn file.
+        """
         if not data:
             return
 
-        # Filter out noise values (< 0.01s), then round to 2 decimal places
+        # Round to 2 decimal places in one pass, dropping noise that rounds
+        # below 0.01s
         rounded_data = {
-            app: round(duration, 2)
+            app: rounded
             for app, duration in data.items()
-            if duration >= 0.01
+            if (rounded := round(duration, 2)) >= 0.01
         }
 
         if not rounded_data:
             return
 
         filepath = self.data_dir / filename
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(rounded_data, f, indent=2, ensure_ascii=False)
-
-    def merge_and_save_session_data(self, session_data: Dict[str, float]) -> None:
-        """Merge session data with existing data and save."""
+        tmp_path = filepath.with_suffix(".json.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps(rounded_data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+
+    def merge_and_save_session_data(
+        self, session_data: Dict[str, float], filename: Optional[str] = None
+    ) -> None:
+        """Merge session data with existing data and save.
+
+        Writes to the current minute's file unless an explicit filename is given.
+        """
         if not session_data:
             return
 
-        filename = self.get_current_minute_filename()
+        if filename is None:
+            filename = self.get_current_minute_filename()
         existing_data = self.load_existing_data(filename)
 
-        # Merge with current session data (round to 2 decimals)
+        # Merge with current session data; save_data rounds each total once
+        get = existing_data.get
         for app, duration in session_data.items():
-            existing_data[app] = round(existing_data.get(app, 0) + duration, 2)
+            existing_data[app] = get(app, 0) + duration
 
         self.save_data(existing_data, filename)
 
@@ -73,23 +110,23 @@ class SessionTracker:
     """Tracks activity for the current session."""
 
     def __init__(self):
-        self.current_session: Dict[str, float] = {}
+        # Missing apps start at 0.0, so adding time is a single += per call
+        self.current_session: Dict[str, float] = defaultdict(float)
 
     def add_activity(self, app_name: str, duration: float) -> None:
         """Add activity duration for an application."""
         if app_name and duration > 0:
-            self.current_session[app_name] = (
-                self.current_session.get(app_name, 0) + duration
-            )
+            self.current_session[app_name] += duration
 
     def get_session_data(self) -> Dict[str, float]:
         """Get current session data."""
-        return self.current_session.copy()
+        return dict(self.current_session)
 
     def clear_session(self) -> Dict[str, float]:
         """Clear and return current session data."""
-        data = self.current_session.copy()
-        self.current_session.clear()
+        # Hand over the accumulated dict and start a fresh one, with no copy
+        data = self.current_session
+        self.current_session = defaultdict(float)
         return data
 
     def get_total_time(self) -> float:
@@ -4,6 +4,7 @@ Sync Manager for Pulse
 Orchestrates data aggregation and HTTP synchronization.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
 
 from .data_aggregator import DataAggregator, SyncStateManager
@@ -13,19 +14,27 @@ from .http_sync import DeviceIdentifier, HttpSyncClient, SyncResultCollector
 class SyncManager:
     """Orchestrates data aggregation and HTTP synchronization."""
 
+    # Hours uploaded in parallel by sync_all; matches the client's pool size
+    SYNC_CONCURRENCY = 4
+
     def __init__(
         self,
         data_dir: str = "activity_data",
         endpoint: str = "",
         auth_token: str = "",  # nosec B107
+        batch: bool = False,
+        compress: bool = False,
     ):
         self.endpoint = endpoint
         self.auth_token = auth_token
+        # Send pending hours in batch requests; the endpoint must accept a
+        # JSON array of hourly payloads
+        self.batch = batch
 
         # Use composition - inject specialized components
         self.data_aggregator = DataAggregator(data_dir)
         self.sync_state = SyncStateManager(data_dir)
-        self.http_client = HttpSyncClient(endpoint, auth_token)
+        self.http_client = HttpSyncClient(endpoint, auth_token, compress=compress)
         self.device_identifier = DeviceIdentifier()
 
     def sync_hour(self, hour_key: str, hour_data: Dict, force: bool = False) -> bool:
@@ -41,6 +50,7 @@ class SyncManager:
         success = self.http_client.sync_hour_data(hour_key, hour_data)
         if success:
             self.sync_state.mark_hour_synced(hour_key)
+            self.sync_state.flush()
 
         return success
 
@@ -68,21 +78,47 @@ class SyncManager:
 
         print(f"Syncing {len(sorted_hours)} hours of data...")
 
-        for hour_key in sorted_hours:
-            if not force and self.sync_state.is_hour_synced(hour_key):
-                result_collector.record_sync_skip()
-                continue
-
-            file_paths = files_by_hour[hour_key]
-            hour_data = self.data_aggregator.aggregate_hour_data(file_paths)
-
-            if self.sync_hour(hour_key, hour_data, force):
+        pending = {}
+        # Minute files of every pending hour are read through one pool
+        with ThreadPoolExecutor(max_workers=DataAggregator.LOAD_WORKERS) as executor:
+            for hour_key in sorted_hours:
+                if not force and self.sync_state.is_hour_synced(hour_key):
+                    result_collector.record_sync_skip()
+                    continue
+
+                file_paths = files_by_hour[hour_key]
+                pending[hour_key] = self.data_aggregator.aggregate_hour_data(
+                    file_paths, executor
+                )
+
+        if self.batch:
+            outcomes = self.http_client.sync_hours(pending) if pending else {}
+        else:
+            outcomes = self._sync_concurrently(pending)
+
+        # Sync state is updated here, on the calling thread, in hour order,
+        # and written to disk once for the whole run
+        for hour_key, success in outcomes.items():
+            if success:
+                self.sync_state.mark_hour_synced(hour_key)
                 result_collector.record_sync_success()
             else:
                 result_collector.record_sync_failure()
+        self.sync_state.flush()
 
         return result_collector.get_results()
 
+    def _sync_concurrently(self, pending: Dict[str, Dict]) -> Dict[str, bool]:
+        """Upload hours over up to SYNC_CONCURRENCY parallel requests."""
+        if not pending:
+            return {}
+        workers = min(self.SYNC_CONCURRENCY, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = executor.map(
+                self.http_client.sync_hour_data, pending.keys(), pending.values()
+            )
+            return dict(zip(pending, outcomes))
+
     def get_sync_status(self) -> Dict:
         """Get current sync status."""
         files_by_hour = self.data_aggregator.group_files_by_hour()
@@ -107,8 +143,13 @@ def main():
     # Get configuration from environment variables
     endpoint = os.getenv("PULSE_ENDPOINT", "")
     auth_token = os.getenv("PULSE_AUTH_TOKEN", "")
+    enabled = ("1", "true", "yes", "on")
+    batch = os.getenv("PULSE_SYNC_BATCH", "").lower() in enabled
+    compress = os.getenv("PULSE_SYNC_GZIP", "").lower() in enabled
 
-    sync_manager = SyncManager(endpoint=endpoint, auth_token=auth_token)
+    sync_manager = SyncManager(
+        endpoint=endpoint, auth_token=auth_token, batch=batch, compress=compress
+    )
 
     if len(sys.argv) == 1 or "--help" in sys.argv:
         print("Sync Manager for Pulse")
@@ -121,6 +162,8 @@ def main():
         print("\nEnvironment Variables:")
         print("  PULSE_ENDPOINT      Sync endpoint URL (required for sync)")
         print("  PULSE_AUTH_TOKEN    Bearer token for authentication")
+        print("  PULSE_SYNC_BATCH    Send hours in batch requests (1/true)")
+        print("  PULSE_SYNC_GZIP     Gzip-compress request bodies (1/true)")
         return
 
     command = sys.argv[1]
@@ -11,7 +11,15 @@ import pytest
 if "AppKit" not in sys.modules:
     sys.modules["AppKit"] = MagicMock()
     sys.modules["Quartz"] = MagicMock()
+    # Behave as if Accessibility access has not been granted
+    application_services = MagicMock()
+    application_services.kAXErrorSuccess = 0
+    application_services.kAXErrorAPIDisabled = -25211
+    application_services.AXUIElementCopyAttributeValue.return_value = (-25211, None)
+    sys.modules["ApplicationServices"] = application_services
+    sys.modules["CoreFoundation"] = MagicMock()
     sys.modules["Foundation"] = MagicMock()
+    sys.modules["objc"] = MagicMock()
 
 
 @pytest.fixture
@@ -56,6 +56,7 @@ class TestActivityMonitor(unittest.TestCase):
         self.assertTrue(self.monitor.include_window_titles)
         self.assertEqual(self.monitor.debounce_delay, 1.0)
         self.assertIsNone(self.monitor.last_stable_app)
+        self.assertIsNone(self.monitor.pending_app)
         self.assertIsNone(self.monitor.app_change_time)
 
     def test_initialization_without_window_titles(self):
@@ -106,6 +107,147 @@ class TestActivityMonitor(unittest.TestCase):
         self.assertEqual(result, {"App1": 30.0})
         self.assertEqual(self.monitor.session_tracker.current_session, {})
 
+    def test_get_current_activity_caches_cleaned_titles(self):
+        """Test repeated window titles reuse the cached cleaned name."""
+        self.monitor.app_detector.get_active_application = MagicMock(
+            return_value="Safari"
+        )
+        self.monitor.window_detector.get_window_title = MagicMock(return_value="GitHub")
+        self.monitor.title_cleaner.clean_title = MagicMock(return_value="GitHub")
+
+        first = self.monitor.get_current_activity()
+        second = self.monitor.get_current_activity()
+
+        self.assertEqual(first, "Safari - GitHub")
+        self.assertEqual(second, "Safari - GitHub")
+        self.monitor.title_cleaner.clean_title.assert_called_once_with("GitHub")
+
+    def test_poll_returns_none_when_idle(self):
+        """Test poll skips detection entirely while idle."""
+        self.monitor.idle_detector.is_idle = True
+        self.monitor.app_detector.get_active_application = MagicMock()
+
+        self.assertIsNone(self.monitor.poll())
+        self.monitor.app_detector.get_active_application.assert_not_called()
+
+    def test_poll_returns_activity_when_active(self):
+        """Test poll returns the cleaned activity name when active."""
+        self.monitor.idle_detector.is_idle = False
+        self.monitor.app_detector.get_active_application = MagicMock(
+            return_value="Safari"
+        )
+        self.monitor.window_detector.get_window_title = MagicMock(return_value="GitHub")
+
+        self.assertEqual(self.monitor.poll(), "Safari - GitHub")
+
+    @patch("pulse.activity_monitor.time.monotonic")
+    def test_poll_reuses_title_while_app_unchanged(self, mock_monotonic):
+        """Test poll only looks the title up again on a switch or expiry."""
+        self.monitor.idle_detector.is_idle = False
+        get_app = MagicMock(return_value="Safari")
+        self.monitor.app_detector.get_active_application = get_app
+        get_title = MagicMock(return_value="GitHub")
+        self.monitor.window_detector.get_window_title = get_title
+        mock_monotonic.return_value = 100.0
+
+        self.assertEqual(self.monitor.poll(), "Safari - GitHub")
+        get_title.return_value = "Docs"
+        self.assertEqual(self.monitor.poll(), "Safari - GitHub")
+        self.assertEqual(get_title.call_count, 1)
+
+        # Refresh interval elapsed
+        mock_monotonic.return_value = 110.0
+        self.assertEqual(self.monitor.poll(), "Safari - Docs")
+
+        # Frontmost app changed
+        get_app.return_value = "Terminal"
+        get_title.return_value = "zsh"
+        self.assertEqual(self.monitor.poll(), "Terminal - zsh")
+
+        # Explicit expiry
+        get_title.return_value = "vim"
+        self.monitor.expire_activity()
+        self.assertEqual(self.monitor.poll(), "Terminal - vim")
+        self.assertEqual(get_title.call_count, 4)
+
+    @patch("pulse.activity_monitor.print")
+    @patch("pulse.activity_monitor.time.monotonic")
+    def test_poll_backs_off_after_title_failures(self, mock_monotonic, mock_print):
+        """Test failing title lookups are skipped with a doubling backoff."""
+        self.monitor.idle_detector.is_idle = False
+        self.monitor.app_detector.get_active_application = MagicMock(
+            return_value="Safari"
+        )
+        get_title = MagicMock(side_effect=OSError("boom"))
+        self.monitor.window_detector.get_window_title = get_title
+        self.monitor.config.title_refresh_interval = 0.0
+
+        mock_monotonic.return_value = 100.0
+        self.assertEqual(self.monitor.poll(), "Safari")
+        self.assertEqual(self.monitor._title_fail_until, 101.0)
+
+        # Still backing off: the title subsystem is not touched
+        mock_monotonic.return_value = 100.5
+        self.assertEqual(self.monitor.poll(), "Safari")
+        self.assertEqual(get_title.call_count, 1)
+
+        mock_monotonic.return_value = 101.0
+        self.assertEqual(self.monitor.poll(), "Safari")
+        self.assertEqual(self.monitor._title_fail_until, 103.0)
+
+        # Backoff is capped
+        self.monitor._title_backoff = 50.0
+        mock_monotonic.return_value = 200.0
+        self.monitor.poll()
+        self.assertEqual(self.monitor._title_fail_until, 260.0)
+
+        # A success resets the backoff
+        get_title.side_effect = None
+        get_title.return_value = "GitHub"
+        mock_monotonic.return_value = 260.0
+        self.assertEqual(self.monitor.poll(), "Safari - GitHub")
+        self.assertEqual(self.monitor._title_backoff, 0.0)
+
+    def test_set_activated_app_feeds_detectors(self):
+        """Test an activation reaches both the app and the title detector."""
+        self.monitor.app_detector.set_activated_app = MagicMock()
+        self.monitor.window_detector.watch_app = MagicMock()
+        app = MagicMock()
+
+        self.monitor.set_activated_app(app)
+
+        self.monitor.app_detector.set_activated_app.assert_called_once_with(app)
+        self.monitor.window_detector.watch_app.assert_called_once_with(
+            app, self.monitor.expire_activity
+        )
+
+    def test_poll_app_skips_window_titles(self):
+        """Test the fast-mode poller returns the app name only."""
+        self.monitor.idle_detector.is_idle = False
+        self.monitor.app_detector.get_active_application = MagicMock(
+            return_value="Safari"
+        )
+        self.monitor.window_detector.get_window_title = MagicMock()
+
+        self.assertEqual(self.monitor.poll_app(), "Safari")
+        self.monitor.window_detector.get_window_title.assert_not_called()
+
+        self.monitor.idle_detector.is_idle = True
+        self.assertIsNone(self.monitor.poll_app())
+
+    def test_title_cache_evicts_least_recently_used(self):
+        """Test the title cache stays within its configured size."""
+        self.monitor.config.title_cache_size = 2
+
+        self.monitor._get_cleaned_activity("App", "one")
+        self.monitor._get_cleaned_activity("App", "two")
+        self.monitor._get_cleaned_activity("App", "one")
+        self.monitor._get_cleaned_activity("App", "three")
+
+        self.assertEqual(
+            list(self.monitor._title_cache), [("App", "one"), ("App", "three")]
+        )
+
 
 class TestActivityMonitorIdleTransition(unittest.TestCase):
     """Test cases for idle transition handling."""
@@ -130,10 +272,11 @@ class TestActivityMonitorIdleTransition(unittest.TestCase):
         start_time = 900.0  # Started 100s ago
 
         # Mock idle detector to say we just became idle
-        self.monitor.idle_detector.check_idle_state = MagicMock(return_value=True)
-        self.monitor.idle_detector.is_idle = True
         # System idle time is 301s (just crossed 300s threshold)
-        self.monitor.idle_detector.get_system_idle_time = MagicMock(return_value=301.0)
+        self.monitor.idle_detector.check_idle_state = MagicMock(
+            return_value=(True, 301.0)
+        )
+        self.monitor.idle_detector.is_idle = True
 
         new_start_time = self.monitor.handle_idle_transition("Safari", start_time)
 
@@ -160,9 +303,10 @@ class TestActivityMonitorIdleTransition(unittest.TestCase):
         # Let's say we started tracking this app at 650.
         start_time = 650.0
 
-        self.monitor.idle_detector.check_idle_state = MagicMock(return_value=True)
+        self.monitor.idle_detector.check_idle_state = MagicMock(
+            return_value=(True, 301.0)
+        )
         self.monitor.idle_detector.is_idle = True
-        self.monitor.idle_detector.get_system_idle_time = MagicMock(return_value=301.0)
 
         self.monitor.handle_idle_transition("Safari", start_time)
 
@@ -178,9 +322,10 @@ class TestActivityMonitorIdleTransition(unittest.TestCase):
         # Cap is 120s.
         start_time = 500.0
 
-        self.monitor.idle_detector.check_idle_state = MagicMock(return_value=True)
+        self.monitor.idle_detector.check_idle_state = MagicMock(
+            return_value=(True, 301.0)
+        )
         self.monitor.idle_detector.is_idle = True
-        self.monitor.idle_detector.get_system_idle_time = MagicMock(return_value=301.0)
 
         self.monitor.handle_idle_transition("Safari", start_time)
 
@@ -193,7 +338,9 @@ class TestActivityMonitorIdleTransition(unittest.TestCase):
         mock_time.return_value = 1000.0
         start_time = 900.0
 
-        self.monitor.idle_detector.check_idle_state = MagicMock(return_value=True)
+        self.monitor.idle_detector.check_idle_state = MagicMock(
+            return_value=(True, 0.0)
+        )
         self.monitor.idle_detector.is_idle = False  # Became active
 
         new_start_time = self.monitor.handle_idle_transition("Safari", start_time)
@@ -203,6 +350,32 @@ class TestActivityMonitorIdleTransition(unittest.TestCase):
         # Should not record any activity
         self.assertEqual(self.monitor.session_tracker.current_session, {})
 
+    @patch("time.time")
+    def test_handle_idle_transition_uses_passed_now(self, mock_time):
+        """Test that an explicit now timestamp is used instead of time.time()."""
+        self.monitor.idle_detector.check_idle_state = MagicMock(
+            return_value=(True, 0.0)
+        )
+        self.monitor.idle_detector.is_idle = False
+
+        new_start_time = self.monitor.handle_idle_transition("Safari", 900.0, 1234.0)
+
+        self.assertEqual(new_start_time, 1234.0)
+        mock_time.assert_not_called()
+
+    def test_handle_idle_transition_queries_idle_time_once(self):
+        """Test the idle time from check_idle_state is reused for timing."""
+        self.monitor.idle_detector.is_idle = False
+
+        with patch(
+            "pulse.detection.CGEventSourceSecondsSinceLastEventType",
+            return_value=301.0,
+        ) as mock_idle:
+            self.monitor.handle_idle_transition("Safari", 650.0, 1000.0)
+
+        mock_idle.assert_called_once()
+        self.assertEqual(self.monitor.session_tracker.current_session["Safari"], 49.0)
+
 
 class TestActivityMonitorAppChange(unittest.TestCase):
     """Test cases for app change detection with debouncing."""
@@ -242,6 +415,7 @@ class TestActivityMonitorAppChange(unittest.TestCase):
         """Test that app change confirms after debounce delay."""
         mock_time.return_value = 102.0  # 2 seconds after change
         self.monitor.last_stable_app = "Safari"
+        self.monitor.pending_app = "Chrome"
         self.monitor.app_change_time = 100.0  # Started 2 seconds ago
 
         current_app, start_time = self.monitor.check_app_change(
@@ -265,6 +439,39 @@ class TestActivityMonitorAppChange(unittest.TestCase):
         self.assertEqual(current_app, "Safari")
         self.assertIsNone(self.monitor.app_change_time)
 
+    @patch("time.time")
+    def test_check_app_change_uses_passed_now(self, mock_time):
+        """Test debounce timing is driven by an explicit now timestamp."""
+        self.monitor.last_stable_app = "Safari"
+
+        self.monitor.check_app_change("Safari", "Chrome", 90.0, 100.0)
+        current_app, start_time = self.monitor.check_app_change(
+            "Safari", "Chrome", 90.0, 101.5
+        )
+
+        self.assertEqual(current_app, "Chrome")
+        self.assertEqual(start_time, 101.5)
+        mock_time.assert_not_called()
+
+    def test_check_app_change_new_candidate_restarts_debounce(self):
+        """Test that jitter between candidate apps never confirms a switch."""
+        self.monitor.last_stable_app = "Safari"
+
+        self.monitor.check_app_change("Safari", "Chrome", 90.0, 100.0)
+        current_app, _ = self.monitor.check_app_change("Safari", "Mail", 90.0, 101.0)
+
+        # Mail has only been seen for 0s, so the switch is not confirmed
+        self.assertEqual(current_app, "Safari")
+        self.assertEqual(self.monitor.pending_app, "Mail")
+        self.assertEqual(self.monitor.app_change_time, 101.0)
+
+        current_app, start_time = self.monitor.check_app_change(
+            "Safari", "Mail", 90.0, 102.0
+        )
+        self.assertEqual(current_app, "Mail")
+        self.assertEqual(start_time, 102.0)
+        self.assertIsNone(self.monitor.pending_app)
+
 
 class TestActivityLogger(unittest.TestCase):
     """Test cases for ActivityLogger class."""
@@ -300,6 +507,23 @@ class TestActivityLogger(unittest.TestCase):
             logger = ActivityLogger(verbose=False)
         self.assertFalse(logger.verbose)
 
+    @patch("builtins.print")
+    def test_quiet_logger_is_noop_specialization(self, mock_print):
+        """Test quiet mode returns a logger whose methods never print."""
+        from pulse.activity_monitor import ActivityLogger, QuietActivityLogger
+
+        logger = ActivityLogger(verbose=False)
+
+        self.assertIsInstance(logger, QuietActivityLogger)
+        self.assertIsInstance(logger, ActivityLogger)
+        logger.log_app_switch("Safari", 5.0, "Chrome", 150.0)
+        logger.log_initial_app("Safari")
+        logger.log_idle_detected(300.0)
+        logger.log_activity_resumed(60.0)
+        logger.log_data_save(60.0)
+        logger.log_tracking_stop()
+        mock_print.assert_not_called()
+
     @patch("builtins.print")
     def test_log_tracking_start_verbose(self, mock_print):
         """Test tracking start log in verbose mode."""
@@ -329,6 +553,18 @@ class TestActivityLogger(unittest.TestCase):
         self.logger.log_data_save(55.5)
         self.assertTrue(mock_print.called)
 
+    @patch("builtins.print")
+    @patch("time.localtime")
+    def test_log_initial_app_timestamp_format(self, mock_localtime, mock_print):
+        """Test log lines are prefixed with a zero-padded HH:MM:SS timestamp."""
+        import time
+
+        mock_localtime.return_value = time.struct_time((2024, 1, 1, 9, 5, 7, 0, 1, 0))
+
+        self.logger.log_initial_app("Safari")
+
+        mock_print.assert_called_once_with("[09:05:07] Initial app: Safari")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 """Tests for CLI entry point."""
 
+import io
 import sys
 import unittest
 from unittest.mock import patch
@@ -59,23 +60,37 @@ class TestCLI(unittest.TestCase):
     def test_main_invalid_idle(self, mock_tracker_class):
         """Test main with invalid idle threshold."""
         with patch.object(sys, "argv", ["pulse", "--idle-threshold", "invalid"]):
-            with patch("builtins.print") as mock_print:
-                main()
+            with patch("sys.stderr", new_callable=io.StringIO) as mock_stderr:
+                with self.assertRaises(SystemExit) as ctx:
+                    main()
+
+        self.assertEqual(ctx.exception.code, 2)
+        self.assertIn("invalid int value: 'invalid'", mock_stderr.getvalue())
+        mock_tracker_class.assert_not_called()
 
-        mock_print.assert_called_with("Invalid idle threshold: invalid")
+    @patch("pulse.core.Pulse")
+    def test_main_missing_idle_value(self, mock_tracker_class):
+        """Test that --idle-threshold without a value is rejected."""
+        with patch.object(sys, "argv", ["pulse", "--idle-threshold"]):
+            with patch("sys.stderr", new_callable=io.StringIO):
+                with self.assertRaises(SystemExit) as ctx:
+                    main()
+
+        self.assertEqual(ctx.exception.code, 2)
         mock_tracker_class.assert_not_called()
 
     def test_main_help(self):
         """Test help argument."""
         with patch.object(sys, "argv", ["pulse", "--help"]):
-            with patch("builtins.print") as mock_print:
-                main()
-
-        # Should print help and exit
-        self.assertTrue(mock_print.called)
-        # Should verify some help text
-        args, _ = mock_print.call_args_list[0]
-        self.assertEqual(args[0], "Pulse")
+            with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+                with self.assertRaises(SystemExit) as ctx:
+                    main()
+
+        # Should print help and exit cleanly
+        self.assertEqual(ctx.exception.code, 0)
+        help_text = mock_stdout.getvalue()
+        self.assertIn("Pulse", help_text)
+        self.assertIn("--idle-threshold SEC", help_text)
 
     @patch("pulse.core.Pulse")
     def test_main_interrupt(self, mock_tracker_class):
@@ -63,6 +63,18 @@ class TestConfig(unittest.TestCase):
         self.config.reset_to_defaults()
         self.assertEqual(self.config.idle_threshold, 300)
 
+    def test_set_does_not_mutate_defaults(self):
+        """Test that writes only affect the instance, never the defaults."""
+        from pulse.config import DEFAULT_CONFIG
+
+        self.config.set("idle_threshold", 600)
+        self.config.update({"fast_mode": True})
+
+        self.assertEqual(DEFAULT_CONFIG["idle_threshold"], 300)
+        self.assertFalse(DEFAULT_CONFIG["fast_mode"])
+        with self.assertRaises(TypeError):
+            DEFAULT_CONFIG["idle_threshold"] = 1  # type: ignore[index]
+
     def test_get_all_returns_copy(self):
         """Test that get_all returns a copy of config."""
         config_copy = self.config.get_all()
@@ -83,6 +95,47 @@ class TestConfig(unittest.TestCase):
 
         self.assertEqual(new_config.idle_threshold, 600)
 
+    def test_save_replaces_file_atomically(self):
+        """Test save leaves no temporary file behind."""
+        self.config.set("idle_threshold", 600)
+        self.config.save()
+
+        self.assertEqual(
+            sorted(p.name for p in Path(self.temp_dir).iterdir()), ["settings.json"]
+        )
+
+    def test_save_handles_write_error(self):
+        """Test save reports write failures without raising."""
+        with patch("pulse.config.os.replace", side_effect=OSError("disk full")):
+            with patch("builtins.print") as mock_print:
+                self.config.save()
+
+        mock_print.assert_called_once()
+        self.assertIn("disk full", mock_print.call_args[0][0])
+
+    def test_maybe_reload_skips_unchanged_file(self):
+        """Test maybe_reload is a no-op when the file has not changed."""
+        from pulse.config import Config
+
+        self.config.save()
+
+        with patch.object(Config, "_load_config") as mock_load:
+            self.assertFalse(self.config.maybe_reload())
+
+        mock_load.assert_not_called()
+
+    def test_maybe_reload_picks_up_external_changes(self):
+        """Test maybe_reload re-reads the file after it is modified."""
+        self.config.save()
+        config_file = self.config.config_file
+        config_file.write_text(json.dumps({"idle_threshold": 900}))
+        # Force a distinct mtime regardless of filesystem timestamp resolution
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertTrue(self.config.maybe_reload())
+        self.assertEqual(self.config.idle_threshold, 900)
+
     def test_property_accessors(self):
         """Test property accessors for common settings."""
         # Test setters
@@ -97,6 +150,18 @@ class TestConfig(unittest.TestCase):
         self.assertFalse(self.config.verbose_logging)
         self.assertEqual(self.config.sync_endpoint, "https://example.com")
 
+    def test_data_dir_defaults_to_cached_path(self):
+        """Test data_dir falls back to the shared default path."""
+        from pulse.config import get_default_data_dir
+
+        self.assertIs(self.config.data_dir, get_default_data_dir())
+        self.assertEqual(self.config.data_dir.parts[-2:], ("Pulse", "data"))
+
+    def test_data_dir_uses_configured_value(self):
+        """Test data_dir honours an explicit data_dir setting."""
+        self.config.set("data_dir", self.temp_dir)
+        self.assertEqual(self.config.data_dir, Path(self.temp_dir))
+
 
 class TestConfigFileHandling(unittest.TestCase):
     """Test cases for config file handling edge cases."""
@@ -145,6 +210,31 @@ class TestConfigFileHandling(unittest.TestCase):
         # Default values should be present
         self.assertFalse(config.fast_mode)
 
+    def test_save_writes_unescaped_unicode(self):
+        """Test that saved config keeps Unicode characters unescaped."""
+        from pulse.config import Config
+
+        config = Config(config_dir=self.temp_dir)
+        config.set("sync_endpoint", "https://example.com/café")
+        config.save()
+
+        raw = (Path(self.temp_dir) / "settings.json").read_bytes()
+        self.assertIn("café".encode("utf-8"), raw)
+        self.assertEqual(json.loads(raw)["sync_endpoint"], "https://example.com/café")
+
+    def test_save_and_load_without_orjson(self):
+        """Test the stdlib json fallback when orjson is unavailable."""
+        from pulse.config import Config
+
+        with patch("pulse.config.orjson", None):
+            config = Config(config_dir=self.temp_dir)
+            config.set("sync_endpoint", "https://example.com/café")
+            config.save()
+
+            reloaded = Config(config_dir=self.temp_dir)
+
+        self.assertEqual(reloaded.sync_endpoint, "https://example.com/café")
+
 
 class TestLoadConfigFromEnv(unittest.TestCase):
     """Test cases for loading config from environment variables."""
@@ -176,6 +266,16 @@ class TestLoadConfigFromEnv(unittest.TestCase):
 
         self.assertTrue(env_config.get("fast_mode"))
 
+    def test_boolean_values_are_case_insensitive(self):
+        """Test boolean parsing accepts mixed case and treats others as false."""
+        with patch.dict(os.environ, {"PULSE_FAST_MODE": "On", "PULSE_VERBOSE": "nope"}):
+            from pulse.config import load_config_from_env
+
+            env_config = load_config_from_env()
+
+        self.assertTrue(env_config.get("fast_mode"))
+        self.assertFalse(env_config.get("verbose_logging"))
+
     def test_handles_invalid_integer(self):
         """Test handling of invalid integer values."""
         with patch.dict(os.environ, {"PULSE_IDLE_THRESHOLD": "not_a_number"}):
@@ -213,6 +313,26 @@ class TestGetConfig(unittest.TestCase):
 
         self.assertIs(config1, config2)
 
+    def test_reload_config_discards_in_memory_changes(self):
+        """Test reload_config re-reads settings even if the file is unchanged."""
+        import pulse.config
+        from pulse.config import get_config, reload_config
+
+        # Do not leak the temporary home's instance into other tests
+        self.addCleanup(setattr, pulse.config, "_global_config", None)
+        with tempfile.TemporaryDirectory() as home:
+            with patch("pulse.config.Path.home", return_value=Path(home)):
+                config = reload_config()
+                config.set("idle_threshold", 900)
+                self.assertEqual(get_config().idle_threshold, 900)
+
+                with patch.dict(os.environ, {"PULSE_FAST_MODE": "true"}):
+                    reloaded = reload_config()
+
+                self.assertIsNot(reloaded, config)
+                self.assertEqual(reloaded.idle_threshold, 300)
+                self.assertTrue(reloaded.fast_mode)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -46,6 +46,30 @@ class TestPulse(unittest.TestCase):
         self.assertTrue(self.tracker.data_store.data_dir.exists())
         self.assertTrue(self.tracker.data_store.data_dir.is_dir())
 
+    def test_uses_slots(self):
+        """Test that Pulse instances have no per-instance __dict__."""
+        self.assertFalse(hasattr(self.tracker, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.tracker.unknown_attribute = 1
+
+    def test_default_data_directory_resolved_once(self):
+        """Test that the default data directory is looked up only once."""
+        from pulse.core import _default_data_dir
+
+        _default_data_dir.cache_clear()
+        try:
+            with patch(
+                "pulse.core.get_data_directory", return_value=Path(self.temp_dir)
+            ) as mock_get_dir:
+                first = Pulse(verbose=False)
+                second = Pulse(verbose=False)
+        finally:
+            _default_data_dir.cache_clear()
+
+        mock_get_dir.assert_called_once()
+        self.assertEqual(first.data_store.data_dir, Path(self.temp_dir))
+        self.assertEqual(second.data_store.data_dir, Path(self.temp_dir))
+
     @patch("pulse.detection.NSWorkspace")
     def test_get_active_application(self, mock_workspace_class):
         """Test getting active application."""
@@ -85,12 +109,12 @@ class TestPulse(unittest.TestCase):
 
             # Test idle detection
             self.tracker.monitor.idle_detector.is_idle = False
-            is_idle_changed = self.tracker.monitor.idle_detector.check_idle_state()
+            is_idle_changed, _ = self.tracker.monitor.idle_detector.check_idle_state()
             self.assertFalse(is_idle_changed)  # 100 seconds is less than 300 threshold
 
             # Test idle
             mock_idle.return_value = 400  # 400 seconds since last event
-            is_idle_changed = self.tracker.monitor.idle_detector.check_idle_state()
+            is_idle_changed, _ = self.tracker.monitor.idle_detector.check_idle_state()
             self.assertTrue(is_idle_changed)  # 400 seconds exceeds 300 threshold
 
     def test_save_session_data(self):
@@ -116,6 +140,80 @@ class TestPulse(unittest.TestCase):
         # Verify session tracker is cleared
         self.assertEqual(self.tracker.monitor.session_tracker.current_session, {})
 
+    def test_save_data_is_synced_and_atomic(self):
+        """Test minute files are fsynced and leave no temporary file behind."""
+        data_store = self.tracker.data_store
+
+        with patch("pulse.storage.os.fsync") as mock_fsync:
+            data_store.merge_and_save_session_data({"TestApp": 12.5}, "activity_x.json")
+
+        mock_fsync.assert_called_once()
+        self.assertEqual(
+            [p.name for p in data_store.data_dir.iterdir()], ["activity_x.json"]
+        )
+        self.assertEqual(
+            data_store.load_existing_data("activity_x.json"), {"TestApp": 12.5}
+        )
+
+    def test_minute_file_same_with_and_without_orjson(self):
+        """Test orjson and the stdlib fallback write identical minute files."""
+        data_store = self.tracker.data_store
+        data = {"Caf\u00e9 \u2014 Notes": 12.5, "Terminal": 3.0}
+
+        data_store.save_data(data, "activity_a.json")
+        with patch("pulse.storage.orjson", None):
+            data_store.save_data(data, "activity_b.json")
+            fallback_loaded = data_store.load_existing_data("activity_a.json")
+
+        first = (data_store.data_dir / "activity_a.json").read_bytes()
+        second = (data_store.data_dir / "activity_b.json").read_bytes()
+        self.assertEqual(first, second)
+        self.assertEqual(fallback_loaded, data)
+        self.assertEqual(data_store.load_existing_data("activity_b.json"), data)
+
+    def test_first_save_of_minute_skips_existence_check(self):
+        """Test a new minute file is created without a separate stat call."""
+        data_store = self.tracker.data_store
+
+        with patch.object(Path, "exists") as mock_exists:
+            data_store.merge_and_save_session_data({"TestApp": 5.0}, "activity_n.json")
+            data_store.merge_and_save_session_data({"TestApp": 2.5}, "activity_n.json")
+
+        mock_exists.assert_not_called()
+        self.assertEqual(
+            data_store.load_existing_data("activity_n.json"), {"TestApp": 7.5}
+        )
+
+    def test_merge_rounds_totals_once_and_drops_noise(self):
+        """Test merged totals are rounded on write and sub-0.01s noise dropped."""
+        data_store = self.tracker.data_store
+        data_store.save_data({"Editor": 10.25, "Mail": 1.0}, "activity_r.json")
+
+        data_store.merge_and_save_session_data(
+            {"Editor": 0.004, "Blip": 0.004, "Tick": 0.006}, "activity_r.json"
+        )
+
+        self.assertEqual(
+            data_store.load_existing_data("activity_r.json"),
+            {"Editor": 10.25, "Mail": 1.0, "Tick": 0.01},
+        )
+
+    def test_session_tracker_accumulates_and_hands_over_session(self):
+        """Test time adds up per app and clearing hands over a fresh session."""
+        session_tracker = self.tracker.monitor.session_tracker
+        session_tracker.add_activity("Editor", 10.0)
+        session_tracker.add_activity("Editor", 2.5)
+        session_tracker.add_activity("Mail", 0.0)
+        snapshot = session_tracker.get_session_data()
+
+        data = session_tracker.clear_session()
+        session_tracker.add_activity("Editor", 1.0)
+
+        self.assertEqual(snapshot, {"Editor": 12.5})
+        self.assertIs(type(snapshot), dict)
+        self.assertEqual(data, {"Editor": 12.5})
+        self.assertEqual(session_tracker.current_session, {"Editor": 1.0})
+
     def test_format_time_output(self):
         """Test time formatting for display."""
         # This would test time formatting if such a method exists
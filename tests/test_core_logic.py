@@ -1,8 +1,9 @@
 """Tests for internal logic of Pulse."""
 
+import threading
+import time
 import unittest
-from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 from pulse.core import Pulse
 
@@ -19,179 +20,208 @@ class TestPulseLogic(unittest.TestCase):
         )
         # Mock external dependencies to avoid side effects
         self.tracker.monitor = MagicMock()
+        self.tracker.monitor.idle_detector.is_idle = False
+        self.tracker.monitor.app_change_time = None
         self.tracker.logger = MagicMock()
         self.tracker.data_store = MagicMock()
 
     def test_is_minute_boundary_true(self):
         """Test detection of minute boundary crossing."""
-        # Set last check time to a different minute
-        self.tracker.last_check_time = datetime(2023, 1, 1, 12, 0, 0)
+        # Last boundary at 960s (minute 16), now in minute 17
+        self.tracker._next_save = 1020.0
 
-        # Patch datetime to return a time in the next minute
-        with patch("pulse.core.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(2023, 1, 1, 12, 1, 0)
-            result = self.tracker._is_minute_boundary()
+        result = self.tracker._is_minute_boundary(1020.5)
 
         self.assertTrue(result)
-        self.assertEqual(self.tracker.last_check_time.minute, 1)
+        self.assertEqual(self.tracker._next_save, 1080.0)
 
     def test_is_minute_boundary_false(self):
         """Test when minute boundary is not crossed."""
-        self.tracker.last_check_time = datetime(2023, 1, 1, 12, 0, 0)
+        self.tracker._next_save = 1020.0
 
-        with patch("pulse.core.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(2023, 1, 1, 12, 0, 30)
-            result = self.tracker._is_minute_boundary()
+        result = self.tracker._is_minute_boundary(1019.9)
 
         self.assertFalse(result)
-        self.assertEqual(self.tracker.last_check_time.minute, 0)
+        self.assertEqual(self.tracker._next_save, 1020.0)
+
+    def test_is_minute_boundary_after_clock_set_back(self):
+        """Test a wall clock jump backwards still starts a new minute."""
+        self.tracker._next_save = 1020.0
+
+        result = self.tracker._is_minute_boundary(500.0)
+
+        self.assertTrue(result)
+        self.assertEqual(self.tracker._next_save, 540.0)
 
     def test_calculate_time_in_current_minute_before_boundary(self):
         """Test time calculation when start_time is before last boundary."""
-        # Last boundary at 1000
-        last_boundary = datetime.fromtimestamp(1000)
+        # Last boundary at 1020, next at 1080
+        self.tracker._next_save = 1080.0
         # Start time at 900 (before boundary)
         start_time = 900.0
 
-        # Current time at 1030
-        with patch("pulse.core.time.time", return_value=1030.0):
-            result = self.tracker._calculate_time_in_current_minute(
-                start_time, last_boundary
-            )
+        # Current time at 1050
+        result = self.tracker._calculate_time_in_current_minute(start_time, 1050.0)
 
-        # Should be 1030 - 1000 = 30
+        # Should be 1050 - 1020 = 30
         self.assertEqual(result, 30.0)
 
     def test_calculate_time_in_current_minute_after_boundary(self):
         """Test time calculation when start_time is after last boundary."""
-        # Last boundary at 1000
-        last_boundary = datetime.fromtimestamp(1000)
-        # Start time at 1010 (after boundary)
-        start_time = 1010.0
-
-        # Current time at 1030
-        with patch("pulse.core.time.time", return_value=1030.0):
-            result = self.tracker._calculate_time_in_current_minute(
-                start_time, last_boundary
-            )
+        # Last boundary at 1020, next at 1080
+        self.tracker._next_save = 1080.0
+        # Start time at 1030 (after boundary)
+        start_time = 1030.0
+
+        # Current time at 1050
+        result = self.tracker._calculate_time_in_current_minute(start_time, 1050.0)
 
-        # Should be 1030 - 1010 = 20
+        # Should be 1050 - 1030 = 20
         self.assertEqual(result, 20.0)
 
     def test_get_current_app_time(self):
         """Test getting current app time bounded."""
-        self.tracker.last_check_time = datetime.fromtimestamp(1000)
+        # Last boundary at 1020, next at 1080
+        self.tracker._next_save = 1080.0
 
         # Case 1: No current app
-        self.assertEqual(self.tracker._get_current_app_time(None, 1000), 0.0)
+        self.assertEqual(self.tracker._get_current_app_time(None, 1020, 1050), 0.0)
 
         # Case 2: Normal duration (30s)
-        with patch("pulse.core.time.time", return_value=1030.0):
-            result = self.tracker._get_current_app_time("App", 1000.0)
-            self.assertEqual(result, 30.0)
+        result = self.tracker._get_current_app_time("App", 1020.0, 1050.0)
+        self.assertEqual(result, 30.0)
 
         # Case 3: Overflow (>60s) - should cap at 60
-        with patch("pulse.core.time.time", return_value=1070.0):
-            result = self.tracker._get_current_app_time("App", 1000.0)
-            self.assertEqual(result, 60.0)
+        result = self.tracker._get_current_app_time("App", 1020.0, 1090.0)
+        self.assertEqual(result, 60.0)
 
     def test_normalize_to_minute(self):
         """Test normalization of durations to exactly 60 seconds."""
         # Case 1: Already exactly 60 seconds
         data = {"App1": 30.0, "App2": 30.0}  # Total 60
-        result = self.tracker._normalize_to_minute(data)
+        result, total = self.tracker._normalize_to_minute(data)
         self.assertEqual(sum(result.values()), 60.0)
         self.assertEqual(result["App1"], 30.0)
         self.assertEqual(result["App2"], 30.0)
 
         # Case 2: Over 60 seconds - should scale down
         data = {"App1": 60.0, "App2": 60.0}  # Total 120
-        result = self.tracker._normalize_to_minute(data)
+        result, total = self.tracker._normalize_to_minute(data)
         self.assertEqual(sum(result.values()), 60.0)
         self.assertEqual(result["App1"], 30.0)
         self.assertEqual(result["App2"], 30.0)
 
         # Case 3: Under 60 seconds - should scale up
         data = {"App1": 15.0, "App2": 15.0}  # Total 30
-        result = self.tracker._normalize_to_minute(data)
+        result, total = self.tracker._normalize_to_minute(data)
         self.assertEqual(sum(result.values()), 60.0)
         self.assertEqual(result["App1"], 30.0)
         self.assertEqual(result["App2"], 30.0)
 
         # Case 4: Single app - should be exactly 60
         data = {"App1": 45.0}
-        result = self.tracker._normalize_to_minute(data)
+        result, total = self.tracker._normalize_to_minute(data)
         self.assertEqual(result["App1"], 60.0)
+        self.assertEqual(total, 60.0)
 
         # Case 5: Empty data
-        self.assertEqual(self.tracker._normalize_to_minute({}), {})
+        self.assertEqual(self.tracker._normalize_to_minute({}), ({}, 0.0))
 
         # Case 6: Precision - values should have max 2 decimal places
         data = {"App1": 33.333, "App2": 66.666}  # Total ~100
-        result = self.tracker._normalize_to_minute(data)
+        result, total = self.tracker._normalize_to_minute(data)
         self.assertEqual(sum(result.values()), 60.0)
+        self.assertEqual(total, 60.0)
         for value in result.values():
             self.assertEqual(value, round(value, 2))
 
+        # Case 7: Scaling happens in place on the dict that was passed in
+        data = {"App1": 10.0, "App2": 20.0}
+        result, total = self.tracker._normalize_to_minute(data)
+        self.assertIs(result, data)
+        self.assertEqual(data, {"App1": 20.0, "App2": 40.0})
+
     def test_build_bounded_data(self):
         """Test building bounded data dictionary."""
-        self.tracker.last_check_time = datetime.fromtimestamp(1000)
+        self.tracker._next_save = 1080.0  # last boundary at 1020
 
         # Setup session data
         session_data = {"BackgroundApp": 10.0}
         current_app = "ActiveApp"
         time_since_boundary = 20.0
 
-        # Mock time.time to define max_reasonable_time window
-        # current_time = 1030, last_boundary = 1000 -> max 30s window
-        with patch("pulse.core.time.time", return_value=1030.0):
-            result = self.tracker._build_bounded_data(
-                session_data, current_app, time_since_boundary
-            )
+        # now = 1050, last_boundary = 1020 -> max 30s window
+        result = self.tracker._build_bounded_data(
+            session_data, current_app, time_since_boundary, 1050.0
+        )
 
         self.assertEqual(result["BackgroundApp"], 10.0)
         self.assertEqual(result["ActiveApp"], 20.0)
 
     def test_build_bounded_data_caps_background(self):
         """Test that background apps are capped by elapsed time."""
-        self.tracker.last_check_time = datetime.fromtimestamp(1000)
+        self.tracker._next_save = 1080.0  # last boundary at 1020
 
         # Background app claims 50s, but only 30s have passed
         session_data = {"BackgroundApp": 50.0}
         current_app = None
         time_since_boundary = 0.0
 
-        with patch("pulse.core.time.time", return_value=1030.0):
-            result = self.tracker._build_bounded_data(
-                session_data, current_app, time_since_boundary
-            )
+        result = self.tracker._build_bounded_data(
+            session_data, current_app, time_since_boundary, 1050.0
+        )
 
         # Should be capped at 30s (max_reasonable_time)
         self.assertEqual(result["BackgroundApp"], 30.0)
 
+    def test_build_bounded_data_current_app_in_session(self):
+        """Test that the current app's session entry is replaced, not duplicated."""
+        self.tracker._next_save = 1080.0  # last boundary at 1020
+
+        session_data = {"ActiveApp": 45.0, "BackgroundApp": 5.0}
+
+        result = self.tracker._build_bounded_data(
+            session_data, "ActiveApp", 20.0, 1050.0
+        )
+        self.assertEqual(result, {"ActiveApp": 20.0, "BackgroundApp": 5.0})
+
+        # No time since the boundary: the current app is dropped entirely
+        result = self.tracker._build_bounded_data(
+            session_data, "ActiveApp", 0.0, 1050.0
+        )
+        self.assertEqual(result, {"BackgroundApp": 5.0})
+
     def test_check_save_interval_no_boundary(self):
         """Test check_save_interval when no boundary crossed."""
-        # Mock _is_minute_boundary to return False
-        self.tracker._is_minute_boundary = MagicMock(return_value=False)
-
         start_time = 1000.0
-        new_start_time = self.tracker._check_save_interval("App", start_time)
+        with patch.object(Pulse, "_is_minute_boundary", return_value=False):
+            new_start_time = self.tracker._check_save_interval(
+                "App", start_time, 1030.0
+            )
 
         self.assertEqual(new_start_time, start_time)
         self.tracker.monitor.clear_session_data.assert_not_called()
+        self.tracker.monitor.expire_activity.assert_not_called()
 
     def test_check_save_interval_boundary(self):
         """Test check_save_interval when boundary crossed."""
-        self.tracker._is_minute_boundary = MagicMock(return_value=True)
-        self.tracker._get_bounded_session_data = MagicMock(return_value={"App": 10})
-        self.tracker._save_and_log = MagicMock()
-
         start_time = 1000.0
-        with patch("pulse.core.time.time", return_value=1060.0):
-            new_start_time = self.tracker._check_save_interval("App", start_time)
-
+        with patch.object(Pulse, "_is_minute_boundary", return_value=True):
+            with patch.object(
+                Pulse, "_get_bounded_session_data", return_value=({"App": 10}, 10)
+            ) as mock_bounded:
+                with patch.object(Pulse, "_save_and_log") as mock_save:
+                    with patch("pulse.core.time.time") as mock_time:
+                        new_start_time = self.tracker._check_save_interval(
+                            "App", start_time, 1060.0
+                        )
+
+        # The caller's timestamp becomes the new start_time without a clock read
         self.assertEqual(new_start_time, 1060.0)
-        self.tracker._save_and_log.assert_called_once()
+        mock_time.assert_not_called()
+        mock_bounded.assert_called_once_with("App", start_time, 1060.0)
+        mock_save.assert_called_once_with({"App": 10}, 10)
+        self.tracker.monitor.expire_activity.assert_called_once_with()
 
     def test_save_final_data(self):
         """Test saving final data on exit."""
@@ -212,59 +242,414 @@ class TestPulseLogic(unittest.TestCase):
             {"Other": 5}
         )
 
+    def test_save_and_log_without_writer_saves_directly(self):
+        """Test that saves are synchronous when no writer thread is running."""
+        self.tracker._save_and_log({"App": 60.0}, 60.0)
+
+        self.tracker.data_store.merge_and_save_session_data.assert_called_once_with(
+            {"App": 60.0}
+        )
+        self.tracker.logger.log_data_save.assert_called_once_with(60.0)
+
+    def test_writer_coalesces_queued_saves_per_file(self):
+        """Test that queued minute saves are merged into one write per file."""
+        store = self.tracker.data_store
+        store.get_current_minute_filename.side_effect = [
+            "activity_1.json",
+            "activity_1.json",
+            "activity_2.json",
+        ]
+
+        # Queue before starting the writer so all payloads are drained together
+        self.tracker._writer = MagicMock()
+        self.tracker._save_and_log({"A": 30.0, "B": 30.0}, 60.0)
+        self.tracker._save_and_log({"A": 10.0}, 10.0)
+        self.tracker._save_and_log({"C": 60.0}, 60.0)
+        store.merge_and_save_session_data.assert_not_called()
+
+        self.tracker._writer = None
+        self.tracker._start_writer()
+        self.tracker._stop_writer()
+
+        self.assertIsNone(self.tracker._writer)
+        store.merge_and_save_session_data.assert_any_call(
+            {"A": 40.0, "B": 30.0}, "activity_1.json"
+        )
+        store.merge_and_save_session_data.assert_any_call(
+            {"C": 60.0}, "activity_2.json"
+        )
+        self.assertEqual(store.merge_and_save_session_data.call_count, 2)
+
+    def test_writer_survives_save_errors(self):
+        """Test that a failed write is reported without killing the writer."""
+        store = self.tracker.data_store
+        store.get_current_minute_filename.return_value = "activity_1.json"
+        store.merge_and_save_session_data.side_effect = OSError("disk full")
+
+        self.tracker._start_writer()
+        with patch("builtins.print") as mock_print:
+            self.tracker._save_and_log({"A": 60.0}, 60.0)
+            self.tracker._stop_writer()
+
+        mock_print.assert_called_once()
+        self.assertIn("disk full", mock_print.call_args[0][0])
+        self.assertIsNone(self.tracker._writer)
+
     def test_track_activity_loop(self):
         """Test the main tracking loop (one iteration)."""
         # Setup mocks
-        self.tracker.running = True
+        self.tracker._stop_evt.clear()
         self.tracker.monitor.include_window_titles = True
 
         # Mock monitor methods
-        self.tracker.monitor.idle_detector.check_idle_state.return_value = False
-        self.tracker.monitor.handle_idle_transition.return_value = 1000.0
-        self.tracker.monitor.get_current_activity.return_value = "App"
+        self.tracker.monitor.idle_detector.check_idle_state.return_value = (False, 0.0)
+        self.tracker.monitor.apply_idle_transition.return_value = 1000.0
+        self.tracker.monitor.poll.return_value = "App"
         self.tracker.monitor.check_app_change.return_value = ("App", 1000.0)
 
-        # Mock internal check
-        self.tracker._check_save_interval = MagicMock(return_value=1000.0)
-
-        # Mock time.sleep to stop the loop by side effect or just run once
-        # Strategy: Run once, then set running=False
+        # Mock the stop event's wait to stop the loop after one tick
         def stop_loop(*args):
-            self.tracker.running = False
+            self.tracker._stop_evt.set()
 
-        with patch("pulse.core.time.sleep", side_effect=stop_loop) as mock_sleep:
-            with patch("pulse.core.time.time", return_value=1000.0):
-                self.tracker.track_activity()
+        # Mock internal check
+        with patch.object(
+            Pulse, "_check_save_interval", return_value=1000.0
+        ) as mock_check:
+            with patch.object(self.tracker._wake_evt, "wait", side_effect=stop_loop):
+                with patch("pulse.core.time.time", return_value=1000.0):
+                    self.tracker.track_activity()
 
         # Verify call chain
         self.tracker.logger.log_tracking_start.assert_called()
-        self.tracker.monitor.get_current_activity.assert_called()
+        self.tracker.monitor.poll.assert_called()
         self.tracker.monitor.check_app_change.assert_called()
-        self.tracker._check_save_interval.assert_called()
+        mock_check.assert_called()
         self.tracker.logger.log_tracking_stop.assert_called()
 
+    def test_track_activity_fast_mode_uses_app_poller(self):
+        """Test the loop polls app names only when window titles are off."""
+        self.tracker._stop_evt.clear()
+        self.tracker.monitor.include_window_titles = False
+        self.tracker.monitor.idle_detector.check_idle_state.return_value = (False, 0.0)
+        self.tracker.monitor.apply_idle_transition.return_value = 1000.0
+        self.tracker.monitor.poll_app.return_value = "App"
+        self.tracker.monitor.check_app_change.return_value = ("App", 1000.0)
+
+        def stop_loop(*args):
+            self.tracker._stop_evt.set()
+
+        with patch.object(Pulse, "_check_save_interval", return_value=1000.0):
+            with patch.object(self.tracker._wake_evt, "wait", side_effect=stop_loop):
+                with patch("pulse.core.time.time", return_value=1000.0):
+                    self.tracker.track_activity()
+
+        self.tracker.monitor.poll_app.assert_called_once()
+        self.tracker.monitor.poll.assert_not_called()
+
+    def test_track_activity_backs_off_while_app_is_stable(self):
+        """Test the poll interval grows while the app is stable, up to a cap."""
+        self.tracker._stop_evt.clear()
+        self.tracker.monitor.idle_detector.check_idle_state.return_value = (False, 0.0)
+        self.tracker.monitor.apply_idle_transition.return_value = 1000.0
+        self.tracker.monitor.poll.return_value = "App"
+        self.tracker.monitor.check_app_change.return_value = ("App", 1000.0)
+
+        intervals = []
+
+        def record_wait(seconds):
+            intervals.append(seconds)
+            if len(intervals) == 6:
+                self.tracker._stop_evt.set()
+
+        with patch.object(Pulse, "_check_save_interval", return_value=1000.0):
+            with patch.object(self.tracker._wake_evt, "wait", side_effect=record_wait):
+                with patch("pulse.core.time.time", return_value=1000.0):
+                    self.tracker.track_activity()
+
+        # First tick initialises the app, then the interval backs off
+        self.assertEqual(intervals[:3], [0.5, 0.75, 1.125])
+        self.assertEqual(intervals[-1], 2.0)
+
+    def test_track_activity_sleeps_until_debounce_deadline(self):
+        """Test a pending switch wakes the loop exactly when it can confirm."""
+        self.tracker._stop_evt.clear()
+        self.tracker.monitor.idle_detector.check_idle_state.return_value = (False, 0.0)
+        self.tracker.monitor.poll.return_value = "Other"
+        self.tracker.monitor.check_app_change.return_value = ("App", 1000.0)
+        self.tracker.monitor.debounce_delay = 1.0
+        self.tracker.monitor.app_change_time = 999.7
+
+        def stop_loop(*args):
+            self.tracker._stop_evt.set()
+
+        with patch.object(Pulse, "_check_save_interval", return_value=1000.0):
+            with patch.object(
+                self.tracker._wake_evt, "wait", side_effect=stop_loop
+            ) as mock_wait:
+                with patch("pulse.core.time.time", return_value=1000.0):
+                    self.tracker.track_activity()
+
+        self.assertAlmostEqual(mock_wait.call_args[0][0], 0.7)
+
+    def test_track_activity_wakes_for_minute_save(self):
+        """Test the poll wait is cut short to save right at the minute boundary."""
+        self.tracker._stop_evt.clear()
+        self.tracker.monitor.idle_detector.check_idle_state.return_value = (False, 0.0)
+        self.tracker.monitor.poll.return_value = "App"
+        self.tracker.monitor.check_app_change.return_value = ("App", 1000.0)
+        self.tracker._next_save = 1020.0
+
+        def stop_loop(*args):
+            self.tracker._stop_evt.set()
+
+        with patch.object(Pulse, "_check_save_interval", return_value=1000.0):
+            with patch.object(
+                self.tracker._wake_evt, "wait", side_effect=stop_loop
+            ) as mock_wait:
+                with patch("pulse.core.time.time", return_value=1019.8):
+                    self.tracker.track_activity()
+
+        self.assertAlmostEqual(mock_wait.call_args[0][0], 0.2)
+
+    def test_track_activity_drains_autorelease_pool_each_tick(self):
+        """Test each tick runs inside its own autorelease pool."""
+        self.tracker._stop_evt.clear()
+        self.tracker.monitor.idle_detector.check_idle_state.return_value = (False, 0.0)
+        self.tracker.monitor.poll.return_value = "App"
+        self.tracker.monitor.check_app_change.return_value = ("App", 1000.0)
+        waits = []
+
+        def record_wait(seconds):
+            waits.append(seconds)
+            if len(waits) == 3:
+                self.tracker._stop_evt.set()
+
+        with patch("pulse.core.autorelease_pool") as mock_pool:
+            with patch.object(Pulse, "_check_save_interval", return_value=1000.0):
+                with patch.object(
+                    self.tracker._wake_evt, "wait", side_effect=record_wait
+                ):
+                    self.tracker.track_activity()
+
+        self.assertEqual(mock_pool.call_count, 3)
+        self.assertEqual(mock_pool.return_value.__exit__.call_count, 3)
+
     def test_track_activity_idle(self):
         """Test tracking loop when idle."""
-        self.tracker.running = True
+        self.tracker._stop_evt.clear()
 
         # Mock idle
-        self.tracker.monitor.idle_detector.check_idle_state.return_value = True
+        self.tracker.monitor.idle_detector.check_idle_state.return_value = (True, 400.0)
         self.tracker.monitor.idle_detector.is_idle = True
 
-        # Stop loop after first sleep
+        # Stop loop after first wait
         def stop_loop(*args):
-            self.tracker.running = False
+            self.tracker._stop_evt.set()
 
-        with patch("pulse.core.time.sleep", side_effect=stop_loop) as mock_sleep:
+        with patch.object(
+            self.tracker._wake_evt, "wait", side_effect=stop_loop
+        ) as mock_wait:
             self.tracker.track_activity()
 
-        # Should check idle and sleep, but NOT get activity
-        self.tracker.monitor.idle_detector.check_idle_state.assert_called()
-        self.tracker.monitor.get_current_activity.assert_not_called()
+        # Should check idle and wait, but NOT get activity
+        self.tracker.monitor.idle_detector.check_idle_state.assert_called_with(
+            lazy=True
+        )
+        self.tracker.monitor.poll.assert_not_called()
+
+    def test_track_activity_idle_wait_backs_off(self):
+        """Test the idle check interval doubles while idle, up to a cap."""
+        self.tracker._stop_evt.clear()
+        self.tracker.monitor.idle_detector.check_idle_state.return_value = (
+            False,
+            900.0,
+        )
+        self.tracker.monitor.idle_detector.is_idle = True
+        # Keep the next minute save out of reach so it never caps the wait
+        self.tracker._next_save = 2000.0
+        waits = []
+
+        def record_wait(seconds):
+            waits.append(seconds)
+            if len(waits) == 7:
+                self.tracker._stop_evt.set()
+
+        with patch("pulse.core.time.time", return_value=1000.0):
+            with patch.object(Pulse, "_check_save_interval", return_value=1000.0):
+                with patch.object(
+                    self.tracker._wake_evt, "wait", side_effect=record_wait
+                ):
+                    self.tracker.track_activity()
+
+        self.assertEqual(waits, [1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0])
+        self.tracker.monitor.poll.assert_not_called()
+
+    def test_track_activity_applies_idle_transition(self):
+        """Test a detected transition is applied with the same idle time."""
+        self.tracker._stop_evt.clear()
+        idle_detector = self.tracker.monitor.idle_detector
+        idle_detector.check_idle_state.return_value = (True, 301.0)
+        idle_detector.is_idle = True
+        self.tracker.monitor.apply_idle_transition.return_value = 1000.0
+
+        def stop_loop(*args):
+            self.tracker._stop_evt.set()
+
+        with patch.object(self.tracker._wake_evt, "wait", side_effect=stop_loop):
+            with patch("pulse.core.time.time", return_value=1000.0):
+                self.tracker.track_activity()
+
+        self.tracker.monitor.apply_idle_transition.assert_called_once_with(
+            None, 1000.0, 301.0, 1000.0
+        )
+
+    def test_track_activity_sustained_idle_skips_tick(self):
+        """Test sustained idle skips app detection but still checks for saves."""
+        self.tracker._stop_evt.clear()
+
+        # Already idle: no state change, but poll reports no activity
+        self.tracker.monitor.idle_detector.check_idle_state.return_value = (False, 0.0)
+        self.tracker.monitor.idle_detector.is_idle = True
+        self.tracker.monitor.apply_idle_transition.return_value = 1000.0
+        self.tracker.monitor.poll.return_value = None
+
+        def stop_loop(*args):
+            self.tracker._stop_evt.set()
+
+        self.tracker._next_save = 1020.0
+
+        with patch("pulse.core.time.time", return_value=1000.0):
+            with patch.object(
+                Pulse, "_check_save_interval", return_value=1000.0
+            ) as mock_save_check:
+                with patch.object(
+                    self.tracker._wake_evt, "wait", side_effect=stop_loop
+                ) as mock_wait:
+                    self.tracker.track_activity()
+
+        mock_wait.assert_called_once_with(1.0)
+        self.tracker.monitor.poll.assert_not_called()
+        self.tracker.monitor.check_app_change.assert_not_called()
+        # The minute save still runs, with no current app charged for idle time
+        mock_save_check.assert_called_once_with(None, ANY, ANY)
+
+    def test_track_activity_idle_saves_at_minute_boundary(self):
+        """Test pre-idle activity is saved when idle crosses a minute boundary."""
+        self.tracker._stop_evt.clear()
+        self.tracker._next_save = 1020.0
+        clock = [1000.0]
+
+        # Idle throughout; the pre-idle session is waiting to be saved
+        self.tracker.monitor.idle_detector.check_idle_state.return_value = (
+            False,
+            900.0,
+        )
+        self.tracker.monitor.idle_detector.is_idle = True
+        self.tracker.monitor.clear_session_data.return_value = {"PreIdleApp": 30.0}
+
+        waits = []
+        saves = []
+
+        def advance(delay):
+            waits.append(delay)
+            # Timer wakes land just after the requested time
+            clock[0] += delay + 0.25
+            if saves:
+                self.tracker._stop_evt.set()
+
+        def record_save(session_data, total_time):
+            saves.append((clock[0], dict(session_data), total_time))
+
+        with patch("pulse.core.time.time", side_effect=lambda: clock[0]):
+            with patch.object(Pulse, "_save_and_log", side_effect=record_save):
+                with patch.object(self.tracker._wake_evt, "wait", side_effect=advance):
+                    self.tracker.track_activity()
+
+        # Backoff is cut short so the loop wakes for the 1020 save
+        self.assertEqual(waits[:4], [1.0, 2.0, 4.0, 8.0])
+        self.assertAlmostEqual(waits[4], 4.0)
+        # Saved in the minute it belongs to, not held until resume
+        self.assertEqual(saves, [(1020.25, {"PreIdleApp": 60.0}, 60.0)])
+        self.tracker.monitor.poll.assert_not_called()
+
+    def test_stop_wakes_waiting_loop(self):
+        """Test that stop() ends the loop without waiting out the poll interval."""
+        self.tracker.monitor.idle_detector.check_idle_state.return_value = (False, 0.0)
+        self.tracker.monitor.apply_idle_transition.return_value = 1000.0
+        self.tracker.monitor.poll.return_value = "App"
+        self.tracker.monitor.check_app_change.return_value = ("App", 1000.0)
+
+        with patch("pulse.core.MIN_POLL_INTERVAL", 30.0):
+            with patch("pulse.core.EVENT_POLL_INTERVAL", 30.0):
+                with patch("builtins.print"):
+                    with patch.object(Pulse, "_check_save_interval", return_value=0):
+                        thread = threading.Thread(target=self.tracker.start)
+                        thread.start()
+                        # Wait until the loop has polled at least once
+                        for _ in range(200):
+                            if self.tracker.monitor.poll.called:
+                                break
+                            time.sleep(0.01)
+                        self.tracker.stop()
+                        thread.join(timeout=5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertFalse(self.tracker.running)
+        self.tracker.logger.log_tracking_stop.assert_called_once()
+
+    def test_app_activation_wakes_waiting_loop(self):
+        """Test that an activation notification cuts the poll wait short."""
+        self.tracker.monitor.idle_detector.check_idle_state.return_value = (False, 0.0)
+        self.tracker.monitor.apply_idle_transition.return_value = 1000.0
+        self.tracker.monitor.poll.return_value = "App"
+        self.tracker.monitor.check_app_change.return_value = ("App", 1000.0)
+
+        with patch("pulse.core.AppActivationObserver") as mock_observer_class:
+            with patch("pulse.core.MIN_POLL_INTERVAL", 30.0):
+                with patch("pulse.core.EVENT_POLL_INTERVAL", 30.0):
+                    with patch("builtins.print"):
+                        with patch.object(
+                            Pulse, "_check_save_interval", return_value=0
+                        ):
+                            thread = threading.Thread(target=self.tracker.start)
+                            thread.start()
+                            for _ in range(200):
+                                if self.tracker.monitor.poll.call_count:
+                                    break
+                                time.sleep(0.01)
+                            # Fire the callback the tracker registered
+                            on_activate = mock_observer_class.call_args[0][0]
+                            activated_app = MagicMock()
+                            on_activate(activated_app)
+                            for _ in range(200):
+                                if self.tracker.monitor.poll.call_count > 1:
+                                    break
+                                time.sleep(0.01)
+                            polls = self.tracker.monitor.poll.call_count
+                            self.tracker.stop()
+                            thread.join(timeout=5)
+
+        self.assertGreaterEqual(polls, 2)
+        self.assertFalse(thread.is_alive())
+        mock_observer_class.return_value.stop.assert_called_once()
+        # The notified app is served until tracking stops, then polling resumes
+        set_activated_app = self.tracker.monitor.set_activated_app
+        self.assertEqual(
+            set_activated_app.call_args_list, [call(activated_app), call(None)]
+        )
+
+    def test_running_reflects_start_and_stop(self):
+        """Test the running flag follows the stop event."""
+        self.assertFalse(self.tracker.running)
+        self.tracker._stop_evt.clear()
+        self.assertTrue(self.tracker.running)
+        with patch("builtins.print"):
+            self.tracker.stop()
+        self.assertFalse(self.tracker.running)
 
     def test_track_activity_exception(self):
         """Test exception handling in tracking loop."""
-        self.tracker.running = True
+        self.tracker._stop_evt.clear()
 
         # Raise exception in loop
         self.tracker.monitor.idle_detector.check_idle_state.side_effect = Exception(
@@ -272,13 +657,41 @@ class TestPulseLogic(unittest.TestCase):
         )
 
         # Stop loop after exception handling
-        # It will print error and sleep(5). We want to break loop after that.
-        # side_effect on sleep: first call (from exception handler) -> stop loop
+        # It will log the error and wait(5). We want to break loop after that.
+        # side_effect on wait: first call (from exception handler) -> stop loop
         def stop_loop(*args):
-            self.tracker.running = False
+            self.tracker._stop_evt.set()
 
-        with patch("pulse.core.time.sleep", side_effect=stop_loop) as mock_sleep:
-            with patch("builtins.print") as mock_print:
+        with patch.object(
+            self.tracker._wake_evt, "wait", side_effect=stop_loop
+        ) as mock_wait:
+            with self.assertLogs("pulse.core", level="ERROR") as logs:
                 self.tracker.track_activity()
 
-        mock_print.assert_called_with("Error in tracking loop: Test Error")
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("Error in tracking loop: Test Error", logs.output[0])
+
+    def test_loop_errors_are_rate_limited(self):
+        """Test that repeats of the same error type are logged once per interval."""
+        with self.assertLogs("pulse.core", level="ERROR") as logs:
+            with patch("pulse.core.time.monotonic", side_effect=[100.0, 110.0, 110.0]):
+                for error in (ValueError("a"), ValueError("b"), KeyError("c")):
+                    try:
+                        raise error
+                    except Exception as e:
+                        self.tracker._log_loop_error(e)
+            with patch("pulse.core.time.monotonic", return_value=200.0):
+                try:
+                    raise KeyError("d")
+                except Exception as e:
+                    self.tracker._log_loop_error(e)
+
+        # The second ValueError is suppressed; a new type or a stale one is logged
+        self.assertEqual(
+            [record.getMessage() for record in logs.records],
+            [
+                "Error in tracking loop: a",
+                "Error in tracking loop: 'c'",
+                "Error in tracking loop: 'd'",
+            ],
+        )
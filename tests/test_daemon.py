@@ -1,5 +1,6 @@
 """Tests for daemon module functionality."""
 
+import fcntl
 import os
 import signal
 import sys
@@ -22,6 +23,14 @@ class TestActivityDaemon(unittest.TestCase):
         self.kill_patcher = patch("os.kill")
         self.mock_kill = self.kill_patcher.start()
 
+        # daemonize() runs in-process here; keep the test runner's descriptors
+        closerange_patcher = patch("os.closerange")
+        self.mock_closerange = closerange_patcher.start()
+        self.addCleanup(closerange_patcher.stop)
+        dup2_patcher = patch("os.dup2")
+        self.mock_dup2 = dup2_patcher.start()
+        self.addCleanup(dup2_patcher.stop)
+
         with patch.dict(
             "sys.modules",
             {
@@ -40,6 +49,15 @@ class TestActivityDaemon(unittest.TestCase):
 
         shutil.rmtree(self.temp_dir)
 
+    def _write_pidfile(self, content, locked=False):
+        """Write the pidfile, optionally holding its lock like a live daemon."""
+        with open(self.pid_file, "w") as f:
+            f.write(content)
+        if locked:
+            fd = os.open(self.pid_file, os.O_RDWR)
+            self.addCleanup(os.close, fd)
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
     def test_initialization(self):
         """Test ActivityDaemon initialization."""
         self.assertEqual(self.daemon.pidfile, self.pid_file)
@@ -74,6 +92,7 @@ class TestActivityDaemon(unittest.TestCase):
 
         with patch("fcntl.flock"):
             self.daemon.daemonize()
+        self.addCleanup(os.close, self.daemon._pidfd)
 
         # Should fork twice
         self.assertEqual(mock_fork.call_count, 2)
@@ -120,46 +139,67 @@ class TestActivityDaemon(unittest.TestCase):
 
         mock_exit.assert_called_with(1)
 
+    def test_daemonize_writes_and_holds_locked_pidfile(self):
+        """Test the pidfile lock stays held after daemonizing."""
+        self._write_pidfile("99999999")
+
+        with patch("os.fork", return_value=0), patch("os.setsid"):
+            with patch("os.chdir"), patch("os.umask"):
+                self.daemon.daemonize()
+        self.addCleanup(os.close, self.daemon._pidfd)
+
+        with open(self.pid_file) as f:
+            self.assertEqual(f.read(), str(os.getpid()))
+        self.assertEqual(self.daemon._read_pidfile(), (os.getpid(), True))
+
+    def test_daemonize_closes_inherited_descriptors(self):
+        """Test inherited descriptors are closed before the pidfile is opened."""
+        with patch("os.fork", return_value=0), patch("os.setsid"):
+            with patch("os.chdir"), patch("os.umask"):
+                with patch("os.sysconf", return_value=256):
+                    self.daemon.daemonize()
+        self.addCleanup(os.close, self.daemon._pidfd)
+
+        self.mock_closerange.assert_called_once_with(3, 256)
+        self.assertEqual([c.args[1] for c in self.mock_dup2.call_args_list], [0, 1, 2])
+        # The locked pidfile descriptor survives the closerange
+        self.assertEqual(self.daemon._read_pidfile(), (os.getpid(), True))
+
     def test_start_already_running(self):
         """Test start when daemon is already running."""
-        # Create PID file
-        with open(self.pid_file, "w") as f:
-            f.write("12345")
+        self._write_pidfile("12345", locked=True)
 
-        with patch("os.kill") as mock_kill:
+        with patch.object(self.daemon, "daemonize") as mock_daemonize:
             with patch("builtins.print") as mock_print:
                 self.daemon.start()
 
-        mock_kill.assert_called_with(12345, 0)
         mock_print.assert_called_with("Daemon already running with PID 12345")
+        mock_daemonize.assert_not_called()
+        self.mock_kill.assert_not_called()
 
     def test_start_stale_pid(self):
         """Test start with stale PID."""
-        with open(self.pid_file, "w") as f:
-            f.write("12345")
-
-        # Configure global mock_kill to raise OSError (process not found)
-        self.mock_kill.side_effect = OSError
+        # Nobody holds the lock, even though the pid may exist
+        self._write_pidfile("12345")
 
         with patch.object(self.daemon, "daemonize") as mock_daemonize:
             # Patch the class as imported in daemon module
-            with patch("pulse.daemon.Pulse") as mock_tracker:
-                self.daemon.start()
+            with patch("pulse.daemon.Pulse"):
+                with patch("builtins.print"):
+                    self.daemon.start()
 
-        # Should remove file and start
-        self.assertFalse(os.path.exists(self.pid_file))
         mock_daemonize.assert_called()
+        self.mock_kill.assert_not_called()
 
     def test_start_corrupt_pid(self):
         """Test start with corrupt PID file."""
-        with open(self.pid_file, "w") as f:
-            f.write("invalid")
+        self._write_pidfile("invalid")
 
         with patch.object(self.daemon, "daemonize") as mock_daemonize:
             with patch("pulse.daemon.Pulse"):
-                self.daemon.start()
+                with patch("builtins.print"):
+                    self.daemon.start()
 
-        self.assertFalse(os.path.exists(self.pid_file))
         mock_daemonize.assert_called()
 
     def test_status_when_not_running(self):
@@ -170,11 +210,7 @@ class TestActivityDaemon(unittest.TestCase):
 
     def test_status_running(self):
         """Test status when running."""
-        with open(self.pid_file, "w") as f:
-            f.write("12345")
-
-        # Default mock_kill does nothing (success), simulating process exists
-        self.mock_kill.side_effect = None
+        self._write_pidfile("12345", locked=True)
 
         with patch("builtins.print") as mock_print:
             self.daemon.status()
@@ -183,11 +219,7 @@ class TestActivityDaemon(unittest.TestCase):
 
     def test_status_stale(self):
         """Test status with stale PID."""
-        with open(self.pid_file, "w") as f:
-            f.write("12345")
-
-        # Simulate process not found
-        self.mock_kill.side_effect = OSError
+        self._write_pidfile("12345")
 
         with patch("builtins.print") as mock_print:
             self.daemon.status()
@@ -203,26 +235,63 @@ class TestActivityDaemon(unittest.TestCase):
 
     def test_stop_sends_sigterm(self):
         """Test that stop sends SIGTERM to running daemon."""
-        with open(self.pid_file, "w") as _:
-            _.write("12345")
-
-        self.mock_kill.side_effect = None
+        self._write_pidfile("12345", locked=True)
 
         with patch("builtins.print"):
             self.daemon.stop()
 
         self.mock_kill.assert_called_with(12345, signal.SIGTERM)
 
+    def test_stop_stale_pidfile_does_not_signal(self):
+        """Test that stop never signals a pid from an unlocked pidfile."""
+        self._write_pidfile("12345")
+
+        with patch("builtins.print") as mock_print:
+            self.daemon.stop()
+
+        mock_print.assert_called_with("Daemon not running")
+        self.mock_kill.assert_not_called()
+        self.assertFalse(os.path.exists(self.pid_file))
+
     def test_signal_handler_cleans_up(self):
         """Test that signal handler cleans up resources."""
-        self.daemon.tracker = Mock()
         with open(self.pid_file, "w") as _:
             _.write("12345")
 
         with pytest.raises(SystemExit):
             self.daemon._signal_handler(signal.SIGTERM, None)
 
+        self.assertFalse(os.path.exists(self.pid_file))
+
+    def test_signal_handler_lets_tracker_finish(self):
+        """Test a running tracker is stopped without exiting from the handler."""
+        self.daemon.tracker = Mock()
+        with open(self.pid_file, "w") as _:
+            _.write("12345")
+
+        self.daemon._signal_handler(signal.SIGTERM, None)
+
+        # start() removes the pidfile once the tracker has saved its data
         self.daemon.tracker.stop.assert_called_once()
+        self.assertTrue(os.path.exists(self.pid_file))
+
+    def test_start_removes_pidfile_after_tracker_returns(self):
+        """Test the pidfile is removed once the tracker has stopped."""
+
+        def run_tracker():
+            self.assertTrue(os.path.exists(self.pid_file))
+
+        def daemonize():
+            self._write_pidfile(str(os.getpid()))
+
+        with patch.object(self.daemon, "daemonize", side_effect=daemonize):
+            with patch("pulse.daemon.signal.signal"):
+                with patch("pulse.daemon.Pulse") as mock_tracker_cls:
+                    mock_tracker_cls.return_value.start.side_effect = run_tracker
+                    with patch("builtins.print"):
+                        self.daemon.start()
+
+        mock_tracker_cls.return_value.start.assert_called_once_with()
         self.assertFalse(os.path.exists(self.pid_file))
 
     @patch("pulse.daemon.ActivityDaemon")
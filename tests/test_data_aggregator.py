@@ -1,7 +1,10 @@
 """Tests for data_aggregator module functionality."""
 
 import json
+import os
 import tempfile
+import threading
+import time
 import unittest
 from datetime import datetime
 from pathlib import Path
@@ -37,6 +40,19 @@ class TestActivityFileParser(unittest.TestCase):
         result = self.parser.parse_filename("activity_2024-01-15_1430.json")
         self.assertIsNone(result)
 
+    def test_parse_filename_rejects_malformed_fields(self):
+        """Test names int() would accept but the file format does not."""
+        for filename in (
+            "activity_2024011+_1430.json",
+            "activity_2024 115_1430.json",
+            "activity_20240115-1430.json",
+            "activity_20240\u0661\u0661\u0665_1430.json",
+            "activity_20241315_1430.json",
+            "activity_20240115_1430.txt",
+        ):
+            with self.subTest(filename=filename):
+                self.assertIsNone(self.parser.parse_filename(filename))
+
     def test_get_hour_key(self):
         """Test getting hour key from datetime."""
         dt = datetime(2024, 1, 15, 14, 30)
@@ -91,6 +107,33 @@ class TestDataAggregator(unittest.TestCase):
         self.assertEqual(len(result["2024-01-15_14"]), 2)
         self.assertEqual(len(result["2024-01-15_15"]), 1)
 
+    def test_group_files_by_hour_reuses_listing_until_dir_changes(self):
+        """Test the directory is only rescanned after its mtime changes."""
+        data_dir = Path(self.temp_dir)
+        (data_dir / "activity_20240115_1430.json").write_text("{}")
+        # Age the directory past the grace period so its listing is cached
+        old = time.time_ns() - 10 * 10**9
+        os.utime(data_dir, ns=(old, old))
+
+        first = self.aggregator.group_files_by_hour()
+        with patch.object(Path, "glob") as mock_glob:
+            second = self.aggregator.group_files_by_hour()
+        mock_glob.assert_not_called()
+        self.assertIs(second, first)
+
+        (data_dir / "activity_20240115_1530.json").write_text("{}")
+        third = self.aggregator.group_files_by_hour()
+        self.assertEqual(set(third), {"2024-01-15_14", "2024-01-15_15"})
+
+    def test_group_files_by_hour_skips_cache_for_fresh_dir(self):
+        """Test a just-modified directory is rescanned on every call."""
+        (Path(self.temp_dir) / "activity_20240115_1430.json").write_text("{}")
+
+        self.aggregator.group_files_by_hour()
+        with patch.object(Path, "glob", return_value=[]) as mock_glob:
+            self.aggregator.group_files_by_hour()
+        mock_glob.assert_called_once()
+
     def test_aggregate_hour_data(self):
         """Test aggregating data from multiple files."""
         # Create test files
@@ -132,6 +175,54 @@ class TestDataAggregator(unittest.TestCase):
         self.assertEqual(result["applications"]["App1"], 30.0)
         self.assertEqual(result["files_processed"], 1)
 
+    def test_aggregate_hour_data_reads_files_in_parallel(self):
+        """Test minute files are loaded concurrently and merged in order."""
+        file_paths = []
+        for minute in range(4):
+            filepath = Path(self.temp_dir) / f"activity_20240115_14{minute:02d}.json"
+            with open(filepath, "w") as f:
+                json.dump({f"App{minute}": 10.0, "Shared": 1.0}, f)
+            file_paths.append(filepath)
+
+        # Every load waits until all four are running at the same time
+        barrier = threading.Barrier(4, timeout=5)
+        load_file = self.aggregator._load_file
+
+        def load(path):
+            barrier.wait()
+            return load_file(path)
+
+        with patch.object(self.aggregator, "_load_file", side_effect=load):
+            result = self.aggregator.aggregate_hour_data(file_paths)
+
+        self.assertEqual(
+            list(result["applications"]), ["App0", "Shared", "App1", "App2", "App3"]
+        )
+        self.assertEqual(result["applications"]["Shared"], 4.0)
+        self.assertEqual(result["total_time"], 44.0)
+        self.assertEqual(result["files_processed"], 4)
+
+    def test_get_all_aggregated_data_shares_one_pool(self):
+        """Test every hour's minute files are loaded through a single pool."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        for hour in range(3):
+            for minute in range(2):
+                filename = f"activity_20240115_1{hour}{minute:02d}.json"
+                with open(Path(self.temp_dir) / filename, "w") as f:
+                    json.dump({"App": 10.0}, f)
+
+        with patch(
+            "pulse.data_aggregator.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as mock_pool:
+            result = self.aggregator.get_all_aggregated_data()
+
+        mock_pool.assert_called_once()
+        self.assertEqual(len(result), 3)
+        for hour_data in result.values():
+            self.assertEqual(hour_data["applications"], {"App": 20.0})
+            self.assertEqual(hour_data["files_processed"], 2)
+
 
 class TestSyncStateManager(unittest.TestCase):
     """Test cases for SyncStateManager class."""
@@ -167,6 +258,7 @@ class TestSyncStateManager(unittest.TestCase):
         """Test saving and loading synced hours."""
         self.manager.mark_hour_synced("2024-01-15_14")
         self.manager.mark_hour_synced("2024-01-15_15")
+        self.manager.flush()
 
         # Create a new manager instance
         from pulse.data_aggregator import SyncStateManager
@@ -176,6 +268,43 @@ class TestSyncStateManager(unittest.TestCase):
         self.assertTrue(new_manager.is_hour_synced("2024-01-15_14"))
         self.assertTrue(new_manager.is_hour_synced("2024-01-15_15"))
 
+    def test_synced_hours_round_trip_without_orjson(self):
+        """Test the stdlib json fallback for the synced hours file."""
+        from pulse.data_aggregator import SyncStateManager
+
+        with patch("pulse.data_aggregator.orjson", None):
+            self.manager.mark_hour_synced("2024-01-15_14")
+            self.manager.flush()
+            reloaded = SyncStateManager(data_dir=self.temp_dir)
+
+        self.assertTrue(reloaded.is_hour_synced("2024-01-15_14"))
+
+    def test_marks_written_once_per_flush(self):
+        """Test marking hours does no I/O until flush writes them all."""
+        save = self.manager.save_synced_hours
+        with patch.object(
+            self.manager, "save_synced_hours", side_effect=save
+        ) as mock_save:
+            self.manager.mark_hour_synced("2024-01-15_14")
+            self.manager.mark_hour_synced("2024-01-15_15")
+            mock_save.assert_not_called()
+
+            self.manager.flush()
+            # A flush with nothing new marked writes nothing
+            self.manager.flush()
+
+        mock_save.assert_called_once_with()
+
+    def test_flush_replaces_file_atomically(self):
+        """Test the synced hours file is replaced without a leftover temp file."""
+        self.manager.mark_hour_synced("2024-01-15_14")
+        self.manager.flush()
+
+        self.assertEqual(
+            sorted(p.name for p in Path(self.temp_dir).iterdir()),
+            ["synced_hours.json"],
+        )
+
     def test_get_pending_hours(self):
         """Test getting pending (unsynced) hours."""
         self.manager.mark_hour_synced("2024-01-15_14")
@@ -1,6 +1,8 @@
 """Tests for detection module functionality."""
 
 import subprocess
+import sys
+import threading
 import time
 import unittest
 from unittest.mock import MagicMock, Mock, patch
@@ -34,6 +36,52 @@ class TestApplicationDetector(unittest.TestCase):
 
         self.assertEqual(result, "Safari")
 
+    @patch("pulse.detection.NSWorkspace")
+    def test_shared_workspace_fetched_once(self, mock_workspace_class):
+        """Test the workspace singleton is looked up on first use only."""
+        mock_workspace = mock_workspace_class.sharedWorkspace.return_value
+        mock_workspace.activeApplication.return_value = {"NSApplicationName": "Mail"}
+
+        self.detector.get_active_application()
+        self.detector.get_active_application()
+
+        mock_workspace_class.sharedWorkspace.assert_called_once_with()
+        self.assertEqual(mock_workspace.activeApplication.call_count, 2)
+
+    @patch("pulse.detection.NSWorkspace")
+    def test_get_active_application_records_pid(self, mock_workspace_class):
+        """Test that the active app's pid is kept for title lookups."""
+        mock_workspace = Mock()
+        mock_workspace.activeApplication.return_value = {
+            "NSApplicationName": "Safari",
+            "NSApplicationProcessIdentifier": 42,
+        }
+        mock_workspace_class.sharedWorkspace.return_value = mock_workspace
+
+        self.detector.get_active_application()
+        self.assertEqual(self.detector.active_pid, 42)
+
+        mock_workspace.activeApplication.return_value = None
+        self.detector.get_active_application()
+        self.assertIsNone(self.detector.active_pid)
+
+    @patch("pulse.detection.NSWorkspace")
+    def test_activated_app_served_without_polling(self, mock_workspace_class):
+        """Test a notified app is returned until the record is reset."""
+        mock_workspace = mock_workspace_class.sharedWorkspace.return_value
+        mock_workspace.activeApplication.return_value = {"NSApplicationName": "Mail"}
+        app = Mock()
+        app.localizedName.return_value = "Safari"
+        app.processIdentifier.return_value = 42
+
+        self.detector.set_activated_app(app)
+        self.assertEqual(self.detector.get_active_application(), "Safari")
+        self.assertEqual(self.detector.active_pid, 42)
+        mock_workspace.activeApplication.assert_not_called()
+
+        self.detector.set_activated_app(None)
+        self.assertEqual(self.detector.get_active_application(), "Mail")
+
     @patch("pulse.detection.NSWorkspace")
     def test_get_active_application_returns_none_when_no_app(
         self, mock_workspace_class
@@ -57,6 +105,55 @@ class TestApplicationDetector(unittest.TestCase):
         self.assertIsNone(result)
 
 
+class TestAppActivationObserver(unittest.TestCase):
+    """Test cases for AppActivationObserver class."""
+
+    @patch("pulse.detection.NSWorkspace")
+    def test_start_registers_and_forwards_notifications(self, mock_workspace_class):
+        """Test that activation notifications invoke the callback."""
+        from pulse.detection import AppActivationObserver
+
+        center = mock_workspace_class.sharedWorkspace.return_value.notificationCenter()
+        callback = Mock()
+        observer = AppActivationObserver(callback)
+
+        self.assertTrue(observer.start())
+        self.assertTrue(observer.start())
+
+        center.addObserverForName_object_queue_usingBlock_.assert_called_once()
+        args = center.addObserverForName_object_queue_usingBlock_.call_args[0]
+        self.assertEqual(args[0], "NSWorkspaceDidActivateApplicationNotification")
+        app = Mock()
+        args[3](Mock(userInfo=Mock(return_value={"NSWorkspaceApplicationKey": app})))
+        callback.assert_called_once_with(app)
+
+    @patch("pulse.detection.NSWorkspace")
+    def test_stop_removes_observer(self, mock_workspace_class):
+        """Test that stop unregisters the token returned on start."""
+        from pulse.detection import AppActivationObserver
+
+        center = mock_workspace_class.sharedWorkspace.return_value.notificationCenter()
+        token = center.addObserverForName_object_queue_usingBlock_.return_value
+        observer = AppActivationObserver(Mock())
+        observer.start()
+
+        observer.stop()
+        observer.stop()
+
+        center.removeObserver_.assert_called_once_with(token)
+
+    @patch("pulse.detection.NSWorkspace")
+    def test_start_reports_failure(self, mock_workspace_class):
+        """Test that start returns False when notifications are unavailable."""
+        from pulse.detection import AppActivationObserver
+
+        mock_workspace_class.sharedWorkspace.side_effect = RuntimeError("no session")
+        observer = AppActivationObserver(Mock())
+
+        with self.assertLogs("pulse.detection", level="WARNING"):
+            self.assertFalse(observer.start())
+
+
 class TestWindowTitleDetector(unittest.TestCase):
     """Test cases for WindowTitleDetector class."""
 
@@ -71,15 +168,18 @@ class TestWindowTitleDetector(unittest.TestCase):
         ):
             from pulse.detection import WindowTitleDetector
 
-            self.detector = WindowTitleDetector(cache_ttl=2.0, applescript_timeout=0.5)
+            # One-shot osascript path; the persistent helper is tested separately
+            self.detector = WindowTitleDetector(
+                cache_ttl=2.0, applescript_timeout=0.5, use_helper=False
+            )
 
     def test_initialization(self):
         """Test WindowTitleDetector initialization."""
         self.assertEqual(self.detector.cache_ttl, 2.0)
         self.assertEqual(self.detector.applescript_timeout, 0.5)
         self.assertEqual(self.detector._title_cache, {})
-        self.assertEqual(self.detector._metrics["total_calls"], 0)
-        self.assertEqual(self.detector._metrics["cache_hits"], 0)
+        self.assertEqual(self.detector._metrics.total_calls, 0)
+        self.assertEqual(self.detector._metrics.cache_hits, 0)
 
     def test_app_mapping_contains_common_apps(self):
         """Test that APP_MAPPING contains common applications."""
@@ -87,6 +187,24 @@ class TestWindowTitleDetector(unittest.TestCase):
         for app in expected_apps:
             self.assertIn(app, self.detector.APP_MAPPING)
 
+    @patch("pulse.detection.subprocess.run")
+    def test_applescript_uses_prebuilt_scripts(self, mock_run):
+        """Test every mapped app has a prebuilt script that is used as-is."""
+        mock_run.return_value = Mock(returncode=0, stdout=b"")
+
+        self.assertEqual(
+            set(self.detector.SCRIPTS), set(self.detector.APP_MAPPING.values())
+        )
+        self.detector._get_title_via_applescript("Code")
+
+        command = mock_run.call_args[0][0]
+        self.assertIs(command, self.detector.COMMANDS["Visual Studio Code"])
+        self.assertEqual(command[0], "/usr/bin/osascript")
+        script = command[2]
+        self.assertIs(script, self.detector.SCRIPTS["Visual Studio Code"])
+        self.assertIn('process "Code"', script)
+        self.assertIn('tell application "Safari"', self.detector.SCRIPTS["Safari"])
+
     def test_cache_functionality(self):
         """Test window title caching."""
         app_name = "Safari"
@@ -129,18 +247,30 @@ class TestWindowTitleDetector(unittest.TestCase):
     @patch("pulse.detection.subprocess.run")
     def test_get_title_via_applescript_returns_title(self, mock_run):
         """Test AppleScript window title detection."""
-        mock_run.return_value = Mock(returncode=0, stdout="Test Window Title\n")
+        mock_run.return_value = Mock(returncode=0, stdout=b"Test Window Title\n")
 
         result = self.detector._get_title_via_applescript("Safari")
 
         self.assertEqual(result, "Test Window Title")
 
+    @patch("pulse.detection.subprocess.run")
+    def test_get_title_via_applescript_decodes_utf8(self, mock_run):
+        """Test output is read as bytes and decoded as UTF-8 with replacement."""
+        mock_run.return_value = Mock(
+            returncode=0, stdout="caf\u00e9 \u2014 notes ".encode() + b"\xff\n"
+        )
+
+        result = self.detector._get_title_via_applescript("Safari")
+
+        self.assertEqual(result, "caf\u00e9 \u2014 notes \ufffd")
+        self.assertNotIn("text", mock_run.call_args[1])
+
     @patch("pulse.detection.subprocess.run")
     def test_applescript_timeout_setting(self, mock_run):
         """Test that AppleScript uses the configured timeout."""
         mock_result = Mock()
         mock_result.returncode = 0
-        mock_result.stdout = "Test Window\n"
+        mock_result.stdout = b"Test Window\n"
         mock_run.return_value = mock_result
 
         title = self.detector._get_title_via_applescript("Safari")
@@ -163,7 +293,7 @@ class TestWindowTitleDetector(unittest.TestCase):
     @patch("pulse.detection.subprocess.run")
     def test_get_title_via_applescript_handles_empty_output(self, mock_run):
         """Test AppleScript empty output handling."""
-        mock_run.return_value = Mock(returncode=0, stdout="")
+        mock_run.return_value = Mock(returncode=0, stdout=b"")
 
         result = self.detector._get_title_via_applescript("Safari")
 
@@ -174,7 +304,7 @@ class TestWindowTitleDetector(unittest.TestCase):
         """Test performance metrics are tracked correctly."""
         mock_result = Mock()
         mock_result.returncode = 0
-        mock_result.stdout = "Test Window\n"
+        mock_result.stdout = b"Test Window\n"
         mock_run.return_value = mock_result
 
         # Make some calls
@@ -227,7 +357,7 @@ class TestWindowTitleDetector(unittest.TestCase):
         """Test that cache hits are tracked in metrics."""
         mock_result = Mock()
         mock_result.returncode = 0
-        mock_result.stdout = "Cached Title\n"
+        mock_result.stdout = b"Cached Title\n"
         mock_run.return_value = mock_result
 
         # First call - cache miss
@@ -247,8 +377,8 @@ class TestWindowTitleDetector(unittest.TestCase):
     def test_metrics_reset(self):
         """Test metrics reset functionality."""
         # Set some metrics
-        self.detector._metrics["total_calls"] = 10
-        self.detector._metrics["cache_hits"] = 5
+        self.detector._metrics.total_calls = 10
+        self.detector._metrics.cache_hits = 5
 
         # Reset metrics
         self.detector.reset_metrics()
@@ -259,6 +389,43 @@ class TestWindowTitleDetector(unittest.TestCase):
         self.assertEqual(metrics["cache_hits"], 0)
         self.assertEqual(metrics["applescript_total_time"], 0.0)
 
+    def test_activation_drops_cached_title_without_ax(self):
+        """Test an app's cached title is refetched after it is activated."""
+        self.detector._ax_elements = None
+        self.detector._update_cache("Safari", "Old tab")
+        self.detector._update_cache("Mail", "Inbox")
+        app = Mock()
+        app.localizedName.return_value = "Safari"
+
+        self.detector.watch_app(app)
+
+        self.assertIsNone(self.detector._get_from_cache("Safari"))
+        self.assertEqual(self.detector._get_from_cache("Mail"), "Inbox")
+
+    def test_title_cache_evicts_least_recently_used_app(self):
+        """Test the title cache stays bounded, dropping the stalest app."""
+        with patch.object(self.detector, "TITLE_CACHE_SIZE", 2):
+            self.detector._update_cache("Safari", "GitHub")
+            self.detector._update_cache("Mail", "Inbox")
+            self.assertEqual(self.detector._get_from_cache("Safari"), "GitHub")
+            self.detector._update_cache("Notes", "Todo")
+
+        self.assertEqual(list(self.detector._title_cache), ["Safari", "Notes"])
+
+    def test_metrics_and_cache_entries_are_compact(self):
+        """Test metrics use slots and cache entries carry their expiry."""
+        self.assertFalse(hasattr(self.detector._metrics, "__dict__"))
+
+        with patch("pulse.detection.time.monotonic", return_value=100.0):
+            self.detector._update_cache("Safari", "GitHub")
+        self.assertEqual(self.detector._title_cache["Safari"], ("GitHub", 102.0))
+
+        with patch("pulse.detection.time.monotonic", return_value=101.9):
+            self.assertEqual(self.detector._get_from_cache("Safari"), "GitHub")
+        with patch("pulse.detection.time.monotonic", return_value=102.0):
+            self.assertIsNone(self.detector._get_from_cache("Safari"))
+        self.assertNotIn("Safari", self.detector._title_cache)
+
     @patch("pulse.detection.subprocess.run")
     @patch("pulse.detection.CGWindowListCopyWindowInfo")
     def test_vscode_special_handling(self, mock_quartz, mock_run):
@@ -280,6 +447,255 @@ class TestWindowTitleDetector(unittest.TestCase):
         title = self.detector.get_window_title("Visual Studio Code")
         self.assertEqual(title, "Editor Window")
 
+    @patch("pulse.detection.subprocess.run")
+    @patch("pulse.detection.AXUIElementCopyAttributeValue")
+    @patch("pulse.detection.AXUIElementCreateApplication")
+    def test_ax_title_used_and_element_reused(self, mock_create, mock_copy, mock_run):
+        """Test the Accessibility path answers without AppleScript."""
+        from pulse.detection import kAXErrorSuccess
+
+        window = Mock()
+        mock_copy.side_effect = lambda element, attribute, _: (
+            (kAXErrorSuccess, window)
+            if element is mock_create.return_value
+            else (kAXErrorSuccess, "README.md")
+        )
+
+        first = self.detector.get_window_title("Safari", pid=42)
+        self.detector._title_cache.clear()
+        second = self.detector.get_window_title("Safari", pid=42)
+
+        self.assertEqual(first, "README.md")
+        self.assertEqual(second, "README.md")
+        mock_create.assert_called_once_with(42)
+        mock_run.assert_not_called()
+
+    @patch("pulse.detection.subprocess.run")
+    @patch("pulse.detection.AXUIElementCopyAttributeValue")
+    @patch("pulse.detection.AXUIElementCreateApplication")
+    def test_ax_disabled_falls_back_to_applescript(
+        self, mock_create, mock_copy, mock_run
+    ):
+        """Test AX is abandoned for AppleScript when access is not granted."""
+        from pulse.detection import kAXErrorAPIDisabled
+
+        mock_copy.return_value = (kAXErrorAPIDisabled, None)
+        mock_run.return_value = Mock(returncode=0, stdout=b"GitHub\n")
+
+        with self.assertLogs("pulse.detection", level="WARNING") as logs:
+            title = self.detector.get_window_title("Safari", pid=42)
+        self.detector._title_cache.clear()
+        self.detector.get_window_title("Safari", pid=42)
+
+        self.assertEqual(title, "GitHub")
+        self.assertIn("Accessibility access disabled", logs.output[0])
+        mock_copy.assert_called_once()
+        self.assertEqual(mock_run.call_count, 2)
+
+    @patch("pulse.detection.NSWorkspace")
+    @patch("pulse.detection.subprocess.run")
+    @patch("pulse.detection.AXUIElementCopyAttributeValue")
+    @patch("pulse.detection.AXUIElementCreateApplication")
+    def test_ax_resolves_pid_by_name(
+        self, mock_create, mock_copy, mock_run, mock_workspace
+    ):
+        """Test a missing pid is looked up among the running applications."""
+        from pulse.detection import kAXErrorSuccess
+
+        safari = Mock()
+        safari.localizedName.return_value = "Safari"
+        safari.processIdentifier.return_value = 42
+        code = Mock()
+        code.localizedName.return_value = "Code"
+        code.processIdentifier.return_value = 7
+        mock_workspace.sharedWorkspace.return_value.runningApplications.return_value = [
+            safari,
+            code,
+        ]
+        mock_copy.return_value = (kAXErrorSuccess, "Title")
+
+        self.assertEqual(self.detector.get_window_title("Safari"), "Title")
+        mock_create.assert_called_once_with(42)
+        self.assertEqual(self.detector.get_window_title("Visual Studio Code"), "Title")
+        mock_create.assert_called_with(7)
+        mock_run.assert_not_called()
+
+    @patch("pulse.detection.CFRunLoopRemoveSource")
+    @patch("pulse.detection.CFRunLoopAddSource")
+    @patch("pulse.detection.AXObserverAddNotification")
+    @patch("pulse.detection.AXObserverCreate")
+    @patch("pulse.detection.AXUIElementCopyAttributeValue")
+    @patch("pulse.detection.AXUIElementCreateApplication")
+    def test_watch_app_keeps_title_current_from_notifications(
+        self,
+        mock_create,
+        mock_copy,
+        mock_observer_create,
+        mock_add,
+        mock_run_loop_add,
+        mock_run_loop_remove,
+    ):
+        """Test a watched app's title is served from AX change notifications."""
+        from pulse.detection import kAXErrorSuccess
+
+        titles = ["README.md"]
+        mock_copy.side_effect = lambda element, attribute, _: (
+            (kAXErrorSuccess, Mock())
+            if element is mock_create.return_value
+            else (kAXErrorSuccess, titles[0])
+        )
+        mock_observer_create.return_value = (kAXErrorSuccess, Mock())
+        app = Mock()
+        app.localizedName.return_value = "Code"
+        app.processIdentifier.return_value = 7
+        on_change = Mock()
+
+        self.detector.watch_app(app, on_change)
+
+        self.assertEqual(mock_add.call_count, 2)
+        mock_run_loop_add.assert_called_once()
+        with patch("pulse.detection.time.monotonic", return_value=1e12):
+            self.assertEqual(self.detector.get_window_title("Code"), "README.md")
+
+        # A title change notification refreshes the cached title
+        titles[0] = "main.py"
+        on_notification = mock_observer_create.call_args[0][1]
+        on_notification(None, None, None, None)
+        self.assertEqual(self.detector.get_window_title("Code"), "main.py")
+        self.assertEqual(on_change.call_count, 2)
+
+        self.detector.watch_app(None)
+        mock_run_loop_remove.assert_called_once()
+        self.assertNotIn("Code", self.detector._title_cache)
+
+    @patch("pulse.detection.NSWorkspace")
+    @patch("pulse.detection.subprocess.run")
+    @patch("pulse.detection.CFRunLoopRemoveSource")
+    @patch("pulse.detection.CFRunLoopAddSource")
+    @patch("pulse.detection.AXObserverAddNotification")
+    @patch("pulse.detection.AXObserverCreate")
+    @patch("pulse.detection.AXUIElementCopyAttributeValue")
+    @patch("pulse.detection.AXUIElementCreateApplication")
+    def test_notification_during_lookup_on_another_thread(
+        self,
+        mock_create,
+        mock_copy,
+        mock_observer_create,
+        mock_add,
+        mock_run_loop_add,
+        mock_run_loop_remove,
+        mock_run,
+        mock_workspace,
+    ):
+        """Test a main-thread AX notification cannot break a running lookup."""
+        from pulse.detection import kAXErrorAPIDisabled, kAXErrorSuccess
+
+        mock_copy.return_value = (kAXErrorSuccess, "README.md")
+        mock_observer_create.return_value = (kAXErrorSuccess, Mock())
+        mock_run.return_value = Mock(returncode=0, stdout=b"GitHub\n")
+        app = Mock()
+        app.localizedName.return_value = "Code"
+        app.processIdentifier.return_value = 7
+        self.detector.watch_app(app)
+
+        in_lookup = threading.Event()
+        proceed = threading.Event()
+        safari = Mock()
+        safari.localizedName.return_value = "Safari"
+        safari.processIdentifier.return_value = 42
+
+        def running_applications():
+            # Hold the tracker thread between the AX check and its use
+            in_lookup.set()
+            proceed.wait(5.0)
+            return [safari]
+
+        workspace = mock_workspace.sharedWorkspace.return_value
+        workspace.runningApplications.side_effect = running_applications
+        results = []
+        lookup = threading.Thread(
+            target=lambda: results.append(self.detector.get_window_title("Safari"))
+        )
+        lookup.start()
+        self.assertTrue(in_lookup.wait(5.0))
+
+        # Accessibility access is revoked while the lookup is in flight
+        mock_copy.return_value = (kAXErrorAPIDisabled, None)
+        with self.assertLogs("pulse.detection", level="WARNING"):
+            on_notification = mock_observer_create.call_args[0][1]
+            on_notification(None, None, None, None)
+        proceed.set()
+        lookup.join(5.0)
+
+        self.assertIsNone(self.detector._ax_elements)
+        self.assertNotIn("Code", self.detector._title_cache)
+        # The lookup falls back to AppleScript instead of raising
+        self.assertEqual(results, ["GitHub"])
+
+    @patch("pulse.detection.CGWindowListCopyWindowInfo")
+    def test_window_list_reused_within_tick(self, mock_quartz):
+        """Test one Quartz snapshot serves lookups until it expires or is reset."""
+        mock_quartz.return_value = [
+            {"kCGWindowOwnerName": "Finder", "kCGWindowName": "Downloads"},
+            {"kCGWindowOwnerName": "Preview", "kCGWindowName": "doc.pdf"},
+        ]
+
+        with patch("pulse.detection.time.monotonic", return_value=100.0):
+            self.assertEqual(self.detector._get_title_via_quartz("Finder"), "Downloads")
+            self.assertEqual(self.detector._get_title_via_quartz("Preview"), "doc.pdf")
+        self.assertEqual(mock_quartz.call_count, 1)
+
+        with patch("pulse.detection.time.monotonic", return_value=100.5):
+            self.detector._get_title_via_quartz("Finder")
+        self.assertEqual(mock_quartz.call_count, 2)
+
+        self.detector.invalidate()
+        with patch("pulse.detection.time.monotonic", return_value=100.6):
+            self.detector._get_title_via_quartz("Finder")
+        self.assertEqual(mock_quartz.call_count, 3)
+
+    @patch("pulse.detection.CGWindowListCopyWindowInfo")
+    def test_window_list_indexed_by_owner(self, mock_quartz):
+        """Test the snapshot is grouped by owner name, keeping window order."""
+        mock_quartz.return_value = [
+            {"kCGWindowOwnerName": "Finder", "kCGWindowName": ""},
+            {"kCGWindowOwnerName": "Preview", "kCGWindowName": "doc.pdf"},
+            {"kCGWindowOwnerName": "Finder", "kCGWindowName": "Downloads"},
+        ]
+
+        index = self.detector._get_window_index()
+
+        self.assertEqual(set(index), {"Finder", "Preview"})
+        self.assertEqual(len(index["Finder"]), 2)
+        self.assertEqual(self.detector._get_title_via_quartz("Finder"), "Downloads")
+        self.assertIsNone(self.detector._get_title_via_quartz("Terminal"))
+
+    @patch("pulse.detection.kCGWindowListExcludeDesktopElements", 16)
+    @patch("pulse.detection.kCGWindowListOptionOnScreenOnly", 1)
+    @patch("pulse.detection.CGWindowListCopyWindowInfo")
+    def test_window_list_excludes_desktop_elements(self, mock_quartz):
+        """Test the snapshot asks Quartz to leave out desktop elements."""
+        mock_quartz.return_value = []
+
+        self.detector._get_window_index()
+
+        self.assertEqual(mock_quartz.call_args.args[0], 1 | 16)
+
+    @patch("pulse.detection.CGWindowListCopyWindowInfo")
+    def test_vscode_exact_title_preferred_over_fallback(self, mock_quartz):
+        """Test a titled VS Code window wins over the editor-window fallback."""
+        mock_quartz.return_value = [
+            {
+                "kCGWindowOwnerName": "Code",
+                "kCGWindowName": "",
+                "kCGWindowLayer": 0,
+                "kCGWindowBounds": {"Width": 800, "Height": 600},
+            },
+            {"kCGWindowOwnerName": "Code", "kCGWindowName": "main.py"},
+        ]
+
+        self.assertEqual(self.detector._get_title_via_quartz("Code"), "main.py")
+
     def test_custom_timeout_configuration(self):
         """Test that custom timeout can be configured."""
         with patch.dict(
@@ -316,6 +732,174 @@ class TestWindowTitleDetector(unittest.TestCase):
             self.assertLess(default_detector.applescript_timeout, 2.0)
 
 
+class TestAppleScriptHelper(unittest.TestCase):
+    """Test cases for the persistent AppleScript helper process."""
+
+    # Stand-in for the osascript helper speaking the same line protocol
+    ECHO_SCRIPT = (
+        "import sys\n"
+        "for line in sys.stdin:\n"
+        "    name = line.rstrip('\\n')\n"
+        "    print('' if name == 'NoWindows' else 'Front of ' + name, flush=True)\n"
+    )
+
+    def setUp(self):
+        """Set up test fixtures."""
+        from pulse.detection import AppleScriptHelper
+
+        self.helper = AppleScriptHelper()
+        self.addCleanup(self.helper.close)
+
+    def _use_command(self, command):
+        from pulse.detection import AppleScriptHelper
+
+        patcher = patch.object(AppleScriptHelper, "COMMAND", command)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_query_reuses_one_process(self):
+        """Test that several queries are answered by the same process."""
+        self._use_command([sys.executable, "-c", self.ECHO_SCRIPT])
+
+        self.assertEqual(self.helper.query("Safari", 5.0), "Front of Safari")
+        proc = self.helper._proc
+        self.assertEqual(self.helper.query("Xcode", 5.0), "Front of Xcode")
+        self.assertIs(self.helper._proc, proc)
+
+    def test_query_returns_none_without_window(self):
+        """Test that an empty reply maps to None."""
+        self._use_command([sys.executable, "-c", self.ECHO_SCRIPT])
+
+        self.assertIsNone(self.helper.query("NoWindows", 5.0))
+
+    def test_query_timeout_restarts_helper(self):
+        """Test that a stalled helper raises TimeoutExpired and is discarded."""
+        self._use_command(
+            [
+                sys.executable,
+                "-c",
+                "import sys, time\n"
+                "sys.stdin.readline()\n"
+                "print('Ready', flush=True)\n"
+                "time.sleep(30)\n",
+            ]
+        )
+
+        self.assertEqual(self.helper.query("Safari", 5.0), "Ready")
+        with self.assertRaises(subprocess.TimeoutExpired):
+            self.helper.query("Safari", 0.05)
+        self.assertIsNone(self.helper._proc)
+
+    def test_query_waits_out_slow_startup(self):
+        """Test a helper still starting up is kept and late answers skipped."""
+        self._use_command(
+            [sys.executable, "-c", "import time; time.sleep(0.3)\n" + self.ECHO_SCRIPT]
+        )
+
+        with self.assertRaises(subprocess.TimeoutExpired):
+            self.helper.query("Safari", 0.01)
+        proc = self.helper._proc
+        self.assertIsNotNone(proc)
+
+        self.assertEqual(self.helper.query("Xcode", 5.0), "Front of Xcode")
+        self.assertIs(self.helper._proc, proc)
+
+    def test_query_returns_answer_already_buffered(self):
+        """Test two answer lines arriving in a single write are both read."""
+        self._use_command(
+            [
+                sys.executable,
+                "-c",
+                "import sys, time\n"
+                "sys.stdin.readline()\n"
+                "sys.stdout.write('Front of Safari\\nFront of Xcode\\n')\n"
+                "sys.stdout.flush()\n"
+                "time.sleep(30)\n",
+            ]
+        )
+
+        self.assertEqual(self.helper.query("Safari", 5.0), "Front of Safari")
+        # Nothing more is written to the pipe; the answer is already read
+        self.assertEqual(self.helper.query("Xcode", 1.0), "Front of Xcode")
+
+    def test_query_skips_late_answer_buffered_with_next(self):
+        """Test a late startup answer arriving with the next one is skipped."""
+        self._use_command(
+            [
+                sys.executable,
+                "-c",
+                "import sys, time\n"
+                "sys.stdin.readline()\n"
+                "time.sleep(0.3)\n"
+                "sys.stdout.write('Front of Safari\\nFront of Xcode\\n')\n"
+                "sys.stdout.flush()\n"
+                "time.sleep(30)\n",
+            ]
+        )
+
+        with self.assertRaises(subprocess.TimeoutExpired):
+            self.helper.query("Safari", 0.01)
+
+        # The late Safari answer is skipped; the Xcode answer came in the
+        # same write and nothing more is ever sent on the pipe
+        self.assertEqual(self.helper.query("Xcode", 1.0), "Front of Xcode")
+        self.assertEqual(self.helper._late_answers, 0)
+
+    def test_query_gives_up_on_helper_that_never_starts(self):
+        """Test a helper that never answers is eventually discarded."""
+        from pulse.detection import AppleScriptHelper
+
+        self._use_command([sys.executable, "-c", "import time; time.sleep(30)"])
+
+        for _ in range(AppleScriptHelper.MAX_STARTUP_TIMEOUTS):
+            with self.assertRaises(subprocess.TimeoutExpired):
+                self.helper.query("Safari", 0.01)
+            self.assertIsNotNone(self.helper._proc)
+        with self.assertRaises(subprocess.TimeoutExpired):
+            self.helper.query("Safari", 0.01)
+        self.assertIsNone(self.helper._proc)
+
+    def test_query_respawns_after_exit(self):
+        """Test that a helper that exited is replaced on the next query."""
+        self._use_command([sys.executable, "-c", "pass"])
+        self.assertIsNone(self.helper.query("Safari", 5.0))
+
+        self._use_command([sys.executable, "-c", self.ECHO_SCRIPT])
+        self.assertEqual(self.helper.query("Safari", 5.0), "Front of Safari")
+
+    def test_detector_uses_helper_with_mapped_name(self):
+        """Test the detector routes AppleScript lookups through the helper."""
+        from pulse.detection import WindowTitleDetector
+
+        detector = WindowTitleDetector()
+        detector._helper = Mock()
+        detector._helper.query.return_value = "main.py"
+
+        with patch("pulse.detection.subprocess.run") as mock_run:
+            title = detector._get_title_via_applescript("Code")
+
+        self.assertEqual(title, "main.py")
+        detector._helper.query.assert_called_once_with("Visual Studio Code", 0.5)
+        mock_run.assert_not_called()
+        self.assertEqual(detector.get_metrics()["applescript_calls"], 1)
+
+    def test_detector_falls_back_when_helper_cannot_start(self):
+        """Test one-shot osascript is used if the helper fails to spawn."""
+        from pulse.detection import WindowTitleDetector
+
+        detector = WindowTitleDetector()
+        with patch(
+            "pulse.detection.subprocess.Popen", side_effect=FileNotFoundError("nope")
+        ):
+            with patch("pulse.detection.subprocess.run") as mock_run:
+                mock_run.return_value = Mock(returncode=0, stdout=b"Title\n")
+                with self.assertLogs("pulse.detection", level="WARNING"):
+                    title = detector._get_title_via_applescript("Safari")
+
+        self.assertEqual(title, "Title")
+        self.assertIsNone(detector._helper)
+
+
 class TestIdleDetector(unittest.TestCase):
     """Test cases for IdleDetector class."""
 
@@ -347,15 +931,28 @@ class TestIdleDetector(unittest.TestCase):
 
         self.assertEqual(result, 150.5)
 
+    @patch("builtins.print")
+    @patch("pulse.detection.CGEventSourceSecondsSinceLastEventType")
+    def test_get_system_idle_time_error_is_logged(self, mock_cg_event, mock_print):
+        """Test a failed idle query is logged, not printed, and reads as active."""
+        mock_cg_event.side_effect = RuntimeError("no HID system")
+
+        with self.assertLogs("pulse.detection", level="ERROR") as logs:
+            self.assertEqual(self.detector.get_system_idle_time(), 0.0)
+
+        self.assertIn("no HID system", logs.output[0])
+        mock_print.assert_not_called()
+
     @patch("pulse.detection.CGEventSourceSecondsSinceLastEventType")
     def test_check_idle_state_becomes_idle(self, mock_cg_event):
         """Test idle state transition to idle."""
         mock_cg_event.return_value = 400  # Above 300 threshold
 
         self.detector.is_idle = False
-        changed = self.detector.check_idle_state()
+        changed, idle_time = self.detector.check_idle_state()
 
         self.assertTrue(changed)
+        self.assertEqual(idle_time, 400)
         self.assertTrue(self.detector.is_idle)
 
     @patch("pulse.detection.CGEventSourceSecondsSinceLastEventType")
@@ -364,9 +961,10 @@ class TestIdleDetector(unittest.TestCase):
         mock_cg_event.return_value = 5  # Below 300 threshold
 
         self.detector.is_idle = True
-        changed = self.detector.check_idle_state()
+        changed, idle_time = self.detector.check_idle_state()
 
         self.assertTrue(changed)
+        self.assertEqual(idle_time, 5)
         self.assertFalse(self.detector.is_idle)
 
     @patch("pulse.detection.CGEventSourceSecondsSinceLastEventType")
@@ -375,11 +973,42 @@ class TestIdleDetector(unittest.TestCase):
         mock_cg_event.return_value = 100  # Below threshold
 
         self.detector.is_idle = False
-        changed = self.detector.check_idle_state()
+        changed, idle_time = self.detector.check_idle_state()
 
         self.assertFalse(changed)
+        self.assertEqual(idle_time, 100)
         self.assertFalse(self.detector.is_idle)
 
+    @patch("pulse.detection.CGEventSourceSecondsSinceLastEventType")
+    def test_lazy_check_waits_until_threshold_reachable(self, mock_cg_event):
+        """Test lazy checks skip the query until idleness is possible."""
+        mock_cg_event.return_value = 100
+
+        with patch("pulse.detection.time.time", return_value=1000.0):
+            self.detector.check_idle_state(lazy=True)
+
+        mock_cg_event.return_value = 400
+        with patch("pulse.detection.time.time", return_value=1150.0):
+            self.assertEqual(self.detector.check_idle_state(lazy=True), (False, 0.0))
+            # Non-lazy callers still query every time
+            self.assertTrue(self.detector.check_idle_state()[0])
+        self.assertEqual(mock_cg_event.call_count, 2)
+
+    @patch("pulse.detection.CGEventSourceSecondsSinceLastEventType")
+    def test_lazy_check_queries_once_due(self, mock_cg_event):
+        """Test a lazy check queries again once the threshold is reachable."""
+        mock_cg_event.return_value = 100
+        with patch("pulse.detection.time.time", return_value=1000.0):
+            self.detector.check_idle_state(lazy=True)
+
+        mock_cg_event.return_value = 300
+        with patch("pulse.detection.time.time", return_value=1200.0):
+            changed, idle_time = self.detector.check_idle_state(lazy=True)
+
+        self.assertTrue(changed)
+        self.assertEqual(idle_time, 300)
+        self.assertTrue(self.detector.is_idle)
+
 
 class TestTitleCleaner(unittest.TestCase):
     """Test cases for TitleCleaner class."""
@@ -413,11 +1042,49 @@ class TestTitleCleaner(unittest.TestCase):
         result = self.cleaner.clean_title("Test\u00b7Title")
         self.assertEqual(result, "Test·Title")
 
+        # Several replacements applied in one title
+        result = self.cleaner.clean_title("\u201cDocs\u201d \u2713 it\u2019s \u25cf")
+        self.assertEqual(result, '"Docs" + it\'s *')
+
+    def test_translation_table_skips_identity_replacements(self):
+        """Test only characters that actually change are in the table."""
+        table = self.cleaner.UNICODE_TRANSLATION
+
+        self.assertNotIn(ord("\u2014"), table)
+        self.assertEqual(table[ord("\u201c")], '"')
+        self.assertEqual(self.cleaner.clean_title("a\u2014b\u2713"), "a\u2014b+")
+
     def test_clean_title_removes_vscode_suffix(self):
         """Test VS Code suffix removal."""
         result = self.cleaner.clean_title("main.py — Visual Studio Code")
         self.assertEqual(result, "main.py")
 
+        result = self.cleaner.clean_title("main.py - Visual Studio Code")
+        self.assertEqual(result, "main.py")
+
+    def test_clean_title_vscode_suffixes_of_any_length(self):
+        """Test each VS Code suffix is trimmed by its own length."""
+        from pulse.detection import TitleCleaner
+
+        with patch.object(
+            TitleCleaner, "VSCODE_SUFFIXES", (" — VS Code", " - Visual Studio Code")
+        ):
+            self.assertEqual(self.cleaner.clean_title("a.py — VS Code"), "a.py")
+            self.assertEqual(
+                self.cleaner.clean_title("a.py - Visual Studio Code"), "a.py"
+            )
+            self.assertEqual(self.cleaner.clean_title("VS Code"), "VS Code")
+
+    def test_clean_title_skips_normalization_for_ascii(self):
+        """Test ASCII titles bypass Unicode normalization but are still cleaned."""
+        with patch("pulse.detection._normalize") as mock_normalize:
+            result = self.cleaner.clean_title("main.py - Visual Studio Code")
+            self.assertEqual(result, "main.py")
+            mock_normalize.assert_not_called()
+
+            self.cleaner.clean_title("cafe\u0301")
+            mock_normalize.assert_called_once_with("NFC", "cafe\u0301")
+
     def test_normalize_app_name_handles_osascript(self):
         """Test normalization of app names with osascript."""
         result = self.cleaner.normalize_app_name("Safari - osascript")
@@ -1,5 +1,7 @@
 """Tests for http_sync module functionality."""
 
+import gzip
+import json
 import unittest
 from datetime import datetime
 from unittest.mock import Mock, patch
@@ -88,6 +90,20 @@ class TestSyncPayloadBuilder(unittest.TestCase):
         self.assertEqual(result["device"], "test-device")
         self.assertEqual(result["version"], "1.0")
 
+    def test_device_name_resolved_once(self):
+        """Test the hostname lookup is not repeated for every payload."""
+        hour_data = {"applications": {}, "total_time": 0, "files_processed": 0}
+
+        with patch.object(
+            self.builder.device_identifier, "get_device_name", return_value="mac"
+        ) as mock_get_name:
+            first = self.builder.create_sync_payload("2024-01-15_14", hour_data)
+            second = self.builder.create_sync_payload("2024-01-15_15", hour_data)
+
+        mock_get_name.assert_called_once_with()
+        self.assertEqual(first["device"], "mac")
+        self.assertEqual(second["device"], "mac")
+
     def test_create_sync_payload_timestamp_format(self):
         """Test that timestamp is in ISO format."""
         hour_key = "2024-01-15_14"
@@ -104,6 +120,22 @@ class TestSyncPayloadBuilder(unittest.TestCase):
         self.assertEqual(dt.year, 2024)
         self.assertEqual(dt.hour, 14)
 
+    def test_create_sync_payload_matches_strptime(self):
+        """Test hand-parsed hour keys agree with strptime."""
+        from pulse.http_sync import _hour_timestamp
+
+        for hour_key in ("2024-01-15_14", "2023-12-31_23", "2024-02-29_00"):
+            with self.subTest(hour_key=hour_key):
+                expected = datetime.strptime(hour_key, "%Y-%m-%d_%H").isoformat()
+                self.assertEqual(_hour_timestamp(hour_key), expected)
+
+    def test_create_sync_payload_rejects_malformed_hour_key(self):
+        """Test malformed hour keys raise ValueError like strptime did."""
+        for hour_key in ("2024-01-15", "2024-01-15 14", "2024-13-01_10", "x" * 13):
+            with self.subTest(hour_key=hour_key):
+                with self.assertRaises(ValueError):
+                    self.builder.create_sync_payload(hour_key, {})
+
 
 class TestHttpSyncClient(unittest.TestCase):
     """Test cases for HttpSyncClient class."""
@@ -118,7 +150,7 @@ class TestHttpSyncClient(unittest.TestCase):
         """Test HttpSyncClient initialization."""
         self.assertEqual(self.client.endpoint, "https://test.example.com/api")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_sync_hour_data_success(self, mock_post):
         """Test successful sync request."""
         mock_response = Mock()
@@ -133,7 +165,7 @@ class TestHttpSyncClient(unittest.TestCase):
         self.assertTrue(result)
         mock_post.assert_called_once()
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_sync_hour_data_failure(self, mock_post):
         """Test failed sync request."""
         mock_response = Mock()
@@ -148,7 +180,7 @@ class TestHttpSyncClient(unittest.TestCase):
 
         self.assertFalse(result)
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_sync_hour_data_network_error(self, mock_post):
         """Test network error handling."""
         mock_post.side_effect = requests.exceptions.ConnectionError("Network error")
@@ -160,7 +192,7 @@ class TestHttpSyncClient(unittest.TestCase):
 
         self.assertFalse(result)
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_sync_hour_data_timeout(self, mock_post):
         """Test timeout error handling."""
         mock_post.side_effect = requests.exceptions.Timeout("Request timed out")
@@ -172,7 +204,7 @@ class TestHttpSyncClient(unittest.TestCase):
 
         self.assertFalse(result)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_test_connection_success(self, mock_get):
         """Test successful connection test."""
         mock_response = Mock()
@@ -183,7 +215,123 @@ class TestHttpSyncClient(unittest.TestCase):
 
         self.assertTrue(result)
 
-    @patch("requests.get")
+    @patch("requests.Session.post")
+    def test_sync_hour_data_sends_json_bytes(self, mock_post):
+        """Test the payload is sent as pre-serialized UTF-8 JSON."""
+        mock_post.return_value = Mock(status_code=200)
+        hour_data = {"total_time": 60.0, "files_processed": 1, "applications": {}}
+        hour_data["applications"] = {"Caf\u00e9 - \u201cNotes\u201d": 60.0}
+
+        with patch("builtins.print"):
+            self.client.sync_hour_data("2024-01-15_14", hour_data)
+
+        kwargs = mock_post.call_args.kwargs
+        self.assertNotIn("json", kwargs)
+        self.assertIsInstance(kwargs["data"], bytes)
+        self.assertEqual(json.loads(kwargs["data"])["data"], hour_data)
+        self.assertEqual(kwargs["headers"]["Content-Type"], "application/json")
+
+    @patch("requests.Session.post")
+    def test_sync_hour_data_gzips_body_when_enabled(self, mock_post):
+        """Test compressed syncs send a gzip body with Content-Encoding."""
+        mock_post.return_value = Mock(status_code=200)
+        from pulse.http_sync import HttpSyncClient
+
+        client = HttpSyncClient("https://test.example.com/api", compress=True)
+        hour_data = {"total_time": 60.0, "files_processed": 1, "applications": {}}
+
+        with patch("builtins.print"):
+            result = client.sync_hour_data("2024-01-15_14", hour_data)
+
+        self.assertTrue(result)
+        kwargs = mock_post.call_args.kwargs
+        self.assertEqual(kwargs["headers"]["Content-Encoding"], "gzip")
+        body = json.loads(gzip.decompress(kwargs["data"]))
+        self.assertEqual(body["data"], hour_data)
+        self.assertNotIn("Content-Encoding", self.client._headers)
+
+    @patch("requests.Session.post")
+    def test_gzip_falls_back_on_unsupported_media_type(self, mock_post):
+        """Test a 415 answer resends uncompressed and disables gzip."""
+        mock_post.side_effect = [Mock(status_code=415), Mock(status_code=200)]
+        from pulse.http_sync import HttpSyncClient
+
+        client = HttpSyncClient("https://test.example.com/api", compress=True)
+        hour_data = {"total_time": 60.0, "files_processed": 1, "applications": {}}
+
+        with patch("builtins.print"):
+            result = client.sync_hour_data("2024-01-15_14", hour_data)
+
+        self.assertTrue(result)
+        self.assertFalse(client.compress)
+        retry = mock_post.call_args_list[1].kwargs
+        self.assertNotIn("Content-Encoding", retry["headers"])
+        self.assertEqual(json.loads(retry["data"])["data"], hour_data)
+
+    @patch("requests.Session.post")
+    def test_sync_reuses_one_session(self, mock_post):
+        """Test consecutive syncs go through the same pooled session."""
+        mock_post.return_value = Mock(status_code=200)
+        hour_data = {"total_time": 60.0, "files_processed": 1, "applications": {}}
+        session = self.client._session
+
+        with patch("builtins.print"):
+            self.client.sync_hour_data("2024-01-15_14", hour_data)
+            self.client.sync_hour_data("2024-01-15_15", hour_data)
+
+        self.assertIs(self.client._session, session)
+        self.assertEqual(mock_post.call_count, 2)
+        adapter = session.get_adapter("https://test.example.com/api")
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+
+    @patch("requests.Session.post")
+    def test_sync_hours_batches_payloads(self, mock_post):
+        """Test hours are posted as JSON arrays of at most BATCH_SIZE payloads."""
+        mock_post.return_value = Mock(status_code=200)
+        mock_post.return_value.json.side_effect = ValueError("no body")
+        hour_data = {"total_time": 60.0, "files_processed": 1, "applications": {}}
+        items = {f"2024-01-15_{hour:02d}": hour_data for hour in range(5)}
+
+        with patch.object(self.client, "BATCH_SIZE", 2):
+            with patch("builtins.print"):
+                results = self.client.sync_hours(items)
+
+        self.assertEqual(results, dict.fromkeys(items, True))
+        self.assertEqual(mock_post.call_count, 3)
+        bodies = [json.loads(c.kwargs["data"]) for c in mock_post.call_args_list]
+        sizes = [len(body) for body in bodies]
+        self.assertEqual(sizes, [2, 2, 1])
+        self.assertEqual(bodies[0][1]["hour"], "2024-01-15_01")
+
+    @patch("requests.Session.post")
+    def test_sync_hours_per_item_status(self, mock_post):
+        """Test a per-payload status array decides each hour's outcome."""
+        mock_post.return_value = Mock(status_code=200)
+        mock_post.return_value.json.return_value = [True, False]
+        hour_data = {"total_time": 60.0, "files_processed": 1, "applications": {}}
+
+        with patch("builtins.print"):
+            results = self.client.sync_hours(
+                {"2024-01-15_14": hour_data, "2024-01-15_15": hour_data}
+            )
+
+        self.assertEqual(results, {"2024-01-15_14": True, "2024-01-15_15": False})
+
+    @patch("requests.Session.post")
+    def test_sync_hours_failure_fails_whole_batch(self, mock_post):
+        """Test an error status marks every hour in the batch as failed."""
+        mock_post.return_value = Mock(status_code=500, text="boom")
+        hour_data = {"total_time": 60.0, "files_processed": 1, "applications": {}}
+
+        with patch("builtins.print"):
+            results = self.client.sync_hours(
+                {"2024-01-15_14": hour_data, "2024-01-15_15": hour_data}
+            )
+
+        self.assertEqual(results, {"2024-01-15_14": False, "2024-01-15_15": False})
+
+    @patch("requests.Session.get")
     def test_test_connection_failure(self, mock_get):
         """Test failed connection test."""
         mock_get.side_effect = requests.exceptions.ConnectionError("No connection")
@@ -15,7 +15,7 @@ class TestHttpSyncTimeout(unittest.TestCase):
         """Set up test fixtures."""
         self.client = HttpSyncClient(endpoint="http://test.example.com/api/data")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_sync_hour_data_uses_tuple_timeout(self, mock_post):
         """Test that sync_hour_data uses tuple timeout (connect, read)."""
         # Mock successful response
@@ -37,13 +37,13 @@ class TestHttpSyncTimeout(unittest.TestCase):
         # Verify success
         self.assertTrue(result)
 
-        # Verify that requests.post was called with tuple timeout
+        # Verify that the session's post was called with tuple timeout
         mock_post.assert_called_once()
         call_kwargs = mock_post.call_args[1]
         self.assertIn("timeout", call_kwargs)
         self.assertEqual(call_kwargs["timeout"], (5, 15))
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_test_connection_uses_tuple_timeout(self, mock_get):
         """Test that test_connection uses tuple timeout (connect, read)."""
         # Mock successful response
@@ -57,13 +57,13 @@ class TestHttpSyncTimeout(unittest.TestCase):
         # Verify success
         self.assertTrue(result)
 
-        # Verify that requests.get was called with tuple timeout
+        # Verify that the session's get was called with tuple timeout
         mock_get.assert_called_once()
         call_kwargs = mock_get.call_args[1]
         self.assertIn("timeout", call_kwargs)
         self.assertEqual(call_kwargs["timeout"], (3, 10))
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_sync_handles_connect_timeout(self, mock_post):
         """Test that sync properly handles connection timeout."""
         # Mock connection timeout
@@ -82,7 +82,7 @@ class TestHttpSyncTimeout(unittest.TestCase):
         # Verify failure is handled
         self.assertFalse(result)
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_sync_handles_read_timeout(self, mock_post):
         """Test that sync properly handles read timeout."""
         # Mock read timeout
@@ -101,7 +101,7 @@ class TestHttpSyncTimeout(unittest.TestCase):
         # Verify failure is handled
         self.assertFalse(result)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_connection_test_handles_timeout(self, mock_get):
         """Test that test_connection handles timeout gracefully."""
         # Mock timeout
@@ -84,6 +84,7 @@ class TestPulseMenuBarDelegate(unittest.TestCase):
 
         # Mock items for testing actions
         self.delegate.status_item = MagicMock()
+        self.delegate._last_icon = None  # Nothing drawn on the new button yet
         self.delegate.status_menu_item = MagicMock()
         self.delegate.toggle_item = MagicMock()
         self.delegate.verbose_item = MagicMock()
@@ -115,6 +116,23 @@ class TestPulseMenuBarDelegate(unittest.TestCase):
         self.delegate.update_icon()
         self.delegate.status_item.button().setTitle_.assert_called_with("○")
 
+    def test_update_icon_skips_unchanged_glyph(self):
+        """Test the icon is only redrawn when the glyph changes."""
+        button = self.delegate.status_item.button()
+        self.delegate.is_running = True
+
+        self.delegate.update_icon()
+        self.delegate.update_icon()
+
+        button.setTitle_.assert_called_once_with("●")
+        button.setNeedsDisplay_.assert_called_once_with(True)
+        button.display.assert_called_once_with()
+
+        self.delegate.is_running = False
+        self.delegate.update_icon()
+        button.setTitle_.assert_called_with("○")
+        self.assertEqual(button.display.call_count, 2)
+
     def test_update_status_running(self):
         """Test update status when running."""
         self.delegate.is_running = True
@@ -158,6 +176,46 @@ class TestPulseMenuBarDelegate(unittest.TestCase):
         self.delegate.toggleTracking_(None)
         self.assertFalse(self.delegate.is_running)
 
+    def test_init_schedules_no_status_timer(self):
+        """Test the menu is refreshed by actions, not a polling timer."""
+        ns_timer = sys.modules["Foundation"].NSTimer
+        ns_timer.reset_mock()
+
+        PulseMenuBarDelegate.alloc().init()
+
+        self.assertEqual(ns_timer.mock_calls, [])
+
+    def test_toggle_tracking_updates_menu(self):
+        """Test starting and stopping tracking refreshes the menu titles."""
+        with patch("pulse.menu_bar.Pulse"):
+            with patch("threading.Thread"):
+                with patch("builtins.print"):
+                    self.delegate.toggleTracking_(None)
+
+        self.delegate.toggle_item.setTitle_.assert_called_with("Stop Tracking")
+        self.delegate.status_item.button().setTitle_.assert_called_with("●")
+
+        with patch("builtins.print"):
+            self.delegate.toggleTracking_(None)
+
+        self.delegate.status_menu_item.setTitle_.assert_called_with("Status: Stopped")
+        self.delegate.toggle_item.setTitle_.assert_called_with("Start Tracking")
+
+    def test_toggle_modes_update_menu_when_stopped(self):
+        """Test mode toggles refresh their titles without a running tracker."""
+        self.delegate.is_running = False
+        self.delegate.verbose_mode = True
+        self.delegate.fast_mode = False
+
+        with patch("builtins.print"):
+            self.delegate.toggleVerbose_(None)
+            self.delegate.toggleFastMode_(None)
+
+        self.delegate.verbose_item.setTitle_.assert_called_with(
+            "Enable Verbose Logging"
+        )
+        self.delegate.fast_mode_item.setTitle_.assert_called_with("Disable Fast Mode")
+
     def test_start_tracking_already_running(self):
         """Test start tracking when already running."""
         self.delegate.is_running = True
@@ -175,8 +233,7 @@ class TestPulseMenuBarDelegate(unittest.TestCase):
 
         mock_print.assert_not_called()
 
-    @patch("time.sleep")
-    def test_toggle_verbose(self, mock_sleep):
+    def test_toggle_verbose(self):
         """Test toggle verbose mode."""
         # Toggle on -> off
         self.delegate.verbose_mode = True
@@ -193,8 +250,7 @@ class TestPulseMenuBarDelegate(unittest.TestCase):
         old_tracker.stop.assert_called()
         mock_tracker_cls.assert_called()  # New tracker created
 
-    @patch("time.sleep")
-    def test_toggle_fast_mode(self, mock_sleep):
+    def test_toggle_fast_mode(self):
         """Test toggle fast mode."""
         self.delegate.fast_mode = False
         self.delegate.is_running = True
@@ -208,26 +264,111 @@ class TestPulseMenuBarDelegate(unittest.TestCase):
         self.assertTrue(self.delegate.fast_mode)
         old_tracker.stop.assert_called()
 
-    @patch("pulse.menu_bar.subprocess.run")
-    def test_open_data_folder(self, mock_run):
-        """Test open data folder."""
+    def test_restart_waits_for_old_tracker_off_main_thread(self):
+        """Test a mode toggle restarts only after the old thread has exited."""
+        old_thread = MagicMock()
+        self.delegate.tracker_thread = old_thread
+        self.delegate.is_running = True
+        performed = []
+        self.delegate.performSelectorOnMainThread_withObject_waitUntilDone_ = (
+            lambda selector, obj, wait: performed.append(selector)
+        )
+
+        with patch("pulse.menu_bar.threading.Thread") as mock_thread:
+            with patch("builtins.print"):
+                self.delegate.toggleVerbose_(None)
+
+        # Stopped right away; the join runs on a helper thread
+        self.assertFalse(self.delegate.is_running)
+        old_thread.join.assert_not_called()
+        wait_then_restart = mock_thread.call_args.kwargs["target"]
+        wait_then_restart()
+        old_thread.join.assert_called_once_with()
+        self.assertEqual(performed, ["restartTracking:"])
+
+        with patch("pulse.menu_bar.Pulse") as mock_tracker_cls:
+            with patch("pulse.menu_bar.threading.Thread"):
+                with patch("builtins.print"):
+                    self.delegate.restartTracking_(None)
+        mock_tracker_cls.assert_called_once()
+        self.assertTrue(self.delegate.is_running)
+
+    def test_toggle_during_restart_decides_whether_to_start(self):
+        """Test Start/Stop while a restart is pending never runs two trackers."""
+        self.delegate.tracker = MagicMock()
+        self.delegate.tracker_thread = MagicMock()
+        self.delegate.is_running = True
+        self.delegate.performSelectorOnMainThread_withObject_waitUntilDone_ = (
+            MagicMock()
+        )
+
+        with patch("pulse.menu_bar.Pulse") as mock_tracker_cls:
+            with patch("pulse.menu_bar.threading.Thread"):
+                with patch("builtins.print"):
+                    self.delegate.toggleVerbose_(None)
+                    # Still shown as running while the old tracker exits
+                    self.delegate.status_menu_item.setTitle_.assert_called_with(
+                        "Status: Running"
+                    )
+
+                    # Stop, then Start again, then Stop: nothing starts yet
+                    for _ in range(3):
+                        self.delegate.toggleTracking_(None)
+                    mock_tracker_cls.assert_not_called()
+                    self.delegate.status_menu_item.setTitle_.assert_called_with(
+                        "Status: Stopped"
+                    )
+
+                    # The user's last choice was Stop
+                    self.delegate.restartTracking_(None)
+
+        mock_tracker_cls.assert_not_called()
+        self.assertFalse(self.delegate.is_running)
+        self.assertFalse(self.delegate._restart_pending)
+
+    @patch("pulse.menu_bar.get_data_directory", return_value="/tmp/pulse-data")
+    @patch("pulse.menu_bar.NSURL")
+    @patch("pulse.menu_bar.NSWorkspace")
+    def test_open_data_folder(self, mock_workspace, mock_url, mock_get_dir):
+        """Test open data folder goes through NSWorkspace, not a subprocess."""
         self.delegate.openDataFolder_(None)
-        mock_run.assert_called()
-        args = mock_run.call_args[0][0]
-        self.assertEqual(args[0], "/usr/bin/open")
+
+        mock_url.fileURLWithPath_.assert_called_once_with("/tmp/pulse-data")
+        mock_workspace.sharedWorkspace().openURL_.assert_called_once_with(
+            mock_url.fileURLWithPath_.return_value
+        )
 
     def test_quit_app(self):
         """Test quit app."""
         self.delegate.is_running = True
         self.delegate.tracker = MagicMock()
+        self.delegate.tracker_thread = MagicMock()
 
         with patch("AppKit.NSApplication") as mock_app:
             self.delegate.quitApp_(None)
 
         self.delegate.tracker.stop.assert_called()
+        # The tracker drains its queued saves before the app terminates
+        self.delegate.tracker_thread.join.assert_called_once_with()
         # terminate_ called on sharedApplication
         # NSApplication.sharedApplication().terminate_(None)
 
+    def _sync_inline(self):
+        """Run the background sync synchronously, delivering to syncFinished_."""
+        delegate = self.delegate
+
+        def run_thread(target, daemon):
+            thread = MagicMock()
+            thread.start.side_effect = target
+            return thread
+
+        def perform(selector, outcome, wait):
+            self.assertEqual(selector, "syncFinished:")
+            delegate.syncFinished_(outcome)
+
+        delegate.performSelectorOnMainThread_withObject_waitUntilDone_ = perform
+        return patch("pulse.menu_bar.threading.Thread", side_effect=run_thread)
+
     @patch("pulse.menu_bar.NSAlert")
     def test_sync_data_success(self, mock_alert_cls):
         """Test sync data success."""
@@ -241,7 +382,8 @@ class TestPulseMenuBarDelegate(unittest.TestCase):
             "skipped": 0,
         }
 
-        self.delegate.syncData_(None)
+        with self._sync_inline(), patch("builtins.print"):
+            self.delegate.syncData_(None)
 
         self.delegate.sync_manager.sync_all.assert_called()
         # Verify success message
@@ -260,7 +402,8 @@ class TestPulseMenuBarDelegate(unittest.TestCase):
             "skipped": 0,
         }
 
-        self.delegate.syncData_(None)
+        with self._sync_inline(), patch("builtins.print"):
+            self.delegate.syncData_(None)
         mock_alert.runModal.assert_called()
 
     @patch("pulse.menu_bar.NSAlert")
@@ -270,9 +413,27 @@ class TestPulseMenuBarDelegate(unittest.TestCase):
         mock_alert_cls.alloc.return_value.init.return_value = mock_alert
         self.delegate.sync_manager.sync_all.side_effect = Exception("Sync failed")
 
-        self.delegate.syncData_(None)
+        with self._sync_inline(), patch("builtins.print"):
+            self.delegate.syncData_(None)
         mock_alert.runModal.assert_called()
 
+    @patch("pulse.menu_bar.NSAlert")
+    def test_sync_data_runs_off_main_thread(self, mock_alert_cls):
+        """Test syncData_ returns before the sync runs on a worker thread."""
+        with patch("pulse.menu_bar.threading.Thread") as mock_thread:
+            self.delegate.syncData_(None)
+
+        self.delegate.sync_manager.sync_all.assert_not_called()
+        mock_thread.assert_called_once_with(target=self.delegate.run_sync, daemon=True)
+        mock_thread.return_value.start.assert_called_once_with()
+
+        # A second click while the sync is running starts nothing new
+        mock_thread.return_value.is_alive.return_value = True
+        with patch("pulse.menu_bar.threading.Thread") as second_thread:
+            with patch("builtins.print"):
+                self.delegate.syncData_(None)
+        second_thread.assert_not_called()
+
     @patch("pulse.menu_bar.NSAlert")
     def test_show_sync_status(self, mock_alert_cls):
         """Test show sync status."""
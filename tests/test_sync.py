@@ -2,6 +2,7 @@
 
 import sys
 import tempfile
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -126,23 +127,20 @@ class TestSyncManager(unittest.TestCase):
 
         self.sync_manager.sync_state.is_hour_synced.side_effect = is_synced
 
-        # Mock sync_hour explicitly to control outcome for h2 and h3
-        # Since sync_all calls sync_hour, we can patch sync_hour on the instance
-        # OR rely on mocking http_client.
-        # But sync_hour logic is inside SyncManager.
-        # Let's mock sync_hour method for isolation of sync_all logic
-        with patch.object(self.sync_manager, "sync_hour") as mock_sync_hour:
-            mock_sync_hour.side_effect = [
-                True,
-                False,
-            ]  # For h2, h3 (h1 is skipped before call)
+        # Hours are uploaded concurrently, so decide the outcome by hour
+        self.sync_manager.http_client.sync_hour_data.side_effect = (
+            lambda hour_key, hour_data: hour_key == "h2"
+        )
 
-            with patch("builtins.print"):
-                result = self.sync_manager.sync_all()
+        with patch("builtins.print"):
+            result = self.sync_manager.sync_all()
 
         self.assertEqual(result["skipped"], 1)  # h1
         self.assertEqual(result["synced"], 1)  # h2
         self.assertEqual(result["failed"], 1)  # h3
+        self.sync_manager.sync_state.mark_hour_synced.assert_called_once_with("h2")
+        # Sync state is written once for the whole run
+        self.sync_manager.sync_state.flush.assert_called_once_with()
 
     def test_sync_all_max_hours(self):
         """Test sync_all with max_hours limit."""
@@ -152,13 +150,61 @@ class TestSyncManager(unittest.TestCase):
         # Ensure items are not considered already synced
         self.sync_manager.sync_state.is_hour_synced.return_value = False
 
-        # Mock sync_hour to always succeed
-        with patch.object(self.sync_manager, "sync_hour", return_value=True):
-            with patch("builtins.print"):
-                result = self.sync_manager.sync_all(max_hours=2)
+        self.sync_manager.http_client.sync_hour_data.return_value = True
+
+        with patch("builtins.print"):
+            result = self.sync_manager.sync_all(max_hours=2)
 
         # Should process last 2 hours (h2, h3)
         self.assertEqual(result["synced"], 2)
+        synced = {
+            c.args[0]
+            for c in self.sync_manager.sync_state.mark_hour_synced.call_args_list
+        }
+        self.assertEqual(synced, {"h2", "h3"})
+
+    def test_sync_all_uploads_hours_concurrently(self):
+        """Test several hours are in flight at once."""
+        files = {f"h{i}": [f"f{i}"] for i in range(4)}
+        self.sync_manager.data_aggregator.group_files_by_hour.return_value = files
+        self.sync_manager.sync_state.is_hour_synced.return_value = False
+        # Every upload waits until all four are running at the same time
+        barrier = threading.Barrier(4, timeout=5)
+
+        def upload(hour_key, hour_data):
+            barrier.wait()
+            return True
+
+        self.sync_manager.http_client.sync_hour_data.side_effect = upload
+
+        with patch("builtins.print"):
+            result = self.sync_manager.sync_all()
+
+        self.assertEqual(result["synced"], 4)
+
+    def test_sync_all_batch_sends_pending_hours_together(self):
+        """Test batch mode syncs all pending hours through one client call."""
+        files = {"h1": ["f1"], "h2": ["f2"], "h3": ["f3"]}
+        self.sync_manager.data_aggregator.group_files_by_hour.return_value = files
+        self.sync_manager.data_aggregator.aggregate_hour_data.side_effect = (
+            lambda paths, executor: {"files": paths}
+        )
+        self.sync_manager.sync_state.is_hour_synced.side_effect = lambda h: h == "h1"
+        self.sync_manager.http_client.sync_hours.return_value = {
+            "h2": True,
+            "h3": False,
+        }
+        self.sync_manager.batch = True
+
+        with patch("builtins.print"):
+            result = self.sync_manager.sync_all()
+
+        self.sync_manager.http_client.sync_hours.assert_called_once_with(
+            {"h2": {"files": ["f2"]}, "h3": {"files": ["f3"]}}
+        )
+        self.sync_manager.http_client.sync_hour_data.assert_not_called()
+        self.sync_manager.sync_state.mark_hour_synced.assert_called_once_with("h2")
+        self.assertEqual(result, {"synced": 1, "failed": 1, "skipped": 1})
 
     def test_get_sync_status(self):
         """Test get_sync_status."""